@@ -98,7 +98,8 @@ from .functions import (CF,
                         ATOL,
                         RTOL)
 
-from .constructs import Constructs
+from .constructs      import Constructs
+from .constructsquery import ConstructsQuery
 
 from .data import (Data,
                    Array,
@@ -108,7 +109,8 @@ from .data import (Data,
                    GatheredArray,
                    RaggedContiguousArray,
                    RaggedIndexedArray,
-                   RaggedIndexedContiguousArray)
+                   RaggedIndexedContiguousArray,
+                   ViewArray)
 
 from .count         import Count
 from .index         import Index
@@ -134,6 +136,7 @@ from .fieldancillary      import FieldAncillary
 
 from .read_write import (read,
                          write,
+                         write_files,
                          implementation,
                          CFDMImplementation)
 
@@ -36,6 +36,8 @@ The netCDF variable name of the bounds may be accessed with the
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
     def __init__(self, properties=None, data=None, source=None,
                  copy=True, _use_data=True):
         '''**Initialization**
@@ -129,6 +129,24 @@ components, and provides selected values of all data arrays.
                              _axes=_axes, _axis_names=_axis_names)
     #--- End: def
 
+    def _fingerprint_components(self):
+        '''Return the components that define the fingerprint.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `fingerprint`
+
+:Returns:
+
+    `list`
+        The components.
+
+        '''
+        out = super()._fingerprint_components()
+        out.append(self.get_measure(None))
+        return out
+    #--- End: def
+
     def equals(self, other, rtol=None, atol=None, verbose=False,
                ignore_data_type=False, ignore_fill_value=False,
                ignore_properties=(), ignore_compression=False,
@@ -27,6 +27,8 @@ or the fact that the method was applied only over El Nino years).
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
     def __str__(self):
         '''Called by the `str` built-in function.
 
@@ -289,6 +291,27 @@ which it applies.
 #        return out
 #    #--- End: def
 
+    def _fingerprint_components(self):
+        '''Return the components that define the fingerprint.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `fingerprint`
+
+:Returns:
+
+    `list`
+        The components.
+
+        '''
+        out = super()._fingerprint_components()
+        out.extend((self.get_method(None),
+                    self.get_axes(None),
+                    sorted([(name, self._fingerprint_value(value))
+                            for name, value in self.qualifiers().items()])))
+        return out
+    #--- End: def
+
     def equals(self, other, rtol=None, atol=None, verbose=False,
                ignore_qualifiers=(), ignore_type=False):
         '''Whether two cell method constructs are the same.
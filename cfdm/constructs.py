@@ -7,6 +7,8 @@ from copy import deepcopy
 
 from . import core
 
+from .constructsquery import ConstructsQuery
+
 
 class Constructs(core.Constructs):
     '''A container for metadata constructs.
@@ -149,23 +151,107 @@ instances are equal.
                     'field_ancillary'     : {}}}
 
         '''
+        ignore = self._ignore
+        construct_types = [construct_type
+                           for construct_type in self._array_constructs
+                           if construct_type not in ignore]
+        construct_type = self._construct_type
+        constructs = self._constructs
+        
         out = {}
+        for axes, keys in self._axes_constructs.items():
+            d = None
+            for cid in keys:
+                ctype = construct_type[cid]
+                if ctype in ignore:
+                    continue
 
+                if d is None:
+                    d = {x: {} for x in construct_types}
+                    out[axes] = d
 
-        data_axes = self.data_axes()
-        
-        for axes in data_axes.values():
-            d = {construct_type: {}
-                 for construct_type in self._array_constructs
-                 if construct_type not in self._ignore}
-
-            out[axes] = d
+                d[ctype][cid] = constructs[ctype][cid]
         #--- End: for
 
-        for cid, construct in self.filter_by_data().items():
-            axes = data_axes.get(cid)
-            construct_type = self._construct_type[cid]
-            out[axes][construct_type][cid] = construct
+        return out
+    #--- End: def
+
+    def _equals_signatures(self, axes_to_constructs,
+                           ignore_data_type=False,
+                           ignore_fill_value=False):
+        '''Find cheap signatures of metadata constructs for testing equality.
+
+Two constructs with different signatures can not be equal, so only
+constructs with the same signature need to have their data compared.
+
+A signature comprises the construct's property names; the values of
+its "standard_name", "units" and "calendar" properties; and the shape
+and data type of its data.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `equals`
+
+:Parameters:
+
+    axes_to_constructs: `dict`
+        The constructs, as returned by `_axes_to_constructs`.
+
+    ignore_data_type: `bool`, optional
+        If True then exclude the data type from the signatures.
+
+    ignore_fill_value: `bool`, optional
+        If True then exclude the "_FillValue" and "missing_value"
+        properties from the signatures.
+
+:Returns:
+
+    `dict`
+        The signature of each construct, keyed by construct key.
+
+**Examples:**
+
+>>> c._equals_signatures(c._axes_to_constructs())['dimensioncoordinate1']
+(('standard_name', 'units'), 'grid_latitude', 'degrees', None, (10,), dtype('float64'))
+
+        '''
+        if ignore_fill_value:
+            ignore = ('_FillValue', 'missing_value')
+        else:
+            ignore = ()
+
+        out = {}
+        for constructs in axes_to_constructs.values():
+            for role_constructs in constructs.values():
+                for cid, construct in role_constructs.items():
+                    properties = construct.properties()
+                    signature = [tuple(sorted([prop for prop in properties
+                                               if prop not in ignore]))]
+                    
+                    for prop in ('standard_name', 'units', 'calendar'):
+                        value = properties.get(prop)
+                        if (value is not None and
+                            not isinstance(value, basestring)):
+                            # Non-string values are compared with
+                            # the data
+                            value = True
+
+                        signature.append(value)
+                    #--- End: for
+
+                    data = construct.get_data(None)
+                    if data is None:
+                        signature.extend((None, None))
+                    else:
+                        signature.append(data.shape)
+                        if ignore_data_type:
+                            signature.append(None)
+                        else:
+                            signature.append(data.dtype)
+                    #--- End: if
+
+                    out[cid] = tuple(signature)
+        #--- End: for
 
         return out
     #--- End: def
@@ -348,6 +434,532 @@ instances are equal.
     # ----------------------------------------------------------------
     # Methods
     # ----------------------------------------------------------------
+    def _identities_index(self):
+        '''Return the cached identities of the metadata constructs.
+
+The identities are created the first time that they are needed, and
+are cached until the metadata constructs themselves have
+changed. Whenever the identities of any container might have changed,
+only the constructs whose `!_identities_stamp` has changed have their
+identities found again.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `filter_by_identity`
+
+:Returns:
+
+    `tuple`
+        A dictionary mapping each construct key to its identities
+        (including its construct key identity), and a dictionary
+        mapping each identity to the keys of the constructs that have
+        that identity.
+
+**Examples:**
+
+>>> identities, index = c._identities_index()
+>>> identities['dimensioncoordinate0']
+['latitude', 'units=degrees_north', 'standard_name=latitude',
+ 'ncvar%lat', 'key%dimensioncoordinate0']
+>>> index['latitude']
+['dimensioncoordinate0']
+
+        '''
+        identities_version = core.abstract.Container._identities_version
+
+        cache = getattr(self, '_identities_cache', None)
+        if cache is not None and cache[0] == self._version[0]:
+            if cache[1] == identities_version:
+                return cache[3], cache[4]
+
+            # Find again the identities of the constructs which might
+            # have changed
+            _, _, stamps, identities, index = cache
+            for cid, (construct, stamp) in stamps.items():
+                new_stamp = construct._identities_stamp()
+                if new_stamp == stamp:
+                    continue
+
+                for identity in identities[cid]:
+                    keys = index[identity]
+                    keys.remove(cid)
+                    if not keys:
+                        del index[identity]
+                #--- End: for
+
+                x = construct.identities()
+                x.append('key%'+cid)
+                identities[cid] = x
+                for identity in x:
+                    index.setdefault(identity, []).append(cid)
+
+                stamps[cid] = (construct, new_stamp)
+            #--- End: for
+
+            self._identities_cache = (self._version[0], identities_version,
+                                      stamps, identities, index)
+            return identities, index
+        #--- End: if
+
+        stamps = {}
+        identities = {}
+        index = {}
+        for cid, construct in self._dictionary().items():
+            stamps[cid] = (construct, construct._identities_stamp())
+            x = construct.identities()
+            x.append('key%'+cid)
+            identities[cid] = x
+            for identity in x:
+                index.setdefault(identity, []).append(cid)
+        #--- End: for
+
+        self._identities_cache = (self._version[0], identities_version,
+                                  stamps, identities, index)
+
+        return identities, index
+    #--- End: def
+    
+    def _apply_filters(self, filters, _source=None):
+        '''Apply filters to the metadata constructs in a single pass.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `filters_applied`, `query`, `unfilter`
+
+:Parameters:
+
+    filters: `tuple` of `dict`
+        The filters to apply, in the same form as the elements of the
+        `filters_applied` history. For example, ``({'filter_by_type':
+        ('dimension_coordinate',)}, {'filter_by_property': ((),
+        {'units': 'degrees'})})``.
+
+    _source: `Constructs`, optional
+        A shallow copy of the constructs, which is used to create the
+        prefiltered constructs when they are required by
+        `unfilter`. By default a new shallow copy is made.
+
+:Returns:
+
+    `Constructs`
+        The selected constructs and their construct keys.
+
+**Examples:**
+
+>>> d = c._apply_filters(({'filter_by_type': ('cell_method',)},
+...                       {'filter_by_method': ('mean',)}))
+
+        '''
+        # Construct types are filtered by ignoring the other types,
+        # and all other filters by testing each construct in turn.
+        ignore = None
+        predicates = []
+        for f in filters:
+            for name, value in f.items():
+                if name == 'filter_by_type':
+                    if value:
+                        if ignore is None:
+                            ignore = set(self._ignore)
+
+                        ignore.update(set(self._key_base).difference(value))
+                    #--- End: if
+                    continue
+                
+                predicate = getattr(self, '_' + name)(*value)
+                if predicate is not None:
+                    predicates.append(predicate)
+        #--- End: for
+
+        if _source is None:
+            _source = self.shallow_copy()
+
+        if ignore is not None:
+            ignore = tuple(ignore)
+
+        out = core.Constructs.shallow_copy(self, _ignore=ignore)
+
+        # The prefiltered constructs are only created when needed
+        out._prefiltered = None
+        out._lazy_prefiltered = (_source, tuple(filters[:-1]))
+        out._filters_applied = self.filters_applied() + tuple(filters)
+
+        if predicates:
+            for cid, construct in tuple(out.items()):
+                for predicate in predicates:
+                    if not predicate(cid, construct):
+                        out._pop(cid)
+                        break
+        #--- End: if
+                
+        return out
+    #--- End: def
+
+    def _get_prefiltered(self):
+        '''Return the constructs that existed prior to the last filter.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `unfilter`
+
+:Returns:
+
+    `Constructs` or `None`
+        The prefiltered constructs, or `None` if no filters have been
+        applied.
+
+**Examples:**
+
+>>> d = c.filter_by_type('dimension_coordinate')
+>>> d._get_prefiltered().equals(c)
+True
+
+        '''
+        prefiltered = getattr(self, '_prefiltered', None)
+        if prefiltered is not None:
+            return prefiltered
+
+        lazy = getattr(self, '_lazy_prefiltered', None)
+        if lazy is None:
+            return None
+
+        source, filters = lazy
+        if filters:
+            prefiltered = source._apply_filters(filters, _source=source)
+        else:
+            prefiltered = source
+
+        self._prefiltered = prefiltered
+        self._lazy_prefiltered = None
+        
+        return prefiltered
+    #--- End: def
+
+    def _filter_by_axis(self, mode=(), axes={}):
+        '''Return a test for `filter_by_axis`.
+
+.. versionadded:: 1.7.3
+
+        '''
+        _and      = False
+        _or       = False
+        _exact    = False
+        _subset   = False
+        _superset = False
+        if mode:
+            if len(mode) > 1:
+                raise ValueError("Can provide at most one mode value")
+            
+            mode = mode[0]
+            if mode == 'or':
+                _or = True
+            elif mode == 'and':
+                _and = True
+            elif mode == 'exact':
+                _exact = True
+            elif mode == 'subset':
+                _subset = True
+            elif mode == 'superset':
+                _superset = True
+            else:
+                raise ValueError(
+                    "mode, if provided, must be one of 'and', 'or', 'exact', subset', 'superset'")
+        else:
+            # By default, mode is 'and'
+            _and = True
+            
+        # Constructs are only ever tested if they are not being
+        # ignored, so their data axes may be found directly
+        constructs_data_axes = self._construct_axes
+
+        if _exact or _subset or _superset:
+            axes_True = {axis: value for axis, value in axes.items() if value}
+            if _exact and not axes_True:
+                _exact = False
+                _and   = True
+        #--- End: if
+
+        # In 'and' mode, a construct can only be selected if it spans
+        # every required axis, so find the candidates from the index
+        # of data axes
+        candidates = None
+        if _and:
+            for axis, value in axes.items():
+                if value:
+                    spanning = self._axis_constructs.get(axis, ())
+                    if candidates is None:
+                        candidates = set(spanning)
+                    else:
+                        candidates.intersection_update(spanning)
+        #--- End: if
+
+        def predicate(cid, construct):
+            if candidates is not None and cid not in candidates:
+                return False
+            
+            x = constructs_data_axes.get(cid)
+            if x is None:
+                # This construct does not have data axes
+                return False
+
+            ok = True
+            if _exact:
+                if set(x) != set(axes_True):
+                    ok = False
+            elif _subset:
+                if not set(axes_True).issubset(x):
+                    ok = False
+            elif _superset:
+                if not set(axes_True).issuperset(x):
+                    ok = False
+            else:
+                for axis_key, value in axes.items():
+                    if value:
+                        ok = axis_key in x
+                    else:
+                        ok = axis_key not in x
+                
+                    if _or:
+                        if ok:
+                            break
+                    elif not ok:
+                        break
+            #--- End: if
+
+            return ok
+        #--- End: def
+
+        return predicate
+    #--- End: def
+
+    def _filter_by_data(self):
+        '''Return a test for `filter_by_data`.
+
+.. versionadded:: 1.7.3
+
+        '''
+        construct_type = self._construct_type
+        array_constructs = self._array_constructs
+        
+        def predicate(cid, construct):
+            return construct_type[cid] in array_constructs
+
+        return predicate
+    #--- End: def
+
+    def _filter_by_identity(self, *identities):
+        '''Return a test for `filter_by_identity`.
+
+.. versionadded:: 1.7.3
+
+        '''
+        # Select all constructs if no identities have been provided
+        if not identities:
+            return
+        
+        construct_identities, index = self._identities_index()
+
+        keys = set()
+        for value0 in identities:
+            if isinstance(value0, basestring):
+                # Look up the identity in the index
+                keys.update(index.get(value0, ()))
+                continue
+
+            # Match the identity against the cached identities of
+            # each construct
+            for cid, values1 in construct_identities.items():
+                if cid in keys:
+                    continue
+
+                construct = self[cid]
+                for value1 in values1:
+                    if self._matching_values(value0, construct, value1):
+                        keys.add(cid)
+                        break
+                #--- End: for
+            #--- End: for
+        #--- End: for
+
+        def predicate(cid, construct):
+            return cid in keys
+
+        return predicate
+    #--- End: def
+
+    def _filter_by_key(self, *keys):
+        '''Return a test for `filter_by_key`.
+
+.. versionadded:: 1.7.3
+
+        '''
+        # Select all constructs if no keys have been provided
+        if not keys:
+            return
+
+        def predicate(cid, construct):
+            return cid in keys
+
+        return predicate
+    #--- End: def
+
+    def _filter_by_measure(self, *measures):
+        '''Return a test for `filter_by_measure`.
+
+.. versionadded:: 1.7.3
+
+        '''
+        return self._filter_by_component('get_measure', 'has_measure',
+                                         measures)
+    #--- End: def
+
+    def _filter_by_method(self, *methods):
+        '''Return a test for `filter_by_method`.
+
+.. versionadded:: 1.7.3
+
+        '''
+        return self._filter_by_component('get_method', 'has_method',
+                                         methods)
+    #--- End: def
+
+    def _filter_by_naxes(self, *naxes):
+        '''Return a test for `filter_by_naxes`.
+
+.. versionadded:: 1.7.3
+
+        '''
+        constructs_data_axes = self.data_axes()
+        
+        def predicate(cid, construct):
+            x = constructs_data_axes.get(cid)
+            if x is None:
+                # This construct does not have data axes
+                return False
+
+            ok = True
+            for n in naxes:
+                if n == len(x):
+                    ok = True
+                    break
+
+                ok = False
+
+            return ok
+        #--- End: def
+
+        return predicate
+    #--- End: def
+
+    def _filter_by_ncdim(self, *ncdims):
+        '''Return a test for `filter_by_ncdim`.
+
+.. versionadded:: 1.7.3
+
+        '''
+        return self._filter_by_component('nc_get_dimension',
+                                         'nc_has_dimension', ncdims)
+    #--- End: def
+
+    def _filter_by_ncvar(self, *ncvars):
+        '''Return a test for `filter_by_ncvar`.
+
+.. versionadded:: 1.7.3
+
+        '''
+        return self._filter_by_component('nc_get_variable',
+                                         'nc_has_variable', ncvars)
+    #--- End: def
+
+    def _filter_by_component(self, get_method, has_method, values):
+        '''Return a test for a construct component matching any values.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    get_method: `str`
+        The name of the construct method that returns the component,
+        e.g. ``'get_measure'``.
+
+    has_method: `str`
+        The name of the construct method that returns whether the
+        component has been set, e.g. ``'has_measure'``.
+
+    values: sequence
+        Select constructs whose component matches any of the
+        values. If empty, then select constructs for which the
+        component has been set.
+
+        '''
+        def predicate(cid, construct):
+            try:
+                get = getattr(construct, get_method)
+            except AttributeError:
+                # This construct doesn't have the method
+                return False
+
+            if not values:
+                return getattr(construct, has_method)()
+
+            value1 = get(None)
+            for value0 in values:
+                if self._matching_values(value0, construct, value1):
+                    return True
+            #--- End: for
+            
+            # This construct does not match any of the values
+            return False
+        #--- End: def
+
+        return predicate
+    #--- End: def
+
+    def _filter_by_property(self, mode=(), properties={}):
+        '''Return a test for `filter_by_property`.
+
+.. versionadded:: 1.7.3
+
+        '''
+        _or = False
+        if mode:
+            if len(mode) > 1:
+                raise ValueError("Can provide at most one positional argument")
+            
+            x = mode[0]
+            if x == 'or':
+                _or = True
+            elif x != 'and':
+                raise ValueError("Positional argument, if provided, must 'or' or 'and'")
+        #--- End: if
+
+        def predicate(cid, construct):
+            try:
+                get_property = construct.get_property
+            except AttributeError:
+                # This construct doesn't have a "get_property" method
+                return False
+
+            if not properties:
+                return bool(construct.properties())
+
+            ok = True
+            for name, value0 in properties.items():
+                value1 = get_property(name, None)
+                ok = self._matching_values(value0, construct, value1)
+
+                if _or:
+                    if ok:
+                        break
+                elif not ok:
+                    break
+            #--- End: for
+            
+            return ok
+        #--- End: def
+
+        return predicate
+    #--- End: def
+
     def copy(self, data=True):
         '''Return a deep copy.
 
@@ -373,7 +985,7 @@ instances are equal.
         '''
         out = super().copy(data=data)
 
-        prefiltered = getattr(self, '_prefiltered', None)
+        prefiltered = self._get_prefiltered()
         if prefiltered is not None:
             out._prefiltered = prefiltered.copy(data=data)
             out._filters_applied = self._filters_applied
@@ -673,6 +1285,21 @@ False
         log = []
         axes_to_constructs0 = self._axes_to_constructs()
         axes_to_constructs1 = other._axes_to_constructs()
+
+        # Find the signature of every construct, so that only
+        # constructs with the same signature need to have their data
+        # compared
+        signatures0 = self._equals_signatures(
+            axes_to_constructs0, ignore_data_type=ignore_data_type,
+            ignore_fill_value=ignore_fill_value)
+        signatures1 = other._equals_signatures(
+            axes_to_constructs1, ignore_data_type=ignore_data_type,
+            ignore_fill_value=ignore_fill_value)
+
+        # Record the result of each comparison, so that no pair of
+        # constructs is compared more than once
+        equals_results = {}
+        
         for axes0, constructs0 in axes_to_constructs0.items():
             matched_all_constructs_with_these_axes = False
 
@@ -704,19 +1331,36 @@ False
 #                    elif not role_constructs0:
 #                        break
 
+                    # Bucket the constructs in other by signature
+                    buckets1 = {}
+                    for key1 in role_constructs1:
+                        buckets1.setdefault(signatures1[key1], []).append(key1)
+
                     # Check that there are matching pairs of equal
-                    # constructs
+                    # constructs, only comparing constructs with the
+                    # same signature
                     matched_construct = True
                     for key0, item0 in role_constructs0.items():
                         matched_construct = False
-                        for key1, item1 in tuple(role_constructs1.items()):
-                            if item0.equals(item1,
-                                            rtol=rtol, atol=atol,
-                                            verbose=False,
-                                            ignore_data_type=ignore_data_type,
-                                            ignore_fill_value=ignore_fill_value,
-                                            ignore_compression=ignore_compression,
-                                            ignore_type=_ignore_type):
+                        for key1 in buckets1.get(signatures0[key0], ()):
+                            item1 = role_constructs1.get(key1)
+                            if item1 is None:
+                                # Already matched
+                                continue
+
+                            equal = equals_results.get((key0, key1))
+                            if equal is None:
+                                equal = item0.equals(
+                                    item1,
+                                    rtol=rtol, atol=atol,
+                                    verbose=False,
+                                    ignore_data_type=ignore_data_type,
+                                    ignore_fill_value=ignore_fill_value,
+                                    ignore_compression=ignore_compression,
+                                    ignore_type=_ignore_type)
+                                equals_results[(key0, key1)] = equal
+                                
+                            if equal:
                                 del role_constructs1[key1]
                                 key1_to_key0[key1] = key0
                                 matched_construct = True
@@ -875,82 +1519,15 @@ Select constructs whose data spans the "domainaxis1" or the
 
 >>> d = c.filter_by_axis('or', domainaxis1=True, domainaxis2=True)
 
-        '''       
-        out = self.shallow_copy()
-
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = self.filters_applied() + ({'filter_by_axis': (mode, axes)},)
-
-        # Parse the mode parameter
-        _and      = False
-        _or       = False
-        _exact    = False
-        _subset   = False
-        _superset = False
-        if mode:
-            if len(mode) > 1:
-                raise ValueError("Can provide at most one mode value")
-            
-            mode = mode[0]
-            if mode == 'or':
-                _or = True
-            elif mode == 'and':
-                _and = True
-            elif mode == 'exact':
-                _exact = True
-            elif mode == 'subset':
-                _subset = True
-            elif mode == 'superset':
-                _superset = True
-            else:
-                raise ValueError(
-                    "mode, if provided, must be one of 'and', 'or', 'exact', subset', 'superset'")
-        else:
-            # By default, mode is 'and'
-            _and = True
-            
-        constructs_data_axes = self.data_axes()
-
-        if _exact or _subset or _superset:
-            axes_True = {axis: value for axis, value in axes.items() if value}
-            if _exact and not axes_True:
-                _exact = False
-                _and   = True
-        #--- End: if
-        
-        for cid in tuple(out):
-            x = constructs_data_axes.get(cid)
-            if x is None:
-                # This construct does not have data axes
-                out._pop(cid)
-                continue
+        '''       
+        out = self.shallow_copy()
 
-            ok = True
-            if _exact:
-                if set(x) != set(axes_True):
-                    ok = False
-            elif _subset:
-                if not set(axes_True).issubset(x):
-                    ok = False
-            elif _superset:
-                if not set(axes_True).issuperset(x):
-                    ok = False
-            else:
-                for axis_key, value in axes.items():
-                    if value:
-                        ok = axis_key in x
-                    else:
-                        ok = axis_key not in x
-                
-                    if _or:
-                        if ok:
-                            break
-                    elif not ok:
-                        break
-            #--- End: if
+        out._prefiltered = self.shallow_copy()
+        out._filters_applied = self.filters_applied() + ({'filter_by_axis': (mode, axes)},)
 
-            if not ok:
-                # This construct ..
+        predicate = self._filter_by_axis(mode, axes)
+        for cid, construct in tuple(out.items()):
+            if not predicate(cid, construct):
                 out._pop(cid)
         #--- End: for
         
@@ -1064,34 +1641,7 @@ Select constructs that have a netCDF variable name of 'time':
 >>> d = c.filter_by_identity('ncvar%time')
 
         '''
-        out = self.shallow_copy()
-        
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = self.filters_applied() + ({'filter_by_identity': identities},)
-        
-        # Return all constructs if no identities have been provided
-        if not identities:
-            return out
-        
-        for cid, construct in tuple(out.items()):
-            ok = False
-            for value0 in identities:          
-                for value1 in construct.identities() + ['key%'+cid]:
-                    ok = self._matching_values(value0, construct, value1)
-                    if ok:
-                        break
-                #--- End: for
-
-                if ok:
-                    break
-            #--- End: for
-
-            if not ok:
-                # This construct does not match any of the identities
-                out._pop(cid)
-        #--- End: for
-
-        return out
+        return self._apply_filters(({'filter_by_identity': identities},))
     #--- End: def
 
     def filter_by_key(self, *keys):
@@ -1131,20 +1681,7 @@ Select the constructs with keys 'dimensioncoordinate1' or
 >>> d = c.filter_by_key('dimensioncoordinate1', 'fieldancillary0')
 
         '''
-        out = self.shallow_copy()
-
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = self.filters_applied() + ({'filter_by_key': keys},)
-        
-        if not keys:
-            return out
-        
-        for cid in tuple(out):
-            if cid not in keys:
-                out._pop(cid)
-        #--- End: for
-
-        return out
+        return self._apply_filters(({'filter_by_key': keys},))
     #--- End: def
 
     def filter_by_measure(self, *measures):
@@ -1215,39 +1752,7 @@ Constructs:
  'cellmeasure1': <CellMeasure: measure:volume(3, 9, 10) m3>}
 
         '''
-        out = self.shallow_copy()
-
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = self.filters_applied() + ({'filter_by_measure': measures},)
-        
-        for cid, construct in tuple(out.items()):
-            try:
-                get_measure = construct.get_measure
-            except AttributeError:
-                # This construct doesn't have a "get_measure" method
-                out._pop(cid)
-                continue
-
-            if not measures:
-                if not construct.has_measure():
-                    out._pop(cid)
-                    
-                continue
-
-            ok = False
-            for value0 in measures:
-                value1 = construct.get_measure(None)
-                ok = self._matching_values(value0, construct, value1)
-                if ok:
-                    break
-            #--- End: for
-            
-            if not ok:
-                # This construct does not match any of the measures
-                out._pop(cid)
-        #--- End: for
-        
-        return out
+        return self._apply_filters(({'filter_by_measure': measures},))
     #--- End: def
 
     def filter_by_method(self, *methods):
@@ -1316,39 +1821,7 @@ Constructs:
  'cellmethod1': <CellMethod: domainaxis3: maximum>}
 
         '''
-        out = self.shallow_copy()
-        
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = self.filters_applied() + ({'filter_by_method': methods},)
-        
-        for cid, construct in tuple(out.items()):
-            try:
-                get_method = construct.get_method
-            except AttributeError:
-                # This construct doesn't have a "get_method" method
-                out._pop(cid)
-                continue
-
-            if not methods:
-                if not construct.has_method():
-                    out._pop(cid)
-                    
-                continue
-            
-            ok = False
-            for value0 in methods:
-                value1 = get_method(None)
-                ok = self._matching_values(value0, construct, value1)
-                if ok:
-                    break
-            #--- End: for
-            
-            if not ok:
-                # This construct does not match any of the methods
-                out._pop(cid)
-        #--- End: for
-        
-        return out
+        return self._apply_filters(({'filter_by_method': methods},))
     #--- End: def
 
     def filter_by_naxes(self, *naxes):
@@ -1393,34 +1866,7 @@ constructs:
 >>> d = c.filter_by_ncdim(1, 2)
 
         '''
-        out = self.shallow_copy()
-        
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = self.filters_applied() + ({'filter_by_naxes': naxes},)
-            
-        constructs_data_axes = self.data_axes()
-        
-        for key in tuple(out):
-            x = constructs_data_axes.get(key)
-            if x is None:
-                # This construct does not have data axes
-                out._pop(key)
-                continue
-
-            ok = True
-            for n in naxes:
-                if n == len(x):
-                    ok = True
-                    break
-
-                ok = False
-
-            if not ok:
-                # This construct does not have the right number of axes
-                out._pop(key)
-        #--- End: for
-        
-        return out
+        return self._apply_filters(({'filter_by_naxes': naxes},))
     #--- End: def
 
     def filter_by_ncdim(self, *ncdims):
@@ -1467,41 +1913,7 @@ Select the domain axis constructs with netCDF dimension name 'time' or
 >>> d = c.filter_by_ncdim('time', 'lat')
 
         '''
-        out = self.shallow_copy()
-        
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = self.filters_applied() + ({'filter_by_ncdim': ncdims},)
-        
-        for cid, construct in tuple(out.items()):
-            try:
-                nc_get_dimension = construct.nc_get_dimension
-            except AttributeError:
-                # This construct doesn't have a "nc_get_dimension"
-                # method
-                out._pop(cid)
-                continue
-            
-            if not ncdims:
-                if not construct.nc_has_dimension():
-                    out._pop(cid)
-                    
-                continue
-            
-            ok = False
-            for value0 in ncdims:
-                value1 = nc_get_dimension(None)
-                ok = self._matching_values(value0, construct, value1)
-                if ok:
-                    break
-            #--- End: for
-            
-            if not ok:
-                # This construct does not match any of the netCDF
-                # dimension names
-                out._pop(cid)
-        #--- End: for
-        
-        return out
+        return self._apply_filters(({'filter_by_ncdim': ncdims},))
     #--- End: def
 
     def filter_by_ncvar(self, *ncvars):
@@ -1547,41 +1959,7 @@ Select the constructs with netCDF variable name 'time' or 'lat':
 >>> d = c.filter_by_ncvar('time', 'lat')
 
         '''
-        out = self.shallow_copy()
-        
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = self.filters_applied() + ({'filter_by_ncvar': ncvars},)
-        
-        for cid, construct in tuple(out.items()):            
-            try:
-                nc_get_variable = construct.nc_get_variable
-            except AttributeError:
-                # This construct doesn't have a "nc_get_variable"
-                # method
-                out._pop(cid)
-                continue
-
-            if not ncvars:
-                if not construct.nc_has_variable():
-                    out._pop(cid)
-                    
-                continue
-
-            ok = False
-            for value0 in ncvars:
-                value1 = nc_get_variable(None)
-                ok = self._matching_values(value0, construct, value1)
-                if ok:
-                    break
-            #--- End: for
-
-            if not ok:
-                # This construct does not match any of the netCDF
-                # variable names
-                out._pop(cid)
-        #--- End: for
-        
-        return out
+        return self._apply_filters(({'filter_by_ncvar': ncvars},))
     #--- End: def
 
     def _matching_values(self, value0, construct, value1):
@@ -1666,56 +2044,7 @@ with the string 'air':
 >>> d = c.filter_by_property(standard_name=re.compile('^air'))
 
         '''
-        out = self.shallow_copy()
-
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = self.filters_applied() + ({'filter_by_property': (mode, properties)},)
-        
-        _or = False
-        if mode:
-            if len(mode) > 1:
-                raise ValueError("Can provide at most one positional argument")
-            
-            x = mode[0]
-            if x == 'or':
-                _or = True
-            elif x != 'and':
-                raise ValueError("Positional argument, if provided, must 'or' or 'and'")
-        #--- End: if
-
-        for cid, construct in tuple(out.items()):
-            try:
-                get_property = construct.get_property
-            except AttributeError:
-                # This construct doesn't have a "get_property" method
-                out._pop(cid)
-                continue
-
-            if not properties:
-                if not construct.properties():
-                    out._pop(cid)
-                    
-                continue
-
-            ok = True
-            for name, value0 in properties.items():
-                value1 = get_property(name, None)
-                ok = self._matching_values(value0, construct, value1)
-
-                if _or:
-                    if ok:
-                        break
-                elif not ok:
-                    break
-            #--- End: for
-            
-            if not ok:
-                # This construct does not match any of the sets of
-                # properties
-                out._pop(cid)
-        #--- End: for
-
-        return out
+        return self._apply_filters(({'filter_by_property': (mode, properties)},))
     #--- End: def
 
     def filter_by_type(self, *types):
@@ -1767,12 +2096,7 @@ Select dimension coordinate and field ancillary constructs:
 >>> d = c.filter_by_type('dimension_coordinate', 'field_ancillary')
 
         '''
-        out = super().filter_by_type(*types)
-
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = self.filters_applied() + ({'filter_by_type': types},)
-        
-        return out        
+        return self._apply_filters(({'filter_by_type': types},))
     #--- End: def
     
     def filters_applied(self):
@@ -1879,6 +2203,7 @@ tuple is empty.
         out = self.filters_applied()
         self._filters_applied = None
         self._prefiltered = None
+        self._lazy_prefiltered = None
         return out
     #--- End: def
 
@@ -2000,10 +2325,50 @@ Constructs:
         out._filters_applied = self.filters_applied() + ({'inverse_filter': ()},)
 
         out._prefiltered = self.shallow_copy()
+        out._lazy_prefiltered = None
         
         return out
     #--- End: def
     
+    def query(self):
+        '''Return a lazy query for selecting metadata constructs.
+
+The query has the same ``filter_by_*`` methods as a `Constructs`
+instance, but the filters are accumulated and only applied, in a
+single pass over the constructs, when the selected constructs are
+required. This avoids creating and storing the intermediate
+`Constructs` instances of a chain of filters.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `filter_by_axis`, `filter_by_data`, `filter_by_key`,
+             `filter_by_measure`, `filter_by_method`,
+             `filter_by_naxes`, `filter_by_identity`,
+             `filter_by_ncdim`, `filter_by_ncvar`,
+             `filter_by_property`, `filter_by_type`, `unfilter`
+
+:Returns:
+
+    `ConstructsQuery`
+        A query with no filters.
+
+**Examples:**
+
+>>> q = c.query().filter_by_type('dimension_coordinate')
+>>> q = q.filter_by_property(units='degrees')
+>>> d = q.evaluate()
+>>> d.filters_applied()
+({'filter_by_type': ('dimension_coordinate',)},
+ {'filter_by_property': ((), {'units': 'degrees'})})
+>>> d.equals(c.filter_by_type('dimension_coordinate').filter_by_property(units='degrees'))
+True
+>>> d.unfilter(1).equals(c.filter_by_type('dimension_coordinate'))
+True
+
+        '''
+        return ConstructsQuery(self)
+    #--- End: def
+
     def shallow_copy(self, _ignore=None):
         '''Return a shallow copy.
 
@@ -2022,9 +2387,13 @@ Constructs:
         '''
         out = super().shallow_copy(_ignore=_ignore)
 
+        # Prefiltered constructs are never modified, so they may be
+        # shared with the copy
         prefiltered = getattr(self, '_prefiltered', None)
-        if prefiltered is not None:
-            out._prefiltered = prefiltered.shallow_copy()
+        lazy_prefiltered = getattr(self, '_lazy_prefiltered', None)
+        if prefiltered is not None or lazy_prefiltered is not None:
+            out._prefiltered = prefiltered
+            out._lazy_prefiltered = lazy_prefiltered
             out._filters_applied = self._filters_applied
            
         return out
@@ -2115,21 +2484,33 @@ True
         '''
         out = self
         
-        if depth is None:
-            while True:
-                prefiltered = getattr(out, '_prefiltered', None)
-                if prefiltered is None:
-                    break
-                else:
-                    out = prefiltered
-        else:
-            for _ in range(depth):
-                prefiltered = getattr(out, '_prefiltered', None)
-                if prefiltered is not None:
-                    out = prefiltered
-                else:
-                    break
-        #--- End: if
+        while depth is None or depth > 0:
+            prefiltered = getattr(out, '_prefiltered', None)
+            if prefiltered is not None:
+                out = prefiltered
+                if depth is not None:
+                    depth -= 1
+
+                continue
+            #--- End: if
+
+            lazy_prefiltered = getattr(out, '_lazy_prefiltered', None)
+            if lazy_prefiltered is None:
+                break
+
+            # Skip over filters that were applied in a single pass,
+            # only creating the requested intermediate constructs
+            source, filters = lazy_prefiltered
+            n = len(filters) + 1
+            if depth is None or depth >= n:
+                out = source
+                if depth is not None:
+                    depth -= n
+            else:
+                out = source._apply_filters(filters[:n - depth],
+                                            _source=source)
+                break
+        #--- End: while
         
         return out.shallow_copy()
     #--- End: def
@@ -0,0 +1,546 @@
+from builtins import object
+
+from . import core
+
+
+class ConstructsQuery(object):
+    '''A lazy selection of metadata constructs.
+
+A query accumulates filters, in the same way as the ``filter_by_*``
+methods of a `Constructs` instance, but does not apply them until the
+selected constructs are required. All of the accumulated filters are
+then applied together, with each construct being tested only
+once. The result is a `Constructs` instance that is identical to the
+one returned by applying the same filters one after another.
+
+A query is created by the `Constructs.query` method. Each of its
+``filter_by_*`` methods returns a new query, leaving the original
+query unchanged.
+
+The selected constructs are returned by the `evaluate` method, and
+are also evaluated automatically when the query is used like a
+`Constructs` instance, for example by iterating over it or calling
+its `value` method. Any errors in the filter arguments are raised when
+the query is evaluated.
+
+.. versionadded:: 1.7.3
+
+**Examples:**
+
+>>> q = f.constructs.query().filter_by_type('auxiliary_coordinate')
+>>> q = q.filter_by_axis('and', 'domainaxis1')
+>>> q = q.filter_by_property(units='degrees_N')
+>>> q
+<ConstructsQuery: filter_by_type, filter_by_axis, filter_by_property>
+>>> print(q.evaluate())
+Constructs:
+{'auxiliarycoordinate0': <AuxiliaryCoordinate: latitude(10, 9) degrees_N>}
+>>> q.value()
+<AuxiliaryCoordinate: latitude(10, 9) degrees_N>
+
+    '''
+    def __init__(self, constructs, filters=()):
+        '''**Initialization**
+
+:Parameters:
+
+    constructs: `Constructs`
+        The metadata constructs from which to select.
+
+    filters: `tuple` of `dict`, optional
+        The filters to apply, in the same form as the elements of
+        the `Constructs.filters_applied` history.
+
+        '''
+        self._constructs = constructs
+        self._filters = tuple(filters)
+        self._evaluated = None
+        self._evaluated_version = None
+    #--- End: def
+
+    def __call__(self, *identities):
+        '''Select metadata constructs by identity.
+
+Calling a `ConstructsQuery` instance is an alias for
+`filter_by_identity`.
+
+.. versionadded:: 1.7.3
+
+        '''
+        return self.filter_by_identity(*identities)
+    #--- End: def
+
+    def __contains__(self, key):
+        '''Called to implement membership test operators.
+
+x.__contains__(key) <==> key in x
+
+.. versionadded:: 1.7.3
+
+        '''
+        return key in self.evaluate()
+    #--- End: def
+
+    def __getitem__(self, key):
+        '''Return a selected construct with the given key.
+
+x.__getitem__(key) <==> x[key]
+
+.. versionadded:: 1.7.3
+
+        '''
+        return self.evaluate()[key]
+    #--- End: def
+
+    def __iter__(self):
+        '''Called when an iterator is required.
+
+x.__iter__() <==> iter(x)
+
+.. versionadded:: 1.7.3
+
+        '''
+        return iter(self.evaluate())
+    #--- End: def
+
+    def __len__(self):
+        '''The number of selected constructs.
+
+x.__len__() <==> len(x)
+
+.. versionadded:: 1.7.3
+
+        '''
+        return len(self.evaluate())
+    #--- End: def
+
+    def __repr__(self):
+        '''Called by the `repr` built-in function.
+
+x.__repr__() <==> repr(x)
+
+.. versionadded:: 1.7.3
+
+        '''
+        return '<{0}: {1}>'.format(
+            self.__class__.__name__,
+            ', '.join([name for f in self._filters for name in f]))
+    #--- End: def
+
+    # ----------------------------------------------------------------
+    # Private methods
+    # ----------------------------------------------------------------
+    def _source_version(self):
+        '''Return the version of the constructs from which to select.
+
+The version changes whenever metadata constructs are set or removed,
+their data axes are changed, or the identities of any construct might
+have changed, and so indicates when a cached evaluation is no longer
+valid.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `evaluate`
+
+:Returns:
+
+    `tuple`
+        The version.
+
+        '''
+        return (self._constructs._version[0],
+                core.abstract.Container._identities_version)
+    #--- End: def
+
+    def _add_filter(self, name, value):
+        '''Return a new query with an extra filter.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    name: `str`
+        The name of the filter method, e.g. ``'filter_by_type'``.
+
+    value: `tuple`
+        The arguments to the filter method, as recorded by
+        `Constructs.filters_applied`.
+
+:Returns:
+
+    `ConstructsQuery`
+        The new query.
+
+        '''
+        return type(self)(self._constructs,
+                          self._filters + ({name: value},))
+    #--- End: def
+
+    # ----------------------------------------------------------------
+    # Methods
+    # ----------------------------------------------------------------
+    def evaluate(self):
+        '''Return the selected constructs.
+
+All of the accumulated filters are applied in a single pass over the
+constructs. The result is cached, so the filters are only applied
+again if the constructs from which to select might have changed.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `Constructs`
+        The selected constructs and their construct keys. Their
+        `~Constructs.filters_applied` history includes each of the
+        filters in the query, and the `~Constructs.unfilter` and
+        `~Constructs.inverse_filter` methods may be used on them.
+
+**Examples:**
+
+>>> c = f.constructs.query().filter_by_type('dimension_coordinate')
+>>> print(c.evaluate())
+Constructs:
+{'dimensioncoordinate0': <DimensionCoordinate: latitude(5) degrees_north>,
+ 'dimensioncoordinate1': <DimensionCoordinate: longitude(8) degrees_east>,
+ 'dimensioncoordinate2': <DimensionCoordinate: time(1) days since 2018-12-01 >}
+
+        '''
+        version = self._source_version()
+
+        out = self._evaluated
+        if out is None or version != self._evaluated_version:
+            if self._filters:
+                out = self._constructs._apply_filters(self._filters)
+            else:
+                out = self._constructs.shallow_copy()
+
+            self._evaluated = out
+            self._evaluated_version = version
+        #--- End: if
+
+        return out.shallow_copy()
+    #--- End: def
+
+    def filter_by_axis(self, *mode, **axes):
+        '''Add a selection of metadata constructs by axes.
+
+See `Constructs.filter_by_axis` for details.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `ConstructsQuery`
+        The new query.
+
+**Examples:**
+
+>>> q = q.filter_by_axis('or', domainaxis1=True, domainaxis2=True)
+
+        '''
+        return self._add_filter('filter_by_axis', (mode, axes))
+    #--- End: def
+
+    def filter_by_data(self):
+        '''Add a selection of metadata constructs that could contain data.
+
+See `Constructs.filter_by_data` for details.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `ConstructsQuery`
+        The new query.
+
+**Examples:**
+
+>>> q = q.filter_by_data()
+
+        '''
+        return self._add_filter('filter_by_data', ())
+    #--- End: def
+
+    def filter_by_identity(self, *identities):
+        '''Add a selection of metadata constructs by identity.
+
+See `Constructs.filter_by_identity` for details.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `ConstructsQuery`
+        The new query.
+
+**Examples:**
+
+>>> q = q.filter_by_identity('latitude', 'long_name=Height')
+
+        '''
+        return self._add_filter('filter_by_identity', identities)
+    #--- End: def
+
+    def filter_by_key(self, *keys):
+        '''Add a selection of metadata constructs by key.
+
+See `Constructs.filter_by_key` for details.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `ConstructsQuery`
+        The new query.
+
+**Examples:**
+
+>>> q = q.filter_by_key('domainancillary1', 'cellmeasure0')
+
+        '''
+        return self._add_filter('filter_by_key', keys)
+    #--- End: def
+
+    def filter_by_measure(self, *measures):
+        '''Add a selection of cell measure constructs by measure.
+
+See `Constructs.filter_by_measure` for details.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `ConstructsQuery`
+        The new query.
+
+**Examples:**
+
+>>> q = q.filter_by_measure('area')
+
+        '''
+        return self._add_filter('filter_by_measure', measures)
+    #--- End: def
+
+    def filter_by_method(self, *methods):
+        '''Add a selection of cell method constructs by method.
+
+See `Constructs.filter_by_method` for details.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `ConstructsQuery`
+        The new query.
+
+**Examples:**
+
+>>> q = q.filter_by_method('mean')
+
+        '''
+        return self._add_filter('filter_by_method', methods)
+    #--- End: def
+
+    def filter_by_naxes(self, *naxes):
+        '''Add a selection of metadata constructs by the number of axes.
+
+See `Constructs.filter_by_naxes` for details.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `ConstructsQuery`
+        The new query.
+
+**Examples:**
+
+>>> q = q.filter_by_naxes(1)
+
+        '''
+        return self._add_filter('filter_by_naxes', naxes)
+    #--- End: def
+
+    def filter_by_ncdim(self, *ncdims):
+        '''Add a selection of domain axis constructs by netCDF dimension
+name.
+
+See `Constructs.filter_by_ncdim` for details.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `ConstructsQuery`
+        The new query.
+
+**Examples:**
+
+>>> q = q.filter_by_ncdim('time')
+
+        '''
+        return self._add_filter('filter_by_ncdim', ncdims)
+    #--- End: def
+
+    def filter_by_ncvar(self, *ncvars):
+        '''Add a selection of metadata constructs by netCDF variable name.
+
+See `Constructs.filter_by_ncvar` for details.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `ConstructsQuery`
+        The new query.
+
+**Examples:**
+
+>>> q = q.filter_by_ncvar('time')
+
+        '''
+        return self._add_filter('filter_by_ncvar', ncvars)
+    #--- End: def
+
+    def filter_by_property(self, *mode, **properties):
+        '''Add a selection of metadata constructs by property.
+
+See `Constructs.filter_by_property` for details.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `ConstructsQuery`
+        The new query.
+
+**Examples:**
+
+>>> q = q.filter_by_property('or', standard_name='latitude', axis='Y')
+
+        '''
+        return self._add_filter('filter_by_property', (mode, properties))
+    #--- End: def
+
+    def filter_by_type(self, *types):
+        '''Add a selection of metadata constructs by type.
+
+See `Constructs.filter_by_type` for details.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `ConstructsQuery`
+        The new query.
+
+**Examples:**
+
+>>> q = q.filter_by_type('dimension_coordinate', 'cell_measure')
+
+        '''
+        return self._add_filter('filter_by_type', types)
+    #--- End: def
+
+    def filters(self):
+        '''Return the filters that have been added to the query.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `tuple`
+        The filters, ordered from first to last, in the same form as
+        the elements of the `Constructs.filters_applied` history.
+
+**Examples:**
+
+>>> q = f.constructs.query().filter_by_naxes(1).filter_by_data()
+>>> q.filters()
+({'filter_by_naxes': (1,)}, {'filter_by_data': ()})
+
+        '''
+        return self._filters
+    #--- End: def
+
+    def inverse_filter(self, depth=None):
+        '''Return the inverse of the query's filters.
+
+See `Constructs.inverse_filter` for details.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `Constructs`
+
+        '''
+        return self.evaluate().inverse_filter(depth=depth)
+    #--- End: def
+
+    def items(self):
+        '''Return the selected constructs and their keys.
+
+.. versionadded:: 1.7.3
+
+        '''
+        return self.evaluate().items()
+    #--- End: def
+
+    def key(self, default=ValueError()):
+        '''Return the key of the unique selected construct.
+
+See `Constructs.key` for details.
+
+.. versionadded:: 1.7.3
+
+        '''
+        return self.evaluate().key(default=default)
+    #--- End: def
+
+    def keys(self):
+        '''Return the keys of the selected constructs.
+
+.. versionadded:: 1.7.3
+
+        '''
+        return self.evaluate().keys()
+    #--- End: def
+
+    def unfilter(self, depth=None):
+        '''Return the constructs that existed prior to the query's filters.
+
+See `Constructs.unfilter` for details.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `Constructs`
+
+        '''
+        return self.evaluate().unfilter(depth=depth)
+    #--- End: def
+
+    def value(self, default=ValueError()):
+        '''Return the unique selected construct.
+
+See `Constructs.value` for details.
+
+.. versionadded:: 1.7.3
+
+        '''
+        return self.evaluate().value(default=default)
+    #--- End: def
+
+    def values(self):
+        '''Return the selected constructs.
+
+.. versionadded:: 1.7.3
+
+        '''
+        return self.evaluate().values()
+    #--- End: def
+
+#--- End: class
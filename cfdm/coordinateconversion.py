@@ -22,4 +22,6 @@ field to locations in a planetary reference frame.
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
 #--- End: class
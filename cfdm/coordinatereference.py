@@ -220,6 +220,26 @@ components.
             return string
     #--- End: def
             
+    def _fingerprint_components(self):
+        '''Return the components that define the fingerprint.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `fingerprint`
+
+:Returns:
+
+    `list`
+        The components.
+
+        '''
+        out = super()._fingerprint_components()
+        out.extend((sorted(self.coordinates()),
+                    self.datum.fingerprint(),
+                    self.coordinate_conversion.fingerprint()))
+        return out
+    #--- End: def
+
     def equals(self, other, rtol=None, atol=None, verbose=False,
                ignore_type=False):
         '''Whether two coordinate reference constructs are the same.
@@ -12,6 +12,15 @@ class Container(with_metaclass(abc.ABCMeta, object)):
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ('_components', '_identities_changes')
+
+    # A counter that is incremented whenever the identities of any
+    # container might have changed, i.e. when a property, netCDF name
+    # or other identifying component is set or removed. Cached
+    # identities need only be checked against the `_identities_stamp`
+    # of each container when this counter has changed.
+    _identities_version = 0
+    
     def __init__(self):
         '''**Initialisation**
 
@@ -38,9 +47,88 @@ x.__deepcopy__() <==> copy.deepcopy(x)
         return self.copy()
     #--- End: def
 
+    def __getstate__(self):
+        '''Return the state for pickling.
+
+The components are returned explicitly, because with pickle protocols
+0 and 1 in Python 2 the contents of slots are otherwise lost.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `__setstate__`
+
+        '''
+        return (getattr(self, '__dict__', None),
+                {'_components': self._components})
+    #--- End: def
+
+    def __setstate__(self, state):
+        '''Restore the state from unpickling.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `__getstate__`
+
+        '''
+        state, slots = state
+        if state:
+            self.__dict__.update(state)
+
+        for name, value in slots.items():
+            setattr(self, name, value)
+    #--- End: def
+
     # ----------------------------------------------------------------
     # Private methods
     # ----------------------------------------------------------------
+    def _identities_changed(self):
+        '''Record that the identities of the container might have changed.
+
+This changes the container's `_identities_stamp`, and so invalidates
+any cached identities of the container.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `_identities_stamp`
+
+:Returns:
+
+    `None`
+
+**Examples:**
+
+>>> f._identities_changed()
+
+        '''
+        self._identities_changes = getattr(self, '_identities_changes', 0) + 1
+        Container._identities_version += 1
+    #--- End: def
+
+    def _identities_stamp(self):
+        '''Return a stamp that changes when the identities might have changed.
+
+Subclasses whose identities depend on components that are themselves
+containers combine the stamps of those components.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `_identities_changed`
+
+:Returns:
+
+        The stamp.
+
+**Examples:**
+
+>>> s = f._identities_stamp()
+>>> f.set_property('long_name', 'Air Temperature')
+>>> f._identities_stamp() == s
+False
+
+        '''
+        return getattr(self, '_identities_changes', 0)
+    #--- End: def
+
     def _default(self, default, message=None):
         '''<TODO>
 
@@ -65,8 +153,13 @@ x.__deepcopy__() <==> copy.deepcopy(x)
         '''
         if isinstance(default, Exception):
             if message is not None and not default.args:
-                default = copy(default)
-                default.args = (message,)
+                # Create a new exception, rather than adding the
+                # message to a (possibly shared) default instance
+                try:
+                    default = type(default)(message)
+                except TypeError:
+                    default = copy(default)
+                    default.args = (message,)
 
             raise default
         
@@ -109,9 +202,12 @@ False
         try:
             return self._components.pop(component)
         except KeyError:
-             return self._default(default,
-                                  "{!r} has no {!r} component".format(
-                                      self.__class__.__name__, component))
+            if not isinstance(default, Exception):
+                return default
+            
+            return self._default(default,
+                                 "{!r} has no {!r} component".format(
+                                     self.__class__.__name__, component))
     #--- End: def
 
     def _get_component(self, component, default=ValueError()):
@@ -150,6 +246,11 @@ False
         try:            
             return self._components[component]
         except KeyError:
+            if not isinstance(default, Exception):
+                # Return the default without creating an error message
+                # that would not be used
+                return default
+            
             return self._default(default,
                                  "{!r} object has no {!r} component".format(
                                      self.__class__.__name__, component))
@@ -13,6 +13,8 @@ class Parameters(with_metaclass(abc.ABCMeta, Container)):
 
 .. versionadded:: 1.7.0
     '''
+    __slots__ = ()
+
     def __init__(self, parameters=None, source=None, copy=True): 
         '''**Initialization**
 
@@ -82,6 +84,8 @@ class Parameters(with_metaclass(abc.ABCMeta, Container)):
  'latitude_of_projection_origin': 25.0}
 
         '''
+        self._identities_changed()
+
         out = self._get_component('parameters')
         self._set_component('parameters', {})
         return out.copy()
@@ -146,6 +150,8 @@ None
 None
 
         '''
+        self._identities_changed()
+
         try:
             return self._get_component('parameters').pop(parameter)
         except KeyError:
@@ -317,6 +323,8 @@ None
             parameters = parameters.copy()
         
         self._get_component('parameters').update(parameters)
+
+        self._identities_changed()
     #--- End: def
 
     def set_parameter(self, term, value, copy=True):
@@ -351,6 +359,8 @@ None
             value = deepcopy(value)
             
         self._get_component('parameters')[term] = value
+
+        self._identities_changed()
     #--- End: def
     
 #--- End: class
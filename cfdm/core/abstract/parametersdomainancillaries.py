@@ -15,6 +15,8 @@ domain ancillary constructs.
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
 
     def __init__(self, parameters=None, domain_ancillaries=None,
                  source=None, copy=True):
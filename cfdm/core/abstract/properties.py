@@ -14,6 +14,8 @@ class Properties(with_metaclass(abc.ABCMeta, Container)):
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
     def __init__(self, properties=None, source=None, copy=True):
         '''**Initialization**
 
@@ -72,6 +74,8 @@ class Properties(with_metaclass(abc.ABCMeta, Container)):
 {}
 
         '''
+        self._identities_changed()
+
         out = self._get_component('properties')
         self._set_component('properties', {})
         return out.copy()
@@ -138,6 +142,8 @@ None
 None
 
         '''
+        self._identities_changed()
+
         try:
             return self._get_component('properties').pop(prop)
         except KeyError:
@@ -305,6 +311,8 @@ None
             properties = properties.copy()
         
         self._get_component('properties').update(properties)
+
+        self._identities_changed()
     #--- End: def
 
     def set_property(self, prop, value, copy=True):
@@ -351,6 +359,8 @@ None
             value = deepcopy(value)
             
         self._get_component('properties')[prop] = value
+
+        self._identities_changed()
     #--- End: def
 
 #--- End: class
@@ -12,6 +12,8 @@ class PropertiesData(with_metaclass(abc.ABCMeta, Properties)):
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
     def __init__(self, properties=None, data=None, source=None,
                  copy=True, _use_data=True):
         '''**Initialization**
@@ -112,6 +112,39 @@ properties.
             self.set_interior_ring(interior_ring, copy=False)
     #--- End: def
 
+    # ----------------------------------------------------------------
+    # Private methods
+    # ----------------------------------------------------------------
+    def _identities_stamp(self):
+        '''Return a stamp that changes when the identities might have changed.
+
+The stamp includes that of the bounds, if any.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `_identities_changed`
+
+:Returns:
+
+        The stamp.
+
+**Examples:**
+
+>>> s = c._identities_stamp()
+>>> c.bounds.set_property('units', 'm')
+>>> c._identities_stamp() == s
+False
+
+        '''
+        stamp = super()._identities_stamp()
+
+        bounds = self.get_bounds(None)
+        if bounds is None:
+            return stamp
+
+        return (stamp, bounds._identities_stamp())
+    #--- End: def
+
     # ----------------------------------------------------------------
     # Attributes
     # ----------------------------------------------------------------
@@ -226,6 +259,8 @@ None
 None
 
         '''
+        self._identities_changed()
+
         try:
             return self._del_component('bounds')
         except ValueError:
@@ -501,6 +536,8 @@ None
             bounds = bounds.copy()
 
         self._set_component('bounds', bounds, copy=False)
+
+        self._identities_changed()
     #--- End: def
 
     def set_geometry(self, value, copy=True):
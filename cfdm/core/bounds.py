@@ -18,6 +18,8 @@ cell method constructs.
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
     def __init__(self, properties=None, data=None, source=None,
                  copy=True, _use_data=True):
         '''**Initialization**
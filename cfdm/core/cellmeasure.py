@@ -147,6 +147,8 @@ None
 None
 
         '''
+        self._identities_changed()
+
         try:
             return self._del_component('measure')
         except ValueError:
@@ -262,6 +264,8 @@ None
 >>> print(c.get_measure(None))
 None
         '''
+        self._identities_changed()
+
         return self._set_component('measure', measure, copy=copy)
     #--- End: def
 
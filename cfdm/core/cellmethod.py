@@ -26,6 +26,8 @@ or the fact that the method was applied only over El Nino years).
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
     def __init__(self, axes=None, method=None, qualifiers=None,
                  source=None, copy=True):
         '''**Initialisation**
@@ -244,6 +246,8 @@ False
 'NO METHOD'
 
         '''
+        self._identities_changed()
+
         try:
             return self._del_component('method')
         except ValueError:
@@ -652,6 +656,8 @@ False
 'NO METHOD'
 
         '''
+        self._identities_changed()
+
         return self._set_component('method', value, copy=copy)
     #--- End: def
 
@@ -89,6 +89,11 @@ class Constructs(object):
         '''
         self._ignore = tuple(set(_ignore))
     
+        # A counter, shared with any views, that is incremented
+        # whenever metadata constructs are set, replaced or removed,
+        # or their data axes are changed
+        self._version = [0]
+
         if source is not None:
             if _view:
                 self._key_base             = source._key_base
@@ -96,8 +101,11 @@ class Constructs(object):
                 self._non_array_constructs = source._non_array_constructs
                 self._ordered_constructs   = source._ordered_constructs
                 self._construct_axes       = source._construct_axes
+                self._axis_constructs      = source._axis_constructs
+                self._axes_constructs      = source._axes_constructs
                 self._construct_type       = source._construct_type
                 self._constructs           = source._constructs
+                self._version              = source._version
                 return
             
             self._key_base             = source._key_base.copy()
@@ -170,6 +178,10 @@ class Constructs(object):
             self._constructs = d
 
             self._ignore = ()
+
+            # Rebuild the indexes of data axes, which may no longer
+            # include some of the constructs of the source
+            self._index_data_axes()
             
             return
         #--- End: if
@@ -182,6 +194,17 @@ class Constructs(object):
 
         self._construct_axes = {}
 
+        # Indexes of the data axes, kept in step with
+        # self._construct_axes. For example:
+        # self._axis_constructs:
+        #   {'domainaxis1': {'dimensioncoordinate1',
+        #                    'auxiliarycoordinate0'}}
+        # self._axes_constructs:
+        #   {('domainaxis1',)              : {'dimensioncoordinate1'},
+        #    ('domainaxis1', 'domainaxis2'): {'auxiliarycoordinate0'}}
+        self._axis_constructs = {}
+        self._axes_constructs = {}
+
         # The construct type for each key. For example:
         # {'domainaxis1'         :'domain_axis',
         #  'auxiliarycoordinate3':'auxiliary_coordinate'}
@@ -344,7 +367,237 @@ If k is not found, d is returned if given, otherwise KeyError is
 raised
 
         '''
-        return self._construct_axes.pop(k, *d)
+        try:
+            axes = self._construct_axes.pop(k)
+        except KeyError:
+            if d:
+                return d[0]
+            
+            raise
+
+        self._unindex_construct_axes(k, axes)
+
+        self._version[0] += 1
+
+        return axes
+    #--- End: def
+
+    def _index_construct_axes(self, key, axes):
+        '''Add a construct's data axes to the indexes of data axes.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `_index_data_axes`, `_unindex_construct_axes`
+
+:Parameters:
+
+    key: `str`
+        The construct identifier.
+
+    axes: `tuple`
+        The construct identifiers of the domain axis constructs
+        spanned by the construct's data.
+
+:Returns:
+
+    `None`
+
+        '''
+        axis_constructs = self._axis_constructs
+        for axis in axes:
+            keys = axis_constructs.get(axis)
+            if keys is None:
+                axis_constructs[axis] = set((key,))
+            else:
+                keys.add(key)
+        #--- End: for
+
+        keys = self._axes_constructs.get(axes)
+        if keys is None:
+            self._axes_constructs[axes] = set((key,))
+        else:
+            keys.add(key)
+    #--- End: def
+
+    def _unindex_construct_axes(self, key, axes):
+        '''Remove a construct's data axes from the indexes of data axes.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `_index_construct_axes`
+
+:Parameters:
+
+    key: `str`
+        The construct identifier.
+
+    axes: `tuple`
+        The construct identifiers of the domain axis constructs
+        spanned by the construct's data.
+
+:Returns:
+
+    `None`
+
+        '''
+        axis_constructs = self._axis_constructs
+        for axis in axes:
+            keys = axis_constructs.get(axis)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del axis_constructs[axis]
+        #--- End: for
+
+        keys = self._axes_constructs.get(axes)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._axes_constructs[axes]
+    #--- End: def
+
+    def _index_data_axes(self):
+        '''Rebuild the indexes of data axes from scratch.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `_index_construct_axes`
+
+:Returns:
+
+    `None`
+
+        '''
+        self._axis_constructs = {}
+        self._axes_constructs = {}
+        for key, axes in self._construct_axes.items():
+            self._index_construct_axes(key, axes)
+    #--- End: def
+
+    def _spanning(self, axis):
+        '''Return the keys of constructs whose data span a domain axis.
+
+The keys are found from an index that is updated whenever data axes
+are set or removed, so only the constructs that span the domain axis
+construct are inspected.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `data_axes`
+
+:Parameters:
+
+    axis: `str`
+        The construct identifier of the domain axis construct.
+
+:Returns:
+
+    `set`
+        The keys of the metadata constructs whose data span the
+        domain axis construct.
+
+**Examples:**
+
+>>> c._spanning('domainaxis1')
+{'auxiliarycoordinate0', 'dimensioncoordinate1'}
+
+        '''
+        keys = self._axis_constructs.get(axis, ())
+        ignore = self._ignore
+        if not ignore:
+            return set(keys)
+
+        construct_type = self._construct_type
+        return set([key for key in keys
+                    if construct_type[key] not in ignore])
+    #--- End: def
+
+    def _spanning_subsets(self, axes):
+        '''Return the keys of constructs whose data span a subset of given
+domain axes.
+
+The keys are found from an index that is updated whenever data axes
+are set or removed, so only the distinct combinations of data axes
+are inspected, rather than every construct.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `_spanning`, `_type_constructs`, `data_axes`
+
+:Parameters:
+
+    axes: sequence of `str`
+        The construct identifiers of the domain axis constructs.
+
+:Returns:
+
+    `dict`
+        The keys of the metadata constructs, as a set for each
+        combination of data axes that is a subset of *axes*.
+
+**Examples:**
+
+>>> c._spanning_subsets(['domainaxis0', 'domainaxis1'])
+{('domainaxis0',): {'dimensioncoordinate0'},
+ ('domainaxis1',): {'dimensioncoordinate1'},
+ ('domainaxis1', 'domainaxis0'): {'auxiliarycoordinate0'}}
+
+        '''
+        axes = set(axes)
+        ignore = self._ignore
+        construct_type = self._construct_type
+
+        out = {}
+        for construct_axes, keys in self._axes_constructs.items():
+            if not axes.issuperset(construct_axes):
+                continue
+
+            if ignore:
+                keys = [key for key in keys
+                        if construct_type[key] not in ignore]
+                if not keys:
+                    continue
+            #--- End: if
+
+            out[construct_axes] = set(keys)
+        #--- End: for
+
+        return out
+    #--- End: def
+
+    def _type_constructs(self, construct_type):
+        '''Return the constructs of a given type.
+
+Unlike `filter_by_type`, no new `Constructs` instance is created.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `_spanning_subsets`, `filter_by_type`
+
+:Parameters:
+
+    construct_type: `str`
+        The construct type.
+
+        *Parameter example:*
+          ``construct_type='coordinate_reference'``
+
+:Returns:
+
+    `dict`
+        The constructs of the given type, keyed by their construct
+        identifiers.
+
+**Examples:**
+
+>>> c._type_constructs('coordinate_reference')
+{'coordinatereference0': <CoordinateReference: rotated_latitude_longitude>}
+
+        '''
+        if construct_type in self._ignore:
+            return {}
+
+        return dict(self._constructs.get(construct_type, {}))
     #--- End: def
     
     # ----------------------------------------------------------------
@@ -370,6 +623,8 @@ raised
             
             raise KeyError(error)
             
+        self._version[0] += 1
+
         # Remove and return the construct
         return self._constructs[construct_type].pop(k, *d)
     #--- End: def
@@ -387,6 +642,10 @@ raised
         self._construct_axes.update      (other._construct_axes)
         self._construct_type.update      (other._construct_type)
         self._constructs.update          (other._constructs)
+
+        self._version[0] += 1
+
+        self._index_data_axes()
     #--- End: def
 
     def construct_type(self, key):
@@ -497,15 +756,14 @@ reference is replace with `None`.
 >>> x = f._del_construct('auxiliarycoordinate2')
 
         '''
-        data_axes = self.data_axes()
-        if key in self.filter_by_type('domain_axis'):
+        if self.construct_type(key) == 'domain_axis':
             # Fail if the domain axis construct is spanned by a data
             # array
-            for xid, axes in data_axes.items():
-                if key in axes:
-                    raise ValueError(
+            spanning = self._spanning(key)
+            if spanning:
+                raise ValueError(
 "Can't remove domain axis construct {!r} that spans the data array of metadata construct {!r}".format(
-    key, xid))
+    key, sorted(spanning)[0]))
     
             # Fail if the domain axis construct is referenced by a
             # cell method construct
@@ -645,6 +903,8 @@ reference is replace with `None`.
         # Insert the construct
         self._constructs[construct_type][key] = construct
 
+        self._version[0] += 1
+
         # Return the identifier of the construct
         return key
     #--- End: def
@@ -698,7 +958,12 @@ reference is replace with `None`.
         if isinstance(axes, basestring):
             axes = (axes,)
             
-        domain_axes = self.filter_by_type('domain_axis')
+        # Look up the domain axis constructs directly, rather than
+        # creating a filtered copy of all constructs
+        if 'domain_axis' in self._ignore:
+            domain_axes = {}
+        else:
+            domain_axes = self._constructs.get('domain_axis', {})
 
         axes_shape = []
         for axis in axes:
@@ -732,7 +997,15 @@ reference is replace with `None`.
     construct, data.shape, tuple(axes), axes_shape))
         #--- End: try
         
-        self._construct_axes[key] = tuple(axes)
+        axes = tuple(axes)
+        old_axes = self._construct_axes.get(key)
+        if old_axes is not None:
+            self._unindex_construct_axes(key, old_axes)
+        
+        self._construct_axes[key] = axes
+        self._index_construct_axes(key, axes)
+
+        self._version[0] += 1
     #--- End: def
 
     # ----------------------------------------------------------------
@@ -909,17 +1182,11 @@ Constructs:
         if not self._ignore:
             return self._construct_axes.copy()
         else:
+            construct_type = self._construct_type
             ignore = self._ignore
-            out = {}
-            for construct_type, keys in self._constructs.items():
-                if construct_type not in ignore:
-                    for key in keys:
-                        _ = self._construct_axes.get(key)
-                        if _ is not None:
-                            out[key] = _
-            #--- End: for
-
-            return out
+            return {key: axes
+                    for key, axes in self._construct_axes.items()
+                    if construct_type[key] not in ignore}
     #--- End: def
 
     def copy(self, data=True):
@@ -991,7 +1258,8 @@ Constructs:
         keys = self._constructs[construct_type]
 
         key_base = self._key_base[construct_type]
-        key = '{0}{1}'.format(key_base, len(keys))
+        n = len(keys)
+        key = '{0}{1}'.format(key_base, n)
         while key in keys:
             n += 1
             key = '{0}{1}'.format(key_base, n)
@@ -1009,12 +1277,17 @@ Constructs:
             raise ValueError("Can't replace non-existent construct {!r}".format(key))
 
         if axes is not None and construct_type in self._array_constructs:        
-            self._construct_axes[key] = tuple(axes)
+            self._del_data_axes(key, None)
+            axes = tuple(axes)
+            self._construct_axes[key] = axes
+            self._index_construct_axes(key, axes)
 
         if copy:
             construct = construct.copy()
             
         self._constructs[construct_type][key] = construct
+
+        self._version[0] += 1
     #--- End: def
 
     def ordered(self):
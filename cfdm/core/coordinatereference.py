@@ -138,6 +138,35 @@ frame and consists of the following:
             self.set_datum(datum, copy=copy)
     #--- End: def
 
+    # ----------------------------------------------------------------
+    # Private methods
+    # ----------------------------------------------------------------
+    def _identities_stamp(self):
+        '''Return a stamp that changes when the identities might have changed.
+
+The stamp includes that of the coordinate conversion component.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `_identities_changed`
+
+:Returns:
+
+        The stamp.
+
+**Examples:**
+
+>>> s = c._identities_stamp()
+>>> c.coordinate_conversion.set_parameter('grid_mapping_name',
+...                                       'rotated_latitude_longitude')
+>>> c._identities_stamp() == s
+False
+
+        '''
+        return (super()._identities_stamp(),
+                self.get_coordinate_conversion()._identities_stamp())
+    #--- End: def
+
     # ----------------------------------------------------------------
     # Attributes
     # ----------------------------------------------------------------
@@ -229,7 +258,7 @@ set()
 
         '''
         out = self._get_component('coordinates')
-        out = self._set_component('coordinates', set())
+        self._set_component('coordinates', set(), copy=False)
         return out.copy()
     #--- End: def
     
@@ -589,6 +618,8 @@ set()
             
         self._set_component('coordinate_conversion',
                             coordinate_conversion, copy=False)
+
+        self._identities_changed()
     #--- End: def
 
     def set_datum(self, datum, copy=True):
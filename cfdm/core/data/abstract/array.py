@@ -227,6 +227,7 @@ original or the new copy.
         klass = self.__class__
         new = klass.__new__(klass)
         new.__dict__ = self.__dict__.copy()
+        new._components = self._components
         return new
     #--- End: def
 
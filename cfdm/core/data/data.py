@@ -103,6 +103,13 @@ class Data(abstract.Container):
             self.set_fill_value(fill_value)
 
         if _use_array and array is not None:
+            if source is not None:
+                # An underlying array is never changed in place (a
+                # change to the data replaces it with a new one), so
+                # the source's underlying array is shared rather than
+                # copied
+                copy = False
+                
             self._set_Array(array, copy=copy)
     #--- End: def
 
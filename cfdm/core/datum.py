@@ -20,4 +20,6 @@ of the dimension and auxiliary coordinate constructs referenced by the
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
 #--- End: class
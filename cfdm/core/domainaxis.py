@@ -18,6 +18,8 @@ to the order of the elements.
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
     def __init__(self, size=None, source=None, copy=True):
         '''**Initialization**
 
@@ -7,5 +7,6 @@ from .numpyarray                   import NumpyArray
 from .raggedcontiguousarray        import RaggedContiguousArray
 from .raggedindexedarray           import RaggedIndexedArray
 from .raggedindexedcontiguousarray import RaggedIndexedContiguousArray
+from .viewarray                    import ViewArray
 
 from .data import Data
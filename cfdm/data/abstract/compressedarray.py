@@ -139,6 +139,49 @@ rules, the only differences being:
         self._set_component('compressed_Array', array, copy=False)
     #--- End: def
 
+    def _parse_instance_indices(self, indices):
+        '''Separate the indices of the first uncompressed dimension.
+
+For arrays compressed by ragged arrays, the first uncompressed
+dimension is the instance dimension, and only the instances it selects
+need to be uncompressed.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    indices:
+        The indices of the uncompressed array. See `__getitem__` for
+        details.
+
+:Returns:
+
+    `numpy.ndarray`, `list`
+        The positions of the selected instances, and the indices of
+        the uncompressed array with the first index replaced by a
+        slice that selects all of the selected instances.
+
+**Examples:**
+
+>>> a.shape
+(4, 9)
+>>> a._parse_instance_indices((slice(1, 3), slice(0, 5)))
+(array([1, 2]), [slice(None, None, None), slice(0, 5, None)])
+>>> a._parse_instance_indices(Ellipsis)
+(array([0, 1, 2, 3]), [slice(None, None, None), slice(None, None, None)])
+
+        '''
+        if indices is Ellipsis:
+            indices = [slice(None)] * self.ndim
+        else:
+            indices = list(indices)
+
+        instances = numpy.arange(self.shape[0])[indices[0]]
+        indices[0] = slice(None)
+
+        return numpy.atleast_1d(instances), indices
+    #--- End: def
+
     # ----------------------------------------------------------------
     # Attributes
     # ----------------------------------------------------------------
@@ -1,8 +1,12 @@
 from __future__ import print_function
 from builtins import (range, super, zip)
 
+import hashlib
 import itertools
 
+from functools import reduce
+from operator  import mul
+
 import numpy
 import netCDF4
 
@@ -12,7 +16,12 @@ from .. import mixin
 from ..constants  import masked
 
 from . import abstract
+from . import GatheredArray
 from . import NumpyArray
+from . import RaggedContiguousArray
+from . import RaggedIndexedArray
+from . import RaggedIndexedContiguousArray
+from . import ViewArray
 
 
 class Data(mixin.Container,
@@ -318,8 +327,8 @@ x.__str__() <==> str(x)
             if isreftime:
                 # Convert reference time to date-time
                 try:
-                    first = type(self)(
-                        numpy.ma.array(first), units, calendar).datetime_array
+                    first = self._num2date(numpy.ma.array(first), units,
+                                           calendar or 'standard')
                 except (ValueError, OverflowError):
                     first = '??'
 
@@ -331,8 +340,9 @@ x.__str__() <==> str(x)
             if isreftime:
                 # Convert reference times to date-times
                 try:
-                    first, last = type(self)(
-                        numpy.ma.array([first, last]), units, calendar).datetime_array
+                    first, last = self._num2date(
+                        numpy.ma.array([first, last]), units,
+                        calendar or 'standard')
                 except (ValueError, OverflowError):
                     first, last = ('??', '??')
 
@@ -345,8 +355,8 @@ x.__str__() <==> str(x)
                 if isreftime:
                     # Convert reference time to date-time
                     try:
-                        middle = type(self)(
-                            numpy.ma.array(middle), units, calendar).datetime_array
+                        middle = self._num2date(numpy.ma.array(middle),
+                                                units, calendar or 'standard')
                     except (ValueError, OverflowError):
                         middle = '??'
                         
@@ -375,6 +385,34 @@ x.__str__() <==> str(x)
     # ----------------------------------------------------------------
     # Private methods
     # ----------------------------------------------------------------
+    def _fingerprint_components(self):
+        '''Return the components that define the fingerprint.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `fingerprint`
+
+:Returns:
+
+    `list`
+        The components.
+
+        '''
+        out = super()._fingerprint_components()
+        out.extend((self.get_units(None),
+                    self.get_calendar(None),
+                    self._fingerprint_value(self.get_fill_value(None))))
+
+        array = self._get_Array(None)
+        if array is not None:
+            out.extend((array.shape,
+                        array.dtype.str,
+                        self.get_compression_type(),
+                        self._values_digest(array)))
+
+        return out
+    #--- End: def
+
     def _item(self, index):
         '''Return an element of the data as a scalar.
 
@@ -488,6 +526,284 @@ masked
         super()._set_Array(array, copy=copy)
     #--- End: def
 
+    def _set_statistics(self, **statistics):
+        '''Set known summary statistics of the data values.
+
+The statistics are stored with the underlying array, so they are
+shared by copies of the data and are discarded when the data are
+changed. They are not checked against the data values.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `statistics`
+
+:Parameters:
+
+    statistics: optional
+        The statistics, which may be any of ``minimum``, ``maximum``,
+        ``count`` and ``count_masked``.
+
+:Returns:
+
+    `None`
+
+**Examples:**
+
+>>> d._set_statistics(minimum=-2.5, maximum=30.0)
+>>> print(d.max().array)
+[30.]
+
+        '''
+        array = self._get_Array()
+
+        new = getattr(array, '_statistics', {}).copy()
+        new.update(statistics)
+        array._statistics = new
+    #--- End: def
+
+    def _view_Array(self, source_axes):
+        '''Return the array with rearranged dimensions, without reading it.
+
+No data values are read from disk, nor copied in memory. An
+underlying numpy array is replaced with a numpy view of it, and any
+other underlying array is wrapped in a `ViewArray`.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `insert_dimension`, `squeeze`, `transpose`
+
+:Parameters:
+
+    source_axes: sequence of `int` or `None`
+        For each dimension of the new array, the position of the
+        corresponding dimension of the data, or `None` if the
+        dimension is a new size one dimension. Dimensions of the data
+        which are not included must have size one, and are removed.
+
+:Returns:
+
+    subclass of `Array`
+        The array with rearranged dimensions.
+
+**Examples:**
+
+>>> d.shape
+(1, 73, 96)
+>>> d._view_Array((2, None, 1)).shape
+(96, 1, 73)
+
+        '''
+        array = self._get_Array()
+        if isinstance(array, NumpyArray):
+            out = NumpyArray(
+                ViewArray.rearrange(array._get_component('array'),
+                                    source_axes))
+        else:
+            out = ViewArray(array, source_axes=source_axes)
+
+        # Rearranging the dimensions does not change the values, so
+        # any of their statistics that are known still apply
+        statistics = getattr(array, '_statistics', None)
+        if statistics is not None:
+            out._statistics = statistics
+
+        return out
+    #--- End: def
+
+    @classmethod
+    def _blocks(cls, array, block_bytes=134217728):
+        '''Return indices that read an underlying array in blocks.
+
+The blocks span the first dimension, and each is no larger than
+*block_bytes* unless a single element of the first dimension is
+larger, so that the whole array need not be in memory at once.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `_array_statistics`, `_values_digest`
+
+:Parameters:
+
+    array: subclass of `Array`
+        The underlying array.
+
+    block_bytes: `int`, optional
+        The maximum size in bytes of a block.
+
+:Returns:
+
+    sequence of `tuple`
+        The indices of each block.
+
+**Examples:**
+
+>>> d._blocks(a, block_bytes=800)
+[(slice(0, 10, None), slice(None, None, None)),
+ (slice(10, 20, None), slice(None, None, None))]
+
+        '''
+        shape = array.shape
+        if not shape or not array.size:
+            return (Ellipsis,)
+
+        size = max(int(array.size) // shape[0], 1) * array.dtype.itemsize
+        step = max(block_bytes // size, 1)
+        return [(slice(i, i+step),) + tuple(slice(None) for n in shape[1:])
+                for i in range(0, shape[0], step)]
+    #--- End: def
+
+    @classmethod
+    def _array_statistics(cls, array, names=None,
+                          block_bytes=134217728):
+        '''Return summary statistics of the values of an underlying array.
+
+The statistics are the minimum and maximum of the non-missing values
+(which are masked if there are none), the number of non-missing values
+(``'count'``) and the number of missing values (``'count_masked'``).
+
+Any statistics that are not already known are found together in a
+single pass through the array, which is read in blocks (see
+`_blocks`). The statistics are stored on the underlying array, which
+is never changed in place, so they are only calculated once for each
+array.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `_set_statistics`, `statistics`
+
+:Parameters:
+
+    array: subclass of `Array`
+        The underlying array.
+
+    names: sequence of `str`, optional
+        The statistics that are required. By default all statistics
+        are required.
+
+    block_bytes: `int`, optional
+        The maximum size in bytes of a block.
+
+:Returns:
+
+    `dict`
+        The statistics, including at least those that are required.
+
+        '''
+        statistics = getattr(array, '_statistics', {})
+
+        if names is None:
+            names = ('minimum', 'maximum', 'count', 'count_masked')
+
+        missing = [name for name in names if name not in statistics]
+        if not missing:
+            return statistics
+
+        minimum = None
+        maximum = None
+        count = 0
+        count_masked = 0
+        find_minimum = 'minimum' in missing
+        find_maximum = 'maximum' in missing
+        for indices in cls._blocks(array, block_bytes):
+            v = array[indices]
+
+            n = int(numpy.ma.count(v))
+            count += n
+            count_masked += int(numpy.size(v)) - n
+            if not n:
+                continue
+
+            if find_minimum:
+                vmin = numpy.ma.min(v)
+                if minimum is None or vmin < minimum:
+                    minimum = vmin
+            #--- End: if
+
+            if find_maximum:
+                vmax = numpy.ma.max(v)
+                if maximum is None or vmax > maximum:
+                    maximum = vmax
+        #--- End: for
+
+        if not count:
+            minimum = numpy.ma.masked
+            maximum = numpy.ma.masked
+
+        found = {'minimum'     : minimum,
+                 'maximum'     : maximum,
+                 'count'       : count,
+                 'count_masked': count_masked}
+
+        # Statistics that are already known are kept, so that the
+        # result does not depend on the order of requests
+        statistics = statistics.copy()
+        for name in missing:
+            statistics[name] = found[name]
+
+        array._statistics = statistics
+
+        return statistics
+    #--- End: def
+
+    @classmethod
+    def _values_digest(cls, array, block_bytes=134217728):
+        '''Return a digest of the values of an underlying array.
+
+The array is read in blocks along its first dimension (see `_blocks`),
+so that the whole array need not be in memory at once.
+
+The digest is stored on the underlying array, which is never changed
+in place, so it is only calculated once for each array.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    array: subclass of `Array`
+        The underlying array.
+
+    block_bytes: `int`, optional
+        The maximum size in bytes of a block.
+
+:Returns:
+
+    `str`
+        The digest, as a string of hexadecimal digits.
+
+        '''
+        digest = getattr(array, '_digest', None)
+        if digest is not None:
+            return digest
+
+        h = hashlib.sha1()
+
+        values = (array[indices]
+                  for indices in cls._blocks(array, block_bytes))
+        if array.get_compression_type():
+            values = itertools.chain(values, (array.compressed_array,))
+
+        for v in values:
+            mask = numpy.ma.getmaskarray(v)
+            if mask.any():
+                h.update(b'm')
+                h.update(numpy.packbits(mask).tobytes())
+                v = numpy.ma.filled(v)
+            else:
+                h.update(b'u')
+                v = numpy.ma.getdata(v)
+
+            if v.dtype.kind == 'O':
+                h.update(repr(v.tolist()).encode('utf-8'))
+            else:
+                h.update(numpy.ascontiguousarray(v).tobytes())
+        #--- End: for
+
+        digest = h.hexdigest()
+        array._digest = digest
+
+        return digest
+    #--- End: def
+
     @classmethod
     def _set_subspace(cls, array, indices, value):
         '''TODO
@@ -552,6 +868,65 @@ masked
                     array[i] = value[j]
     #--- End: def
 
+    @classmethod
+    def _num2date(cls, array, units, calendar):
+        '''Convert reference times to date-time objects.
+
+Conversions are carried out with the `netCDF4.num2date` function.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `datetime_array`
+
+:Parameters:
+
+    array: `numpy.ndarray`
+        The reference times.
+
+    units: `str`
+        The reference time units.
+
+    calendar: `str`
+        The calendar.
+
+:Returns:
+
+    `numpy.ndarray`
+        The date-time objects.
+
+**Examples:**
+
+>>> d._num2date(numpy.ma.array([31, 62]), 'days since 2018-12-01',
+...             'standard')
+array([cftime.DatetimeGregorian(2019, 1, 1, 0, 0, 0, 0, 1, 1),
+       cftime.DatetimeGregorian(2019, 2, 1, 0, 0, 0, 0, 4, 32)],
+      dtype=object)
+
+        '''
+        mask = None
+        if numpy.ma.isMA(array):
+            # num2date has issues if the mask is nomask
+            mask = array.mask
+            if mask is numpy.ma.nomask or not numpy.ma.is_masked(array):
+                mask = None
+                array = array.view(numpy.ndarray)
+        #--- End: if
+
+        out = netCDF4.num2date(array, units=units, calendar=calendar,
+                               only_use_cftime_datetimes=True)
+
+        if mask is None:
+            # There is no missing data
+            out = numpy.array(out, dtype=object)
+        else:
+            # There is missing data
+            out = numpy.ma.masked_where(mask, out)
+            if not numpy.ndim(out):
+                out = numpy.ma.masked_all((), dtype=object)
+
+        return out
+    #--- End: def
+
     #-----------------------------------------------------------------
     # Attributes
     #-----------------------------------------------------------------
@@ -593,7 +968,9 @@ If the calendar has not been set then the CF default calendar of
 "standard" (i.e. the mixed Gregorian/Julian calendar as defined by
 Udunits) will be used.
 
-Conversions are carried out with the `netCDF4.num2date` function.
+Conversions are carried out with the `netCDF4.num2date` function. The
+date-time objects are calculated once, and are then reused until the
+data are changed.
 
 .. versionadded:: 1.7.0
 
@@ -621,31 +998,26 @@ Conversions are carried out with the `netCDF4.num2date` function.
 2019-02-03 00:00:00
 
         '''
-        array = self.array
+        units = self.get_units(None)
+        calendar = self.get_calendar('standard')
 
-        mask = None
-        if numpy.ma.isMA(array):
-            # num2date has issues if the mask is nomask
-            mask = array.mask
-            if mask is numpy.ma.nomask or not numpy.ma.is_masked(array):
-                mask = None
-                array = array.view(numpy.ndarray)
-        #--- End: if
-        
-        array = netCDF4.num2date(array, units=self.get_units(None),
-                                 calendar=self.get_calendar('standard'),
-                                 only_use_cftime_datetimes=True)
+        array = self._get_Array()
 
-        if mask is None:
-            # There is no missing data
-            array = numpy.array(array, dtype=object)
-        else:
-            # There is missing data
-            array = numpy.ma.masked_where(mask, array)
-            if not numpy.ndim(array):
-                array = numpy.ma.masked_all((), dtype=object)
+        # The date-times are stored on the underlying array, which is
+        # never changed in place, so they are only calculated once
+        # for each array, units and calendar.
+        datetime_arrays = getattr(array, '_datetime_arrays', {})
 
-        return array
+        out = datetime_arrays.get((units, calendar))
+        if out is None:
+            out = self._num2date(self.array, units, calendar)
+
+            datetime_arrays = datetime_arrays.copy()
+            datetime_arrays[(units, calendar)] = out
+            array._datetime_arrays = datetime_arrays
+        #--- End: if
+
+        return out.copy()
     #--- End: def
 
     # ----------------------------------------------------------------
@@ -724,11 +1096,11 @@ data array shape.
             raise ValueError(
                 "Can't insert dimension: Invalid position: {!r}".format(position))
 
-        array = self.array
-        array = numpy.expand_dims(array, position)
+        source_axes = list(range(ndim))
+        source_axes.insert(position, None)
 
         out = self.copy(array=False)
-        out._set_Array(array, copy=False)
+        out._set_Array(self._view_Array(source_axes), copy=False)
 
         # Delete hdf5 chunksizes
         out.nc_clear_hdf5_chunksizes()
@@ -736,27 +1108,429 @@ data array shape.
         return out
     #--- End: def
 
-#    def compress_by_gathering(self, list_data, compressed_axes, replace_list_data=False
+    def _check_omitted_are_missing(self, mask, compression_type):
+        '''Check that the elements omitted by compression are all missing.
 
-#    def set_list_data(self, list_data, compressed_axes=None,
-#                      copy=True):
-#        '''
-#        '''
-#        compression_type = self.compression_type
-#        if compression_type == 'gathered':
-#            self._set_Array().set_list_data(list_data)
-##            raise ValueError("eqweqweweqw 1")
-#        elif compression_type:
-#            raise ValueError("eqweqweweqw 2")
-#
-#        compressed_array = self._compress_by_gathering(list_data, compressed_axes)
-#
-#        self._set_Array(GatheredArray(compressed_array=compressed_array,
-#                                      shape=self.shape,
-#                                      size=self.size, ndim=self.ndim,
-#                                      sample_axis=compressed_axes[0],
-#                                      list_array=list_data))
-#    #--- End: def
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    mask: `numpy.ndarray`
+        The mask of the elements which are omitted from the
+        compressed array.
+
+    compression_type: `str`
+        The type of compression, used in error messages.
+
+:Returns:
+
+    `None`
+
+        '''
+        if not mask.all():
+            raise ValueError(
+"Can't compress by {}: Omitted elements must be missing values".format(
+    compression_type))
+    #--- End: def
+
+    def compress_by_gathering(self, axes, list_variable):
+        '''Compress the data by gathering.
+
+Compression by gathering combines adjacent dimensions into a single
+list dimension, which contains only the points given by the list
+variable. All of the data at the points which are not in the list
+must be missing values.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `compress_by_ragged_contiguous`, `get_list`,
+             `get_compression_type`
+
+:Parameters:
+
+    axes: sequence of `int`
+        The positions of the dimensions to be gathered. They must be
+        adjacent and in increasing order.
+
+        *Parameter example:*
+          ``axes=[2, 3]``
+
+    list_variable: `List`
+        The list variable, whose data are the indices of the points to
+        be kept, counting in row-major order over the gathered
+        dimensions.
+
+:Returns:
+
+    `Data`
+        The compressed data.
+
+**Examples:**
+
+>>> d.shape
+(2, 3, 4)
+>>> l = cfdm.List(data=cfdm.Data([1, 4, 5, 11]))
+>>> e = d.compress_by_gathering([1, 2], l)
+>>> e.get_compression_type()
+'gathered'
+>>> e.compressed_array.shape
+(2, 4)
+>>> e.shape
+(2, 3, 4)
+
+        '''
+        axes = self._parse_axes(axes)
+        if not axes or list(axes) != list(range(axes[0], axes[0] + len(axes))):
+            raise ValueError(
+"Can't compress by gathering: Axes must be adjacent and in increasing order: {!r}".format(
+    axes))
+
+        shape = self.shape
+        position = axes[0]
+        n_points = reduce(mul, [shape[i] for i in axes], 1)
+
+        list_array = numpy.array(list_variable.get_data().array,
+                                 dtype=int).flatten()
+        if list_array.size and (list_array.min() < 0 or
+                                list_array.max() >= n_points):
+            raise ValueError(
+"Can't compress by gathering: List indices must lie between 0 and {}".format(
+    n_points - 1))
+
+        # Combine the gathered dimensions into one
+        array = self.array
+        array = array.reshape(shape[:position] + (n_points,) +
+                              shape[position + len(axes):])
+
+        omitted = numpy.ones((n_points,), dtype=bool)
+        omitted[list_array] = False
+        self._check_omitted_are_missing(
+            numpy.ma.getmaskarray(array).compress(omitted, axis=position),
+            'gathering')
+
+        compressed = array.take(list_array, axis=position)
+
+        out = self.copy(array=False)
+        out._set_Array(
+            GatheredArray(compressed_array=NumpyArray(compressed),
+                          shape=shape, size=self.size, ndim=self.ndim,
+                          compressed_dimension=position,
+                          list_variable=list_variable),
+            copy=False)
+
+        out.nc_clear_hdf5_chunksizes()
+
+        return out
+    #--- End: def
+
+    def compress_by_ragged_contiguous(self, count_variable):
+        '''Compress the data by a contiguous ragged array.
+
+The first dimension is the instance dimension, and the second is the
+element dimension. The elements of each instance are stored in a
+contiguous block of a single sample dimension, whose size is given by
+the count variable. The elements of each instance beyond its count
+must be missing values.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `compress_by_gathering`, `compress_by_ragged_indexed`,
+             `compress_by_ragged_indexed_contiguous`, `get_count`
+
+:Parameters:
+
+    count_variable: `Count`
+        The count variable, whose data are the number of elements in
+        each instance.
+
+:Returns:
+
+    `Data`
+        The compressed data.
+
+**Examples:**
+
+>>> d.shape
+(3, 4)
+>>> c = cfdm.Count(data=cfdm.Data([2, 4, 1]))
+>>> e = d.compress_by_ragged_contiguous(c)
+>>> e.get_compression_type()
+'ragged contiguous'
+>>> e.compressed_array.shape
+(7,)
+
+        '''
+        compression_type = 'contiguous ragged array'
+
+        count = self._parse_ragged_count(count_variable, compression_type)
+
+        array = self.array
+        select = numpy.arange(self.shape[1]) < count[:, numpy.newaxis]
+        self._check_omitted_are_missing(
+            numpy.ma.getmaskarray(array)[~select], compression_type)
+
+        out = self.copy(array=False)
+        out._set_Array(
+            RaggedContiguousArray(compressed_array=NumpyArray(array[select]),
+                                  shape=self.shape, size=self.size,
+                                  ndim=self.ndim,
+                                  count_variable=count_variable),
+            copy=False)
+
+        out.nc_clear_hdf5_chunksizes()
+
+        return out
+    #--- End: def
+
+    def compress_by_ragged_indexed(self, index_variable):
+        '''Compress the data by an indexed ragged array.
+
+The first dimension is the instance dimension, and the second is the
+element dimension. The elements of all instances are stored in a
+single sample dimension, with the index variable giving the instance
+of each sample. The elements of each instance are taken in order from
+the start of its element dimension, and those beyond the number of
+its samples must be missing values.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `compress_by_ragged_contiguous`,
+             `compress_by_ragged_indexed_contiguous`, `get_index`
+
+:Parameters:
+
+    index_variable: `Index`
+        The index variable, whose data are the instance of each
+        sample.
+
+:Returns:
+
+    `Data`
+        The compressed data.
+
+**Examples:**
+
+>>> d.shape
+(3, 4)
+>>> i = cfdm.Index(data=cfdm.Data([0, 1, 1, 0, 2, 1]))
+>>> e = d.compress_by_ragged_indexed(i)
+>>> e.get_compression_type()
+'ragged indexed'
+>>> e.compressed_array.shape
+(6,)
+
+        '''
+        compression_type = 'indexed ragged array'
+
+        index, element, count = self._parse_ragged_index(
+            index_variable, compression_type)
+
+        array = self.array
+        select = numpy.arange(self.shape[1]) < count[:, numpy.newaxis]
+        self._check_omitted_are_missing(
+            numpy.ma.getmaskarray(array)[~select], compression_type)
+
+        out = self.copy(array=False)
+        out._set_Array(
+            RaggedIndexedArray(compressed_array=NumpyArray(array[index, element]),
+                               shape=self.shape, size=self.size,
+                               ndim=self.ndim,
+                               index_variable=index_variable),
+            copy=False)
+
+        out.nc_clear_hdf5_chunksizes()
+
+        return out
+    #--- End: def
+
+    def compress_by_ragged_indexed_contiguous(self, count_variable,
+                                              index_variable):
+        '''Compress the data by an indexed contiguous ragged array.
+
+The first dimension is the instance dimension, the second is the
+profile dimension and the third is the element dimension. Each
+profile is stored in a contiguous block of a single sample dimension,
+whose size is given by the count variable, and the index variable
+gives the instance of each profile. The profiles of each instance are
+taken in order from the start of its profile dimension. All elements
+which are not in a profile must be missing values.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `compress_by_ragged_contiguous`,
+             `compress_by_ragged_indexed`, `get_count`, `get_index`
+
+:Parameters:
+
+    count_variable: `Count`
+        The count variable, whose data are the number of elements in
+        each profile.
+
+    index_variable: `Index`
+        The index variable, whose data are the instance of each
+        profile.
+
+:Returns:
+
+    `Data`
+        The compressed data.
+
+**Examples:**
+
+>>> d.shape
+(2, 3, 4)
+>>> c = cfdm.Count(data=cfdm.Data([4, 1, 3]))
+>>> i = cfdm.Index(data=cfdm.Data([0, 1, 0]))
+>>> e = d.compress_by_ragged_indexed_contiguous(c, i)
+>>> e.get_compression_type()
+'ragged indexed contiguous'
+>>> e.compressed_array.shape
+(8,)
+
+        '''
+        compression_type = 'indexed contiguous ragged array'
+
+        if self.ndim < 3:
+            raise ValueError(
+"Can't compress by {}: Data must have at least three dimensions".format(
+    compression_type))
+
+        index, profile, _ = self._parse_ragged_index(index_variable,
+                                                     compression_type)
+
+        count = numpy.array(count_variable.get_data().array,
+                            dtype=int).flatten()
+        if count.size != index.size:
+            raise ValueError(
+"Can't compress by {}: Count and index variables must have the same size".format(
+    compression_type))
+
+        if count.size and (count.min() < 0 or count.max() > self.shape[2]):
+            raise ValueError(
+"Can't compress by {}: Counts must lie between 0 and {}".format(
+    compression_type, self.shape[2]))
+
+        # Find the instance, profile and element of each sample
+        starts = numpy.cumsum(count) - count
+        instances = numpy.repeat(index, count)
+        profiles = numpy.repeat(profile, count)
+        elements = numpy.arange(instances.size) - numpy.repeat(starts, count)
+
+        array = self.array
+        select = numpy.zeros(self.shape[:3], dtype=bool)
+        select[instances, profiles, elements] = True
+        self._check_omitted_are_missing(
+            numpy.ma.getmaskarray(array)[~select], compression_type)
+
+        out = self.copy(array=False)
+        out._set_Array(
+            RaggedIndexedContiguousArray(
+                compressed_array=NumpyArray(array[instances, profiles,
+                                                  elements]),
+                shape=self.shape, size=self.size, ndim=self.ndim,
+                count_variable=count_variable,
+                index_variable=index_variable),
+            copy=False)
+
+        out.nc_clear_hdf5_chunksizes()
+
+        return out
+    #--- End: def
+
+    def _parse_ragged_count(self, count_variable, compression_type):
+        '''Return the counts of a count variable for each instance.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    count_variable: `Count`
+
+    compression_type: `str`
+        The type of compression, used in error messages.
+
+:Returns:
+
+    `numpy.ndarray`
+        The number of elements in each instance.
+
+        '''
+        if self.ndim < 2:
+            raise ValueError(
+"Can't compress by {}: Data must have at least two dimensions".format(
+    compression_type))
+
+        count = numpy.array(count_variable.get_data().array,
+                            dtype=int).flatten()
+        if count.size != self.shape[0]:
+            raise ValueError(
+"Can't compress by {}: Count variable must have size {}".format(
+    compression_type, self.shape[0]))
+
+        if count.size and (count.min() < 0 or count.max() > self.shape[1]):
+            raise ValueError(
+"Can't compress by {}: Counts must lie between 0 and {}".format(
+    compression_type, self.shape[1]))
+
+        return count
+    #--- End: def
+
+    def _parse_ragged_index(self, index_variable, compression_type):
+        '''Return the instance and element position of each index.
+
+An index's element position is the number of earlier indices with
+the same instance.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    index_variable: `Index`
+
+    compression_type: `str`
+        The type of compression, used in error messages.
+
+:Returns:
+
+    `numpy.ndarray`, `numpy.ndarray`, `numpy.ndarray`
+        The instance of each index, the element position of each
+        index, and the number of indices for each instance.
+
+**Examples:**
+
+>>> d._parse_ragged_index(cfdm.Index(data=cfdm.Data([0, 1, 1, 0, 2])),
+...                       'indexed ragged array')
+(array([0, 1, 1, 0, 2]), array([0, 0, 1, 1, 0]), array([2, 2, 1]))
+
+        '''
+        if self.ndim < 2:
+            raise ValueError(
+"Can't compress by {}: Data must have at least two dimensions".format(
+    compression_type))
+
+        n_instances = self.shape[0]
+
+        index = numpy.array(index_variable.get_data().array,
+                            dtype=int).flatten()
+        if index.size and (index.min() < 0 or index.max() >= n_instances):
+            raise ValueError(
+"Can't compress by {}: Indices must lie between 0 and {}".format(
+    compression_type, n_instances - 1))
+
+        count = numpy.bincount(index, minlength=n_instances)
+        if count.size and count.max() > self.shape[1]:
+            raise ValueError(
+"Can't compress by {}: Too many indices for instance {}".format(
+    compression_type, count.argmax()))
+
+        order = numpy.argsort(index, kind='mergesort')
+        starts = numpy.cumsum(count) - count
+
+        element = numpy.empty_like(index)
+        element[order] = numpy.arange(index.size) - starts[index[order]]
+
+        return index, element, count
+    #--- End: def
 
     def get_count(self, default=ValueError()):
         '''Return the countcount_va variable for a compressed array.
@@ -823,6 +1597,49 @@ data array shape.
                                  self.__class__.__name__))
     #--- End: def
 
+    def get_feature_shapes(self, default=ValueError()):
+        '''Return the unpadded shape of each feature of a ragged array.
+
+For data compressed by a ragged array, the first dimension is the
+instance dimension, and the uncompressed data of each feature (i.e.
+instance) is padded with missing values to the sizes of the other
+dimensions.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `get_count`, `get_index`
+
+:Parameters:
+
+    default: optional
+        Return the value of the *default* parameter if the data is not
+        compressed by a ragged array. If set to an `Exception`
+        instance then it will be raised instead.
+
+:Returns:
+
+    `list` of `tuple`
+        For each feature, the sizes of the dimensions other than the
+        instance dimension that contain its elements.
+
+**Examples:**
+
+>>> d.get_compression_type()
+'ragged contiguous'
+>>> d.shape
+(4, 9)
+>>> d.get_feature_shapes()
+[(3,), (7,), (5,), (9,)]
+
+        '''
+        try:
+            return self._get_Array().get_feature_shapes()
+        except (AttributeError, ValueError):
+            return self._default(default,
+                                 "{!r} is not compressed by a ragged array".format(
+                                 self.__class__.__name__))
+    #--- End: def
+
     def get_list(self, default=ValueError()):
         '''Return the list variable for a compressed array.
 
@@ -997,7 +1814,10 @@ array.
 
 Missing data array elements are omitted from the calculation.
 
-.. seealso:: `min`
+The maximum of the whole array is found once, and is then reused
+until the data are changed (see `statistics`).
+
+.. seealso:: `min`, `statistics`
 
 :Parameters:
 
@@ -1017,8 +1837,20 @@ Missing data array elements are omitted from the calculation.
         except ValueError as error:
             raise ValueError("Can't find maximum of data: {}".format(error))
         
-        array = self.array
-        array = numpy.amax(array, axis=axes, keepdims=True)
+        if axes is None or len(axes) == self.ndim:
+            # The maximum of all of the data is cached with the
+            # underlying array
+            value = self._array_statistics(self._get_Array(),
+                                           names=('maximum',))['maximum']
+            if value is numpy.ma.masked:
+                array = numpy.ma.masked_all((1,) * self.ndim,
+                                            dtype=self.dtype)
+            else:
+                array = numpy.full((1,) * self.ndim, value,
+                                   dtype=self.dtype)
+        else:
+            array = self.array
+            array = numpy.amax(array, axis=axes, keepdims=True)
 
         out = self.copy(array=False)
         out._set_Array(array, copy=False)
@@ -1035,7 +1867,10 @@ Missing data array elements are omitted from the calculation.
 
 Missing data array elements are omitted from the calculation.
 
-.. seealso:: `max`
+The minimum of the whole array is found once, and is then reused
+until the data are changed (see `statistics`).
+
+.. seealso:: `max`, `statistics`
 
 :Parameters:
 
@@ -1055,8 +1890,20 @@ Missing data array elements are omitted from the calculation.
         except ValueError as error:
             raise ValueError("Can't find minimum of data: {}".format(error))
 
-        array = self.array
-        array = numpy.amin(array, axis=axes, keepdims=True)
+        if axes is None or len(axes) == self.ndim:
+            # The minimum of all of the data is cached with the
+            # underlying array
+            value = self._array_statistics(self._get_Array(),
+                                           names=('minimum',))['minimum']
+            if value is numpy.ma.masked:
+                array = numpy.ma.masked_all((1,) * self.ndim,
+                                            dtype=self.dtype)
+            else:
+                array = numpy.full((1,) * self.ndim, value,
+                                   dtype=self.dtype)
+        else:
+            array = self.array
+            array = numpy.amin(array, axis=axes, keepdims=True)
 
         out = self.copy(array=False)
         out._set_Array(array, copy=False)
@@ -1178,10 +2025,8 @@ selected with the keyword arguments.
         if not axes:
             return out
 
-        array = self.array
-        array = numpy.squeeze(array, axes)
-
-        out._set_Array(array, copy=False)
+        source_axes = [i for i in range(out.ndim) if i not in axes]
+        out._set_Array(self._view_Array(source_axes), copy=False)
 
         # Delete hdf5 chunksizes
         out.nc_clear_hdf5_chunksizes()
@@ -1189,6 +2034,44 @@ selected with the keyword arguments.
         return out
     #--- End: def
 
+    def statistics(self):
+        '''Return summary statistics of the data values.
+
+Missing data array elements are omitted from the minimum and maximum,
+which are masked if all of the data are missing.
+
+The statistics are found together in a single pass through the data,
+which is read in blocks so that it need not all be in memory at
+once. They are then stored with the underlying array, so they are
+shared by copies of the data and are recalculated only after the data
+have been changed.
+
+A minimum and maximum may also have been provided by the
+"actual_range" netCDF attribute of a dataset that was read with the
+*trust_actual_range* parameter of `cfdm.read`.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `max`, `min`
+
+:Returns:
+
+    `dict`
+        The minimum (``'minimum'``) and maximum (``'maximum'``) of the
+        non-missing values, the number of non-missing values
+        (``'count'``), and the number of missing values
+        (``'count_masked'``).
+
+**Examples:**
+
+>>> d = cfdm.Data(numpy.ma.array([1, 2, 3, 4], mask=[0, 1, 0, 0]))
+>>> d.statistics()
+{'minimum': 1, 'maximum': 4, 'count': 3, 'count_masked': 1}
+
+        '''
+        return self._array_statistics(self._get_Array()).copy()
+    #--- End: def
+
     def sum(self, axes=None):
         '''Return the sum of an array or the sum along axes.
 
@@ -1289,10 +2172,7 @@ Missing data array elements are omitted from the calculation.
         if axes == tuple(range(ndim)):
             return out
         
-        array = self.array
-        array = numpy.transpose(array, axes=axes)
-
-        out._set_Array(array, copy=False)
+        out._set_Array(self._view_Array(axes), copy=False)
 
         # Delete hdf5 chunksizes
         out.nc_clear_hdf5_chunksizes()
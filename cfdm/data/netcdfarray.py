@@ -127,12 +127,24 @@ indexing (given the restrictions on the type of indices allowed) is:
                                                  #    getattr(self, 'ragged', 0)):
             if array.dtype.kind == 'U':
                 array = array.astype('S')
-            
-            array = netCDF4.chartostring(array)
-            shape = array.shape
-#            array.resize((array.size,))
-            array = numpy.array([x.rstrip() for x in array.flat], dtype='S') #array.dtype)
-            array = numpy.reshape(array, shape)
+
+            # Concatenate the characters by viewing each row of the
+            # contiguous character array as a single fixed-width
+            # string, and then strip trailing white space.
+            shape = array.shape[:-1]
+            strlen = array.shape[-1]
+            array = numpy.ascontiguousarray(
+                numpy.ma.filled(array, fill_value=b''), dtype='S1')
+            array = array.view('S{}'.format(strlen)).reshape(shape)
+            array = numpy.char.rstrip(array)
+
+            # Reduce the string length to that of the longest string
+            if array.size:
+                strlen = max(int(numpy.char.str_len(array).max()), 1)
+            else:
+                strlen = 1
+
+            array = array.astype('S{}'.format(strlen))
             array = numpy.ma.masked_where(array==b'', array)
 
 #            array.set_fill_value('')
@@ -185,6 +197,21 @@ x.__str__() <==> str(x)
                                                name, self.shape)
     #--- End: def
 
+    def __getstate__(self):
+        '''Return the state for pickling.
+
+Any open `netCDF4.Dataset` is excluded, so that the array is pickled
+by reference to its file and variable, without its data.
+
+.. versionadded:: 1.7.3
+
+        '''
+        state = self.__dict__.copy()
+        state['_netcdf'] = None
+        state['_close'] = True
+        return (state, {'_components': self._components})
+    #--- End: def
+
     # ----------------------------------------------------------------
     # Attributes
     # ----------------------------------------------------------------
@@ -78,13 +78,16 @@ indexing (given the restrictions on the type of indices allowed) is:
 
         '''
         # ------------------------------------------------------------
-        # Method: Uncompress the entire array and then subspace it
+        # Method: Uncompress the selected instances and then subspace
+        #         them
         # ------------------------------------------------------------
-        
         compressed_array = self._get_compressed_Array()
 
-        # Initialise the un-sliced uncompressed array
-        uarray = numpy.ma.masked_all(self.shape, dtype=self.dtype)
+        instances, indices = self._parse_instance_indices(indices)
+
+        # Initialise the uncompressed array of the selected instances
+        uarray = numpy.ma.masked_all((instances.size,) + self.shape[1:],
+                                     dtype=self.dtype)
 
         # --------------------------------------------------------
         # Compression by contiguous ragged array
@@ -92,23 +95,79 @@ indexing (given the restrictions on the type of indices allowed) is:
         # The uncompressed array has dimensions (instance
         # dimension, element dimension).
         # --------------------------------------------------------
+        counts, starts = self._get_feature_layout()
+
+        for u, i in enumerate(instances):
+            n = counts[i]
+            if not n:
+                continue
 
-        count_array = self.get_count().data.array
-        
-        start = 0 
-        for i, n in enumerate(count_array):
-            n = int(n)
-            sample_indices = slice(start, start + n)
-            
-            u_indices = (i,
-                         slice(0, sample_indices.stop - sample_indices.start))
-            
-            uarray[u_indices] = compressed_array[(sample_indices,)]
-            
-            start += n
+            start = starts[i]
+            uarray[u, :n] = compressed_array[(slice(start, start + n),)]
         #--- End: for
 
         return self.get_subspace(uarray, indices, copy=True)
     #--- End: def
 
+    # ----------------------------------------------------------------
+    # Private methods
+    # ----------------------------------------------------------------
+    def _get_feature_layout(self):
+        '''Return the location of each instance in the sample dimension.
+
+The layout is calculated from the count variable once, and then
+cached.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `numpy.ndarray`, `numpy.ndarray`
+        The number of elements in each instance, and the position in
+        the sample dimension of each instance's first element.
+
+**Examples:**
+
+>>> a.get_count().data.array
+array([3, 7, 5, 9])
+>>> a._get_feature_layout()
+(array([3, 7, 5, 9]), array([ 0,  3, 10, 15]))
+
+        '''
+        layout = getattr(self, '_feature_layout', None)
+        if layout is None:
+            counts = numpy.array(self.get_count().data.array, dtype=int)
+            starts = numpy.cumsum(counts) - counts
+            layout = (counts, starts)
+            self._feature_layout = layout
+
+        return layout
+    #--- End: def
+
+    # ----------------------------------------------------------------
+    # Methods
+    # ----------------------------------------------------------------
+    def get_feature_shapes(self):
+        '''Return the uncompressed shape of each instance, without padding.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `list` of `tuple`
+        For each instance, the sizes of the uncompressed dimensions
+        other than the instance dimension that contain its elements.
+
+**Examples:**
+
+>>> a.shape
+(4, 9)
+>>> a.get_feature_shapes()
+[(3,), (7,), (5,), (9,)]
+
+        '''
+        counts, _ = self._get_feature_layout()
+        return [(int(n),) for n in counts]
+    #--- End: def
+
 #--- End: class
@@ -4,6 +4,7 @@ import numpy
 
 from . import abstract
 from . import mixin
+from . import NumpyArray
 
 class RaggedIndexedArray(mixin.RaggedIndexed,
                          abstract.CompressedArray):
@@ -76,13 +77,16 @@ indexing (given the restrictions on the type of indices allowed) is:
 
         '''
         # ------------------------------------------------------------
-        # Method: Uncompress the entire array and then subspace it
+        # Method: Uncompress the selected instances and then subspace
+        #         them
         # ------------------------------------------------------------
-        
         compressed_array = self._get_compressed_Array()
 
-        # Initialise the un-sliced uncompressed array
-        uarray = numpy.ma.masked_all(self.shape, dtype=self.dtype)
+        instances, indices = self._parse_instance_indices(indices)
+
+        # Initialise the uncompressed array of the selected instances
+        uarray = numpy.ma.masked_all((instances.size,) + self.shape[1:],
+                                     dtype=self.dtype)
 
         # --------------------------------------------------------
         # Compression by indexed ragged array.
@@ -90,18 +94,84 @@ indexing (given the restrictions on the type of indices allowed) is:
         # The uncompressed array has dimensions (instance
         # dimension, element dimension).
         # --------------------------------------------------------
-        index_array = self.get_index().data.array
-        
-        for i in range(uarray.shape[0]):
-            sample_dimension_indices = numpy.where(index_array == i)[0]
-
-            u_indices = (i, #slice(i, i+1),
-                         slice(0, len(sample_dimension_indices)))
-            
-            uarray[u_indices] = compressed_array[(sample_dimension_indices,)]
+        order, counts, starts = self._get_feature_layout()
+
+        for u, i in enumerate(instances):
+            n = counts[i]
+            if not n:
+                continue
+
+            start = starts[i]
+            sample_dimension_indices = order[start:start + n]
+            uarray[u, :n] = compressed_array[(sample_dimension_indices,)]
         #--- End: for
 
         return self.get_subspace(uarray, indices, copy=True)
     #--- End: def
 
+    # ----------------------------------------------------------------
+    # Private methods
+    # ----------------------------------------------------------------
+    def _get_feature_layout(self):
+        '''Return the locations of each instance in the sample dimension.
+
+The layout is calculated from the index variable once, and then
+cached.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `numpy.ndarray`, `numpy.ndarray`, `numpy.ndarray`
+        The positions in the sample dimension ordered by instance; the
+        number of elements in each instance; and the position in the
+        first array of each instance's first element. The positions of
+        each instance's elements are in increasing order.
+
+**Examples:**
+
+>>> a.get_index().data.array
+array([1, 0, 1, 2, 0])
+>>> a._get_feature_layout()
+(array([1, 4, 0, 2, 3]), array([2, 2, 1]), array([0, 2, 4]))
+
+        '''
+        layout = getattr(self, '_feature_layout', None)
+        if layout is None:
+            index = numpy.array(self.get_index().data.array, dtype=int)
+            order = numpy.argsort(index, kind='mergesort')
+            counts = numpy.bincount(index, minlength=self.shape[0])
+            starts = numpy.cumsum(counts) - counts
+            layout = (order, counts, starts)
+            self._feature_layout = layout
+
+        return layout
+    #--- End: def
+
+    # ----------------------------------------------------------------
+    # Methods
+    # ----------------------------------------------------------------
+    def get_feature_shapes(self):
+        '''Return the uncompressed shape of each instance, without padding.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `list` of `tuple`
+        For each instance, the sizes of the uncompressed dimensions
+        other than the instance dimension that contain its elements.
+
+**Examples:**
+
+>>> a.shape
+(3, 2)
+>>> a.get_feature_shapes()
+[(2,), (2,), (1,)]
+
+        '''
+        _, counts, _ = self._get_feature_layout()
+        return [(int(n),) for n in counts]
+    #--- End: def
+
 #--- End: class
@@ -4,6 +4,7 @@ import numpy
 
 from . import abstract
 from . import mixin
+from . import NumpyArray
 
 
 class RaggedIndexedContiguousArray(mixin.RaggedContiguous,
@@ -86,55 +87,111 @@ indexing (given the restrictions on the type of indices allowed) is:
 
         '''
         # ------------------------------------------------------------
-        # Method: Uncompress the entire array and then subspace it
+        # Method: Uncompress the selected instances and then subspace
+        #         them
         # ------------------------------------------------------------
-        
         compressed_array = self._get_compressed_Array()
 
-        # Initialise the un-sliced uncompressed array
-        uarray = numpy.ma.masked_all(self.shape, dtype=self.dtype)
-
-        count_array = self.get_count().data.array
-        index_array = self.get_index().data.array
-        
-        # Loop over instances
-        for i in range(uarray.shape[0]):
-            
-            # For all of the profiles in ths instance, find the
-            # locations in the count array of the number of elements
-            # in the profile
-            xprofile_indices = numpy.where(index_array == i)[0]
-                
-            # Find the number of profiles in this instance
-            n_profiles = xprofile_indices.size
-            
-            # Loop over profiles in this instance
-            for j in range(uarray.shape[1]):
-                if j >= n_profiles:
+        instances, indices = self._parse_instance_indices(indices)
+
+        # Initialise the uncompressed array of the selected instances
+        uarray = numpy.ma.masked_all((instances.size,) + self.shape[1:],
+                                     dtype=self.dtype)
+
+        profiles, counts, starts = self._get_feature_layout()
+
+        # Loop over the selected instances
+        for u, i in enumerate(instances):
+            # Loop over the profiles in this instance, each of which
+            # is a contiguous block of the sample dimension
+            for j, profile in enumerate(profiles[i][:uarray.shape[1]]):
+                n = counts[profile]
+                if not n:
                     continue
-                
-                # Find the location in the count array of the number
-                # of elements in this profile
-                profile_index = xprofile_indices[j]
-                
-                if profile_index == 0:
-                    start = 0
-                else:                    
-                    start = int(count_array[:profile_index].sum())
-                    
-                stop = start + int(count_array[profile_index])
-                
-                sample_indices = slice(start, stop)
-                
-                u_indices = (i, #slice(i, i+1),
-                             j, #slice(j, j+1), 
-                             slice(0, stop-start)) #slice(0, sample_indices.stop - sample_indices.start))
-                
-                uarray[u_indices] = compressed_array[(sample_indices,)]
+
+                start = starts[profile]
+                uarray[u, j, :n] = compressed_array[(slice(start, start + n),)]
             #--- End: for
         #--- End: for
 
         return self.get_subspace(uarray, indices, copy=True)
     #--- End: def
-    
+
+    # ----------------------------------------------------------------
+    # Private methods
+    # ----------------------------------------------------------------
+    def _get_feature_layout(self):
+        '''Return the locations of each instance in the sample dimension.
+
+The layout is calculated from the count and index variables once, and
+then cached.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `list`, `numpy.ndarray`, `numpy.ndarray`
+        For each instance, the positions in the count variable of its
+        profiles; the number of elements in each profile; and the
+        position in the sample dimension of each profile's first
+        element.
+
+**Examples:**
+
+>>> a.get_count().data.array
+array([3, 7, 5])
+>>> a.get_index().data.array
+array([1, 0, 1])
+>>> a._get_feature_layout()
+([array([1]), array([0, 2])], array([3, 7, 5]), array([ 0,  3, 10]))
+
+        '''
+        layout = getattr(self, '_feature_layout', None)
+        if layout is None:
+            counts = numpy.array(self.get_count().data.array, dtype=int)
+            starts = numpy.cumsum(counts) - counts
+
+            index = numpy.array(self.get_index().data.array, dtype=int)
+            order = numpy.argsort(index, kind='mergesort')
+            n_profiles = numpy.bincount(index, minlength=self.shape[0])
+            profile_starts = numpy.cumsum(n_profiles) - n_profiles
+            profiles = [order[start:start + n]
+                        for start, n in zip(profile_starts, n_profiles)]
+
+            layout = (profiles, counts, starts)
+            self._feature_layout = layout
+
+        return layout
+    #--- End: def
+
+    # ----------------------------------------------------------------
+    # Methods
+    # ----------------------------------------------------------------
+    def get_feature_shapes(self):
+        '''Return the uncompressed shape of each instance, without padding.
+
+The element dimension of an instance is only padded up to the size of
+its largest profile.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `list` of `tuple`
+        For each instance, the sizes of the uncompressed dimensions
+        other than the instance dimension that contain its elements.
+
+**Examples:**
+
+>>> a.shape
+(2, 2, 7)
+>>> a.get_feature_shapes()
+[(1, 7), (2, 5)]
+
+        '''
+        profiles, counts, _ = self._get_feature_layout()
+        return [(int(p.size), int(counts[p].max()) if p.size else 0)
+                for p in profiles]
+    #--- End: def
+
 #--- End: class
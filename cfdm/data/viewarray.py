@@ -0,0 +1,377 @@
+from builtins import (range, super)
+
+import numpy
+
+from . import abstract
+
+
+class ViewArray(abstract.Array):
+    '''A view of an underlying array with rearranged dimensions.
+
+The dimensions of the underlying array may be permuted, size one
+dimensions may be removed, and new size one dimensions may be
+inserted. None of the underlying array's values are read or moved
+until they are requested by indexing the view, and then only those
+values which are required are read.
+
+.. versionadded:: 1.7.3
+
+**Examples:**
+
+>>> a = cfdm.NetCDFArray(filename='file.nc', ncvar='tas', dtype=v.dtype,
+...                      ndim=3, shape=(1, 73, 96), size=7008)
+>>> v = cfdm.ViewArray(a, source_axes=(2, None, 1))
+>>> v.shape
+(96, 1, 73)
+
+    '''
+    def __init__(self, array=None, source_axes=None):
+        '''**Initialization**
+
+:Parameters:
+
+    array: subclass of `Array`
+        The underlying array.
+
+    source_axes: sequence of `int` or `None`
+        For each dimension of the view, the position of the
+        corresponding dimension of the underlying array, or `None` if
+        the dimension is a new size one dimension. Dimensions of the
+        underlying array which are not included must have size one,
+        and are removed.
+
+        *Parameter example:*
+          ``source_axes=(1, 0)``
+
+        *Parameter example:*
+          ``source_axes=(None, 0, 1)``
+
+        '''
+        if isinstance(array, ViewArray):
+            # Compose with the existing view, so that views never
+            # wrap other views
+            outer = array.get_source_axes()
+            source_axes = [outer[i] if i is not None else None
+                           for i in source_axes]
+            array = array.get_array()
+        #--- End: if
+
+        source_axes = tuple(source_axes)
+
+        shape = array.shape
+        for i, n in enumerate(shape):
+            if n != 1 and i not in source_axes:
+                raise ValueError(
+"Can't create view: Can't remove dimension {} of size {}".format(i, n))
+        #--- End: for
+
+        super().__init__(array=array, source_axes=source_axes)
+
+        self._set_component(
+            'shape',
+            tuple([shape[i] if i is not None else 1 for i in source_axes]),
+            copy=False)
+    #--- End: def
+
+    def __getitem__(self, indices):
+        '''x.__getitem__(indices) <==> x[indices]
+
+Returns a subspace of the array as an independent numpy array.
+
+Only the values of the underlying array which are selected by the
+indices are read.
+
+The indices that define the subspace must be either `Ellipsis` or a
+sequence that contains an index for each dimension. In the latter
+case, each dimension's index must either be a `slice` object or a
+sequence of two or more integers.
+
+Indexing is similar to numpy indexing. The only difference to numpy
+indexing (given the restrictions on the type of indices allowed) is:
+
+  * When two or more dimension's indices are sequences of integers
+    then these indices work independently along each dimension
+    (similar to the way vector subscripts work in Fortran).
+
+.. versionadded:: 1.7.3
+
+        '''
+        source_axes = self.get_source_axes()
+        underlying = self.get_array()
+        source_ndim = underlying.ndim
+
+        if indices is Ellipsis:
+            indices = (slice(None),) * len(source_axes)
+
+        # Map the indices of the view to the dimensions of the
+        # underlying array
+        source_indices = [slice(None)] * source_ndim
+        for index, i in zip(indices, source_axes):
+            if i is not None:
+                source_indices[i] = index
+        #--- End: for
+
+        if source_ndim:
+            array = underlying[tuple(source_indices)]
+        else:
+            array = underlying[...]
+
+        array = self.rearrange(array, source_axes)
+
+        # Apply the indices of the new size one dimensions
+        if None in source_axes:
+            new_indices = [index if i is None else slice(None)
+                           for index, i in zip(indices, source_axes)]
+            array = self.get_subspace(array, new_indices, copy=False)
+        #--- End: if
+
+        return array
+    #--- End: def
+
+    # ----------------------------------------------------------------
+    # Attributes
+    # ----------------------------------------------------------------
+    @property
+    def array(self):
+        '''Return an independent numpy array containing the data.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `numpy.ndarray`
+        An independent numpy array of the data.
+
+**Examples:**
+
+>>> n = numpy.asanyarray(a)
+>>> isinstance(n, numpy.ndarray)
+True
+
+        '''
+        return self[...]
+    #--- End: def
+
+    @property
+    def dtype(self):
+        '''Data-type of the data elements.
+
+.. versionadded:: 1.7.3
+
+**Examples:**
+
+>>> a.dtype
+dtype('float64')
+>>> print(type(a.dtype))
+<type 'numpy.dtype'>
+
+        '''
+        return self.get_array().dtype
+    #--- End: def
+
+    @property
+    def ndim(self):
+        '''Number of array dimensions
+
+.. versionadded:: 1.7.3
+
+**Examples:**
+
+>>> a.shape
+(73, 96)
+>>> a.ndim
+2
+>>> a.size
+7008
+
+>>> a.shape
+(1, 1, 1)
+>>> a.ndim
+3
+>>> a.size
+1
+
+>>> a.shape
+()
+>>> a.ndim
+0
+>>> a.size
+1
+
+        '''
+        return len(self._get_component('shape'))
+    #--- End: def
+
+    @property
+    def shape(self):
+        '''Tuple of array dimension sizes.
+
+.. versionadded:: 1.7.3
+
+**Examples:**
+
+>>> a.shape
+(73, 96)
+>>> a.ndim
+2
+>>> a.size
+7008
+
+>>> a.shape
+(1, 1, 1)
+>>> a.ndim
+3
+>>> a.size
+1
+
+>>> a.shape
+()
+>>> a.ndim
+0
+>>> a.size
+1
+
+        '''
+        return self._get_component('shape')
+    #--- End: def
+
+    @property
+    def size(self):
+        '''Number of elements in the array.
+
+.. versionadded:: 1.7.3
+
+**Examples:**
+
+>>> a.shape
+(73, 96)
+>>> a.size
+7008
+>>> a.ndim
+2
+
+>>> a.shape
+(1, 1, 1)
+>>> a.ndim
+3
+>>> a.size
+1
+
+>>> a.shape
+()
+>>> a.ndim
+0
+>>> a.size
+1
+
+        '''
+        return self.get_array().size
+    #--- End: def
+
+    # ----------------------------------------------------------------
+    # Methods
+    # ----------------------------------------------------------------
+    @classmethod
+    def rearrange(cls, array, source_axes):
+        '''Rearrange the dimensions of a numpy array.
+
+Dimensions are removed, permuted and inserted in the same way as for
+a view of an underlying array. Where possible, the returned array is a
+view of the input array, rather than a copy.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    array: `numpy.ndarray`
+        The array to be rearranged.
+
+    source_axes: sequence of `int` or `None`
+        For each dimension of the returned array, the position of the
+        corresponding dimension of the input array, or `None` if the
+        dimension is a new size one dimension. Dimensions of the input
+        array which are not included must have size one, and are
+        removed.
+
+:Returns:
+
+    `numpy.ndarray`
+        The rearranged array.
+
+**Examples:**
+
+>>> a = numpy.arange(6).reshape(1, 2, 3)
+>>> cfdm.ViewArray.rearrange(a, (2, None, 1)).shape
+(3, 1, 2)
+
+        '''
+        ndim = array.ndim
+
+        # Remove size one dimensions
+        removed = tuple([i for i in range(ndim) if i not in source_axes])
+        if removed:
+            array = numpy.squeeze(array, axis=removed)
+
+        # Permute the remaining dimensions
+        remaining = [i for i in range(ndim) if i not in removed]
+        order = [remaining.index(i) for i in source_axes if i is not None]
+        if order != sorted(order):
+            array = array.transpose(order)
+
+        # Insert new size one dimensions
+        if None in source_axes:
+            array = array[tuple([numpy.newaxis if i is None else slice(None)
+                                 for i in source_axes])]
+
+        return array
+    #--- End: def
+
+    def get_array(self):
+        '''Return the underlying array.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `get_source_axes`
+
+:Returns:
+
+    subclass of `Array`
+        The underlying array.
+
+**Examples:**
+
+>>> a.get_array()
+<NetCDFArray: file=file.nc variable=tas shape=(1, 73, 96)>
+
+        '''
+        return self._get_component('array')
+    #--- End: def
+
+    def get_source_axes(self):
+        '''Return the dimensions of the underlying array spanned by the view.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `get_array`
+
+:Returns:
+
+    `tuple`
+        For each dimension of the view, the position of the
+        corresponding dimension of the underlying array, or `None` if
+        the dimension is a new size one dimension.
+
+**Examples:**
+
+>>> a.get_array().shape
+(1, 73, 96)
+>>> a.shape
+(96, 1, 73)
+>>> a.get_source_axes()
+(2, None, 1)
+
+        '''
+        return self._get_component('source_axes')
+    #--- End: def
+
+#--- End: class
@@ -22,5 +22,7 @@ of the dimension and auxiliary coordinate constructs referenced by the
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
 
 #--- End: class
@@ -1,6 +1,9 @@
 from __future__ import absolute_import
 from builtins import super
 
+import numpy
+import netCDF4
+
 from . import mixin
 from . import core
 
@@ -91,6 +94,267 @@ The netCDF variable name of the construct may be accessed with the
         self._initialise_netcdf(source)
     #--- End: def
 
+    def _monotonic_values(self):
+        '''Return the coordinate values in increasing order.
+
+The values are read from the data once, and then cached with its
+underlying array, so that the cache is shared by copies of the
+construct and is discarded when the data are changed.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `_monotonic_bounds`, `direction`
+
+:Returns:
+
+    `numpy.ndarray`, `bool`
+        The coordinate values in increasing order, and whether the
+        coordinates are increasing.
+
+**Examples:**
+
+>>> print(d.array)
+[30. 20. 10.]
+>>> d._monotonic_values()
+(array([10., 20., 30.]), False)
+
+        '''
+        array = self.get_data()._get_Array()
+
+        cached = getattr(array, '_monotonic_values', None)
+        if cached is None:
+            values = numpy.array(array.array).flatten()
+
+            increasing = True
+            if values.size > 1:
+                diff = numpy.diff(values)
+                if (diff < 0).all():
+                    increasing = False
+                    values = values[::-1]
+                elif not (diff > 0).all():
+                    raise ValueError(
+"{!r} coordinates are not strictly monotonic".format(self))
+            #--- End: if
+
+            cached = (values, increasing)
+            array._monotonic_values = cached
+        #--- End: if
+
+        return cached
+    #--- End: def
+
+    def _monotonic_bounds(self):
+        '''Return the lower and upper cell bounds in increasing order.
+
+The bounds are read from the bounds data once, and then cached with
+its underlying array, so that the cache is shared by copies of the
+construct and is discarded when the bounds are changed.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `_monotonic_values`, `direction`
+
+:Returns:
+
+    `numpy.ndarray`, `numpy.ndarray`
+        The lower and upper bounds of each cell, in the increasing
+        order of the coordinates.
+
+**Examples:**
+
+>>> print(d.bounds.array)
+[[35. 25.]
+ [25. 15.]
+ [15.  5.]]
+>>> d._monotonic_bounds()
+(array([ 5., 15., 25.]), array([15., 25., 35.]))
+
+        '''
+        _, increasing = self._monotonic_values()
+
+        array = self.get_bounds().get_data()._get_Array()
+
+        cached = getattr(array, '_monotonic_bounds', None)
+        if cached is None:
+            bounds = numpy.array(array.array)
+            bounds = bounds.reshape(bounds.shape[0], -1)
+            lower = bounds.min(axis=1)
+            upper = bounds.max(axis=1)
+            if not increasing:
+                lower = lower[::-1]
+                upper = upper[::-1]
+
+            if (numpy.diff(lower) < 0).any() or (numpy.diff(upper) < 0).any():
+                raise ValueError(
+"{!r} cell bounds are not monotonic".format(self))
+
+            cached = (lower, upper)
+            array._monotonic_bounds = cached
+        #--- End: if
+
+        return cached
+    #--- End: def
+
+    def direction(self):
+        '''Return the direction of the coordinates.
+
+The direction is found once from the data, and then cached. Data
+with a single value are considered to be increasing.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `bool`
+        True if the coordinates are increasing, or False if they are
+        decreasing.
+
+**Examples:**
+
+>>> print(d.array)
+[ 0. 30. 60. 90.]
+>>> d.direction()
+True
+>>> print(d[::-1].array)
+[90. 60. 30.  0.]
+>>> d[::-1].direction()
+False
+
+        '''
+        return self._monotonic_values()[1]
+    #--- End: def
+
+    def _encode_values(self, values):
+        '''Return values in the units of the coordinates.
+
+Date-time objects are encoded as reference times in the units and
+calendar of the coordinates. Other values are assumed to already be in
+the units of the coordinates and are returned unchanged.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `indices`
+
+:Parameters:
+
+    values: sequence
+        The values.
+
+:Returns:
+
+    `list`
+        The values in the units of the coordinates.
+
+**Examples:**
+
+>>> d.get_data().get_units()
+'days since 2000-01-01'
+>>> d._encode_values([cftime.DatetimeGregorian(2000, 1, 2), 3.5])
+[1.0, 3.5]
+
+        '''
+        out = list(values)
+
+        datetimes = [i for i, value in enumerate(out)
+                     if hasattr(value, 'timetuple')]
+        if not datetimes:
+            return out
+
+        data = self.get_data()
+        units = data.get_units(None)
+        if units is None or 'since' not in units:
+            raise ValueError(
+"Can't encode date-times: {!r} does not have reference time units".format(
+    self))
+
+        encoded = netCDF4.date2num([out[i] for i in datetimes], units,
+                                   calendar=data.get_calendar('standard'))
+        for i, value in zip(datetimes, numpy.ravel(encoded).tolist()):
+            out[i] = value
+
+        return out
+    #--- End: def
+
+    def indices(self, value, overlap=False):
+        '''Return the index range that selects a range of coordinate values.
+
+The range is found by a binary search of the coordinate values, which
+are read once and then cached (see `direction`), so the search time
+grows only logarithmically with the size of the coordinates.
+
+Date-time objects, such as `datetime.datetime` or `cftime.datetime`
+instances, are encoded in the units and calendar of coordinates with
+reference time units, so selecting by date never converts the
+coordinate values to date-times.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `direction`, `Field.indices`
+
+:Parameters:
+
+    value:
+        The range of the coordinate values to select, either a
+        ``(minimum, maximum)`` pair, for an inclusive range, or a
+        single value. Each value is either a number in the units of
+        the coordinates, or a date-time object.
+
+        *Parameter example:*
+          ``value=(30, 60)``
+
+        *Parameter example:*
+          ``value=(datetime.datetime(2000, 1, 1), datetime.datetime(2000, 12, 31))``
+
+    overlap: `bool`, optional
+        If True then select the cells whose bounds overlap the
+        range, rather than the cells whose coordinate values lie
+        within it. The coordinate values are used if there are no
+        bounds.
+
+:Returns:
+
+    `slice`
+        The index range of the selected cells, which is empty if no
+        cells are selected.
+
+**Examples:**
+
+>>> print(d.array)
+[ 0. 30. 60. 90.]
+>>> d.indices((20, 70))
+slice(1, 3, None)
+>>> d.indices(90)
+slice(3, 4, None)
+>>> d[::-1].indices((20, 70))
+slice(1, 3, None)
+
+>>> d.get_data().get_units()
+'hours since 2000-01-01'
+>>> d.indices(datetime.datetime(2000, 1, 2, 6))
+slice(30, 31, None)
+
+        '''
+        if numpy.ndim(value) or isinstance(value, (tuple, list)):
+            minimum, maximum = self._encode_values(value)
+        else:
+            minimum, = self._encode_values((value,))
+            maximum = minimum
+
+        values, increasing = self._monotonic_values()
+        if overlap and self.has_bounds():
+            lower, upper = self._monotonic_bounds()
+            start = numpy.searchsorted(upper, minimum, side='left')
+            stop  = numpy.searchsorted(lower, maximum, side='right')
+        else:
+            start = numpy.searchsorted(values, minimum, side='left')
+            stop  = numpy.searchsorted(values, maximum, side='right')
+
+        if not increasing:
+            start, stop = values.size - stop, values.size - start
+
+        return slice(int(start), int(max(start, stop)))
+    #--- End: def
+
     def dump(self, display=True, _omit_properties=None, _key=None,
              _level=0, _title=None, _axes=None, _axis_names=None):
         '''A full description of the dimension coordinate construct.
@@ -28,6 +28,8 @@ The netCDF dimension name of the construct may be accessed with the
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
     def __init__(self, size=None, source=None, copy=True):
         '''**Initialization**
 
@@ -66,6 +68,24 @@ x.__str__() <==> str(x)
         return 'size({0})'.format(self.get_size(''))
     #--- End: def
 
+    def _fingerprint_components(self):
+        '''Return the components that define the fingerprint.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `fingerprint`
+
+:Returns:
+
+    `list`
+        The components.
+
+        '''
+        out = super()._fingerprint_components()
+        out.append(self.get_size(None))
+        return out
+    #--- End: def
+
     def equals(self, other, verbose=False, ignore_type=False):
         '''Whether two domain axis constructs are the same.
 
@@ -1,10 +1,16 @@
 from __future__ import print_function
-from builtins import (str, super, zip)
+from builtins import (range, str, super, zip)
+
+import numpy
 
 from . import mixin
 from . import core
 from . import Constructs
+from . import Count
+from . import Data
 from . import Domain
+from . import Index
+from . import List
 
 
 class Field(mixin.NetCDFVariable,
@@ -53,7 +59,11 @@ The netCDF variable name of the construct may be accessed with the
         '''
         instance = super().__new__(cls)
         instance._Constructs = Constructs
+        instance._Count      = Count
+        instance._Data       = Data
         instance._Domain     = Domain
+        instance._Index      = Index
+        instance._List       = List
         return instance
     #--- End: def
 
@@ -236,28 +246,27 @@ rules, the only differences being:
         indices = data._parse_indices(indices)
         indices = tuple(indices)
         
-        new = self.copy() #data=False)
+        # Copy only the metadata. The data of the new field and of its
+        # metadata constructs are created below directly from the
+        # original data, rather than from deep copies of them.
+        new = self.copy(data=False)
 
-        data_axes = new.get_data_axes()
-        
-        # Open any files that contained the original data (this not
-        # necessary, is an optimisation)
+        data_axes = self.get_data_axes()
         
         # ------------------------------------------------------------
         # Subspace the field's data
         # ------------------------------------------------------------
-        new.set_data(data[tuple(indices)], axes=None) #, data_axes)
+        new.set_data(data[indices], axes=None)
 
         # ------------------------------------------------------------
         # Subspace other constructs that contain arrays
         # ------------------------------------------------------------
-        self_constructs = self.constructs
-        new_constructs_data_axes = new.constructs.data_axes()
+        self_constructs_data_axes = self.constructs.data_axes()
         
-        for key, construct in new.constructs.filter_by_data().items():
+        for key, construct in self.constructs.filter_by_data().items():
             needs_slicing = False
             dice = []
-            for axis in new_constructs_data_axes[key]:
+            for axis in self_constructs_data_axes[key]:
                 if axis in data_axes:
                     needs_slicing = True
                     dice.append(indices[data_axes.index(axis)])
@@ -268,6 +277,8 @@ rules, the only differences being:
             if needs_slicing:
                 new_construct = construct[tuple(dice)]
             else:
+                # The construct is unchanged by the subspace. Its
+                # copy shares the original's underlying arrays.
                 new_construct = construct.copy()
                 
             new.set_construct(new_construct, key=key, copy=False)
@@ -288,6 +299,24 @@ rules, the only differences being:
     # ----------------------------------------------------------------
     # Private methods
     # ----------------------------------------------------------------
+    def _fingerprint_components(self):
+        '''Return the components that define the fingerprint.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `fingerprint`
+
+:Returns:
+
+    `list`
+        The components.
+
+        '''
+        out = super()._fingerprint_components()
+        out.append(self.get_data_axes(None))
+        return out
+    #--- End: def
+
     def _one_line_description(self, axis_names_sizes=None):
         '''
         '''
@@ -455,6 +484,356 @@ TODO
         return out
     #--- End: def
 
+    def compress(self, method, axes=None, points=None):
+        '''Compress the field construct.
+
+Compression saves space by identifying and removing unwanted missing
+data. The compressed field construct may be written to a netCDF file
+with `cfdm.write`.
+
+Compression by gathering combines adjacent data axes into a single
+list dimension that contains only the points which are to be kept.
+Metadata constructs whose data span all of the gathered axes, in the
+same order, are also compressed, unless they have non-missing values
+at any of the omitted points.
+
+Compression by ragged array is for discrete sampling geometries. The
+first data axis is the instance dimension and the second is the
+element dimension, with each instance's elements padded with missing
+values at the end. For an indexed contiguous ragged array the second
+data axis is the profile dimension and the third is the element
+dimension. The number of elements in each instance, or each profile,
+is given by its last non-missing value in the data, or in any
+metadata construct which spans the same data axes. Such metadata
+constructs are also compressed.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `data`, `features`
+
+:Parameters:
+
+    method: `str`
+        The compression method. One of:
+
+        ===============================  ===========================
+        *method*                         Description
+        ===============================  ===========================
+        ``'gathered'``                   Compression by gathering.
+
+        ``'ragged contiguous'``          Compression by contiguous
+                                         ragged array.
+
+        ``'ragged indexed'``             Compression by indexed
+                                         ragged array.
+
+        ``'ragged indexed contiguous'``  Compression by indexed
+                                         contiguous ragged array.
+        ===============================  ===========================
+
+    axes: sequence of `int`, optional
+        For compression by gathering, the positions of the data axes
+        to be gathered. They must be adjacent and in increasing
+        order. Ignored for other methods.
+
+        *Parameter example:*
+          ``axes=[1, 2]``
+
+    points: array-like, optional
+        For compression by gathering, the points to keep. Either a
+        boolean array with the shape of the gathered axes that is
+        True where points are to be omitted, or a sequence of the
+        indices of the points to keep, counting in row-major order
+        over the gathered axes. By default the points at which the
+        data has any non-missing values are kept. Ignored for other
+        methods.
+
+        *Parameter example:*
+          ``points=[0, 5, 6, 11]``
+
+:Returns:
+
+    `Field`
+        The compressed field construct.
+
+**Examples:**
+
+>>> f.data.shape
+(2, 3, 4)
+>>> g = f.compress('gathered', axes=[1, 2])
+>>> g.data.get_compression_type()
+'gathered'
+>>> g.data.get_list().data.array
+array([ 0,  1,  2,  5,  7, 11], dtype=int32)
+>>> cfdm.write(g, 'gathered.nc')
+
+>>> f.data.shape
+(4, 9)
+>>> g = f.compress('ragged contiguous')
+>>> g.data.get_count().data.array
+array([3, 7, 5, 9], dtype=int32)
+
+        '''
+        data = self.get_data()
+        data_axes = self.get_data_axes()
+
+        f = self.copy()
+
+        if method == 'gathered':
+            if axes is None:
+                raise ValueError(
+                    "Can't compress by gathering: Must provide axes")
+
+            axes = data._parse_axes(axes)
+            gathered_axes = [data_axes[i] for i in axes]
+            gathered_shape = [data.shape[i] for i in axes]
+
+            if points is None:
+                mask = numpy.ma.getmaskarray(data.array)
+                other = tuple([i for i in range(data.ndim) if i not in axes])
+                points = mask.all(axis=other)
+
+            points = numpy.asanyarray(points)
+            if points.dtype == bool:
+                if list(points.shape) != gathered_shape:
+                    raise ValueError(
+"Can't compress by gathering: Boolean points must have shape {}".format(
+    tuple(gathered_shape)))
+
+                points = numpy.flatnonzero(~points)
+            #--- End: if
+
+            list_variable = self._List(
+                data=self._Data(numpy.array(points, dtype='int32').flatten()))
+
+            def _compress(d, axes):
+                n = len(gathered_axes)
+                for i in range(len(axes) - n + 1):
+                    if list(axes[i:i+n]) == gathered_axes:
+                        try:
+                            return d.compress_by_gathering(
+                                list(range(i, i+n)), list_variable)
+                        except ValueError:
+                            if d is data:
+                                raise
+
+                            # Metadata constructs with non-missing
+                            # values at omitted points are not
+                            # compressed
+                            return None
+                #--- End: for
+
+                return None
+            #--- End: def
+        elif method in ('ragged contiguous', 'ragged indexed'):
+            if data.ndim < 2:
+                raise ValueError(
+"Can't compress by {} array: Data must have at least two dimensions".format(
+    method))
+
+            count = self._element_counts(self._present_elements(2))
+
+            if method == 'ragged contiguous':
+                count_variable = self._Count(
+                    data=self._Data(numpy.array(count, dtype='int32')))
+                count_variable.nc_set_sample_dimension('element')
+
+                def _compress(d, axes):
+                    if list(axes[:2]) == list(data_axes[:2]):
+                        return d.compress_by_ragged_contiguous(count_variable)
+
+                    return None
+                #--- End: def
+            else:
+                index = numpy.repeat(numpy.arange(count.size), count)
+                index_variable = self._Index(
+                    data=self._Data(numpy.array(index, dtype='int32')))
+                index_variable.nc_set_dimension('element')
+
+                def _compress(d, axes):
+                    if list(axes[:2]) == list(data_axes[:2]):
+                        return d.compress_by_ragged_indexed(index_variable)
+
+                    return None
+                #--- End: def
+        elif method == 'ragged indexed contiguous':
+            if data.ndim < 3:
+                raise ValueError(
+"Can't compress by {} array: Data must have at least three dimensions".format(
+    method))
+
+            # Number of elements in each profile of each instance
+            count = self._element_counts(self._present_elements(3))
+
+            # Number of profiles in each instance
+            n_profiles = self._element_counts(self._present_elements(2))
+
+            profiles = (numpy.arange(data.shape[1]) <
+                        n_profiles[:, numpy.newaxis])
+            index = numpy.nonzero(profiles)[0]
+
+            count_variable = self._Count(
+                data=self._Data(numpy.array(count[profiles], dtype='int32')))
+            count_variable.nc_set_dimension('profile')
+            count_variable.nc_set_sample_dimension('element')
+
+            index_variable = self._Index(
+                data=self._Data(numpy.array(index, dtype='int32')))
+            index_variable.nc_set_dimension('profile')
+
+            def _compress(d, axes):
+                if list(axes[:3]) == list(data_axes[:3]):
+                    return d.compress_by_ragged_indexed_contiguous(
+                        count_variable, index_variable)
+
+                if list(axes[:2]) == list(data_axes[:2]):
+                    return d.compress_by_ragged_indexed(index_variable)
+
+                return None
+            #--- End: def
+        else:
+            raise ValueError(
+                "Can't compress: Invalid compression method: {!r}".format(
+                    method))
+
+        # Compress the field's data
+        f.set_data(_compress(data, data_axes), data_axes, copy=False)
+
+        # Compress the metadata constructs which span the compressed
+        # axes
+        for key, construct_axes in f.constructs.data_axes().items():
+            construct = f.constructs[key]
+
+            d = _compress(construct.get_data(), construct_axes)
+            if d is None:
+                continue
+
+            try:
+                bounds = construct.get_bounds(None)
+            except AttributeError:
+                bounds = None
+
+            if bounds is not None:
+                b = _compress(bounds.get_data(), construct_axes)
+                if b is None:
+                    continue
+
+                bounds.set_data(b, copy=False)
+
+            construct.set_data(d, copy=False)
+        #--- End: for
+
+        return f
+    #--- End: def
+
+    @classmethod
+    def _element_counts(cls, present):
+        '''Return the number of elements up to and including the last
+non-missing value.
+
+The counts are found along the last dimension, the element dimension,
+for each combination of the preceding dimensions.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `_present_elements`
+
+:Parameters:
+
+    present: `numpy.ndarray`
+        Boolean array that is True where elements are not missing.
+
+:Returns:
+
+    `numpy.ndarray`
+        The counts, with the shape of the dimensions which precede the
+        element dimension.
+
+**Examples:**
+
+>>> print(present)
+[[ True  True False False]
+ [ True False  True False]]
+>>> f._element_counts(present)
+array([2, 3])
+
+        '''
+        size = present.shape[-1]
+
+        return numpy.where(present.any(axis=-1),
+                           size - numpy.argmax(present[..., ::-1], axis=-1),
+                           0)
+    #--- End: def
+
+    def _present_elements(self, ndim):
+        '''Return where the leading data axes have non-missing values.
+
+An element is present if it is not missing in the field's data, or
+in the data or bounds of any metadata construct which spans the same
+leading data axes, in the same order. This allows, for instance, a
+time coordinate to have values beyond the end of the data of a
+feature. Any trailing dimensions are considered to be missing only if
+all of their values are missing.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `_element_counts`
+
+:Parameters:
+
+    ndim: `int`
+        The number of leading data axes.
+
+:Returns:
+
+    `numpy.ndarray`
+        Boolean array, with the shape of the leading data axes, that
+        is True where elements are not missing.
+
+**Examples:**
+
+>>> f._present_elements(2)
+array([[ True,  True, False, False],
+       [ True, False,  True, False]])
+
+        '''
+        leading_axes = list(self.get_data_axes()[:ndim])
+
+        arrays = [self.get_data()]
+        for key, construct_axes in self.constructs.data_axes().items():
+            if list(construct_axes[:ndim]) != leading_axes:
+                continue
+
+            construct = self.constructs[key]
+            arrays.append(construct.get_data(None))
+
+            try:
+                bounds = construct.get_bounds(None)
+            except AttributeError:
+                bounds = None
+
+            if bounds is not None:
+                arrays.append(bounds.get_data(None))
+        #--- End: for
+
+        present = None
+        for d in arrays:
+            if d is None:
+                continue
+
+            p = ~numpy.ma.getmaskarray(d.array)
+            if p.ndim > ndim:
+                p = p.any(axis=tuple(range(ndim, p.ndim)))
+
+            if present is None:
+                present = p
+            else:
+                present |= p
+        #--- End: for
+
+        return present
+    #--- End: def
+
     def copy(self, data=True):
         '''Return a deep copy of the field construct.
 
@@ -490,6 +869,12 @@ False
 
         new._set_dataset_compliance(self.dataset_compliance())
 
+        # The geometry index is checked against the underlying node
+        # arrays, which are shared by the copy
+        geometry_index = getattr(self, '_geometry_index', None)
+        if geometry_index is not None:
+            new._geometry_index = geometry_index
+
         return new
     #--- End: def
 
@@ -747,6 +1132,501 @@ False
         return True
     #--- End: def
         
+    def features(self):
+        '''Iterate over the features of a discrete sampling geometry field.
+
+The field construct's data must be compressed by a contiguous,
+indexed, or indexed contiguous ragged array. Each feature is returned
+as a new field construct whose data contains only that feature's
+elements, rather than being padded with missing values to the size of
+the largest feature. For an indexed contiguous ragged array, each
+profile of a feature is padded only to the size of that feature's
+largest profile.
+
+Only the elements of the feature are read from the compressed data,
+so the fully padded uncompressed data is never created. Features
+which have no elements are skipped.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `data`, `__getitem__`
+
+:Returns:
+
+    generator
+        The field constructs of the features, in instance dimension
+        order.
+
+**Examples:**
+
+>>> f.data.get_compression_type()
+'ragged contiguous'
+>>> f.data.shape
+(4, 9)
+>>> for g in f.features():
+...     print(g.data.shape)
+...
+(1, 3)
+(1, 7)
+(1, 5)
+(1, 9)
+
+        '''
+        data = self.get_data()
+
+        feature_shapes = data.get_feature_shapes(None)
+        if feature_shapes is None:
+            raise ValueError(
+"Can't iterate over features: Data is not compressed by a ragged array")
+
+        for i, shape in enumerate(feature_shapes):
+            if not all(shape):
+                continue
+
+            indices = [slice(i, i + 1)]
+            indices.extend([slice(0, n) for n in shape])
+            yield self[tuple(indices)]
+        #--- End: for
+    #--- End: def
+
+    def geometry_index(self):
+        '''Return the bounding box index of the geometry cells.
+
+The index contains the bounding box of each geometry cell, and of each
+part of each cell, as spanned by the cell's node coordinates. It is
+calculated once from the compressed node coordinate arrays, without
+uncompressing them, and is then cached with the field construct.
+
+The index is a dictionary of `str` and `numpy` array values, which
+may be persisted (e.g. with `numpy.savez`) and attached to the field
+construct of a later session with `set_geometry_index`.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `geometry_subspace`, `set_geometry_index`
+
+:Returns:
+
+    `dict`
+        The index, with keys:
+
+        ===================  =========================================
+        Key                  Value
+        ===================  =========================================
+        ``'axis'``           The construct identifier of the domain
+                             axis construct of the geometry cells.
+
+        ``'coordinates'``    The construct identifiers of the
+                             auxiliary coordinate constructs that
+                             contain the node coordinates, in sorted
+                             order.
+
+        ``'cell_bounds'``    The minimum and maximum node coordinates
+                             of each cell, with shape (number of
+                             cells, number of coordinates, 2).
+
+        ``'part_bounds'``    The minimum and maximum node coordinates
+                             of each part, with shape (number of
+                             parts, number of coordinates, 2).
+
+        ``'part_cell'``      The cell of each part.
+        ===================  =========================================
+
+        A cell or part with no nodes has bounds of NaN.
+
+**Examples:**
+
+>>> index = f.geometry_index()
+>>> index['coordinates']
+['auxiliarycoordinate0', 'auxiliarycoordinate1']
+>>> index['cell_bounds'][0]
+array([[ 0., 20.],
+       [ 0., 35.]])
+>>> numpy.savez('geometry_index.npz', **index)
+
+        '''
+        axis, coordinates, arrays = self._geometry_coordinates()
+
+        cached = getattr(self, '_geometry_index', None)
+        if cached is not None:
+            cached_arrays, index = cached
+            if (len(cached_arrays) == len(arrays) and
+                all(a is b for a, b in zip(cached_arrays, arrays))):
+                return index
+        #--- End: if
+
+        part_cell = None
+        part_bounds = []
+        for key in coordinates:
+            data = self.constructs[key].get_bounds().get_data()
+
+            count = numpy.array(data.get_count().get_data().array,
+                                dtype=int)
+            if data.get_compression_type() == 'ragged indexed contiguous':
+                cells = numpy.array(data.get_index().get_data().array,
+                                    dtype=int)
+            else:
+                cells = numpy.arange(count.size)
+
+            if part_cell is None:
+                part_cell = cells
+            elif (cells.size != part_cell.size or
+                  (cells != part_cell).any()):
+                raise ValueError(
+"Can't create geometry index: Node coordinates have different parts")
+
+            nodes = numpy.ma.filled(
+                numpy.ma.asanyarray(data.compressed_array,
+                                    dtype=float).flatten(),
+                numpy.nan)
+
+            part_bounds.append(self._segment_bounds(nodes, count))
+        #--- End: for
+
+        part_bounds = numpy.stack(part_bounds, axis=1)
+
+        # Combine the bounding boxes of each cell's parts
+        order = numpy.argsort(part_cell, kind='mergesort')
+        n_parts = numpy.bincount(part_cell,
+                                 minlength=self.domain_axes[axis].get_size())
+        cell_bounds = numpy.stack(
+            [self._segment_bounds(part_bounds[order, :, 0], n_parts)[..., 0],
+             self._segment_bounds(part_bounds[order, :, 1], n_parts)[..., 1]],
+            axis=-1)
+
+        index = {'axis'       : axis,
+                 'coordinates': coordinates,
+                 'cell_bounds': cell_bounds,
+                 'part_bounds': part_bounds,
+                 'part_cell'  : part_cell}
+
+        self._geometry_index = (arrays, index)
+
+        return index
+    #--- End: def
+
+    def geometry_subspace(self, **bounding_box):
+        '''Subspace the geometry cells that intersect a bounding box.
+
+A cell is selected if the bounding box of any of its parts intersects
+the given bounding box, as found from the geometry index (see
+`geometry_index`). Only the node coordinates of the selected cells are
+read from their compressed arrays.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `geometry_index`, `__getitem__`
+
+:Parameters:
+
+    bounding_box: optional
+        The extent of the bounding box in each dimension. Each keyword
+        identifies a node coordinate construct (as accepted by the
+        `construct` method), and its value is a ``(minimum,
+        maximum)`` pair in the units of that construct. Dimensions
+        that are not given are not constrained.
+
+        *Parameter example:*
+          ``longitude=(-10, 10), latitude=(50, 60)``
+
+:Returns:
+
+    `Field`
+        The subspace of the field construct that contains the
+        selected cells.
+
+**Examples:**
+
+>>> f
+<Field: precipitation_amount(cf_role=timeseries_id(2), time(4))>
+>>> g = f.geometry_subspace(X=(0, 15), Y=(0, 10))
+>>> g
+<Field: precipitation_amount(cf_role=timeseries_id(1), time(4))>
+
+        '''
+        index = self.geometry_index()
+
+        coordinates = index['coordinates']
+        part_bounds = index['part_bounds']
+
+        parts = numpy.ones((part_bounds.shape[0],), dtype=bool)
+        for identity, (minimum, maximum) in bounding_box.items():
+            key = self.construct_key(identity, None)
+            if key not in coordinates:
+                raise ValueError(
+"Can't subspace geometry cells: {!r} is not a node coordinate construct".format(
+    identity))
+
+            j = coordinates.index(key)
+            parts &= ((part_bounds[:, j, 0] <= maximum) &
+                      (part_bounds[:, j, 1] >= minimum))
+        #--- End: for
+
+        cells = numpy.unique(index['part_cell'][parts])
+        if not cells.size:
+            raise ValueError(
+                "Can't subspace geometry cells: No cells intersect {}".format(
+                    bounding_box))
+
+        data_axes = self.get_data_axes(default=())
+        if index['axis'] not in data_axes:
+            raise ValueError(
+"Can't subspace geometry cells: Data does not span the geometry axis")
+
+        indices = [slice(None)] * len(data_axes)
+        indices[data_axes.index(index['axis'])] = cells.tolist()
+
+        return self[tuple(indices)]
+    #--- End: def
+
+    def set_geometry_index(self, index):
+        '''Set the bounding box index of the geometry cells.
+
+The index must have been created by `geometry_index` from geometry
+cells that are the same as those of the field construct, such as when
+it has been persisted with the field construct's dataset. It replaces
+any index that is cached with the field construct.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `geometry_index`, `geometry_subspace`
+
+:Parameters:
+
+    index: `dict`
+        The geometry index. Values which have been converted to
+        `numpy` arrays (e.g. by `numpy.load`) are accepted.
+
+:Returns:
+
+    `None`
+
+**Examples:**
+
+>>> numpy.savez('geometry_index.npz', **f.geometry_index())
+>>> g = cfdm.read('file.nc')[0]
+>>> g.set_geometry_index(numpy.load('geometry_index.npz'))
+
+        '''
+        axis, coordinates, arrays = self._geometry_coordinates()
+
+        index = {'axis'       : str(index['axis']),
+                 'coordinates': [str(key) for key in index['coordinates']],
+                 'cell_bounds': numpy.asanyarray(index['cell_bounds']),
+                 'part_bounds': numpy.asanyarray(index['part_bounds']),
+                 'part_cell'  : numpy.asanyarray(index['part_cell'])}
+
+        if index['axis'] != axis or index['coordinates'] != coordinates:
+            raise ValueError(
+"Can't set geometry index: Index is for different geometry coordinates")
+
+        n_cells = self.domain_axes[axis].get_size()
+        n_parts = index['part_cell'].size
+        if (index['cell_bounds'].shape != (n_cells, len(coordinates), 2) or
+            index['part_bounds'].shape != (n_parts, len(coordinates), 2)):
+            raise ValueError(
+"Can't set geometry index: Index has the wrong shape")
+
+        self._geometry_index = (arrays, index)
+    #--- End: def
+
+    def _geometry_coordinates(self):
+        '''Return the node coordinate constructs of the geometry cells.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `geometry_index`
+
+:Returns:
+
+    `str`, `list`, `tuple`
+        The construct identifier of the domain axis construct of the
+        geometry cells, the sorted construct identifiers of the node
+        coordinate constructs, and their compressed node arrays.
+
+        '''
+        axis = None
+        coordinates = []
+        for key, coordinate in self.auxiliary_coordinates.items():
+            if coordinate.get_geometry(None) is None:
+                continue
+
+            bounds = coordinate.get_bounds(None)
+            if bounds is None or not bounds.has_data():
+                continue
+
+            if bounds.get_data().get_compression_type() not in (
+                    'ragged contiguous', 'ragged indexed contiguous'):
+                continue
+
+            axes = self.get_data_axes(key)
+            if axis is None:
+                axis = axes[0]
+            elif axes != (axis,):
+                raise ValueError(
+"Can't create geometry index: Node coordinates span different axes")
+
+            coordinates.append(key)
+        #--- End: for
+
+        if axis is None:
+            raise ValueError(
+"Can't create geometry index: There are no geometry node coordinates")
+
+        coordinates.sort()
+
+        arrays = []
+        for key in coordinates:
+            data = self.constructs[key].get_bounds().get_data()
+            arrays.append(data._get_Array()._get_compressed_Array())
+
+        return axis, coordinates, tuple(arrays)
+    #--- End: def
+
+    @classmethod
+    def _segment_bounds(cls, values, counts):
+        '''Return the minimum and maximum of contiguous segments.
+
+Missing values must be NaN, and are ignored.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    values: `numpy.ndarray`
+        The values to be reduced along their first dimension.
+
+    counts: `numpy.ndarray`
+        The number of values in each segment, in order.
+
+:Returns:
+
+    `numpy.ndarray`
+        The minimum and maximum of each segment, with an extra
+        trailing dimension of size 2. A segment with no values has a
+        minimum and maximum of NaN.
+
+**Examples:**
+
+>>> f._segment_bounds(numpy.array([3., 1., 2., 5.]), numpy.array([2, 0, 2]))
+array([[ 1.,  3.],
+       [nan, nan],
+       [ 2.,  5.]])
+
+        '''
+        out = numpy.full((counts.size,) + values.shape[1:] + (2,),
+                         numpy.nan)
+
+        nonempty = counts > 0
+        if nonempty.any():
+            starts = (numpy.cumsum(counts) - counts)[nonempty]
+            out[nonempty, ..., 0] = numpy.fmin.reduceat(values, starts,
+                                                        axis=0)
+            out[nonempty, ..., 1] = numpy.fmax.reduceat(values, starts,
+                                                        axis=0)
+
+        return out
+    #--- End: def
+
+    def indices(self, overlap=False, **coordinates):
+        '''Return the indices that select ranges of coordinate values.
+
+Each range is found by a binary search of a one dimensional dimension
+coordinate construct, whose values are strictly monotonic (see
+`DimensionCoordinate.indices`). The coordinate values, and whether
+they are increasing or decreasing, are read once and then cached with
+the construct (see `DimensionCoordinate.direction`). The resulting
+indices are slices, so subspacing the field construct with them reads
+only the selected hyperslab of its data.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `subspace`, `__getitem__`
+
+:Parameters:
+
+    overlap: `bool`, optional
+        If True then select the cells whose bounds overlap the
+        range, rather than the cells whose coordinate values lie
+        within it. The coordinate values are used for constructs that
+        have no bounds.
+
+    coordinates: optional
+        The ranges of the coordinate values to select. Each keyword
+        identifies a dimension coordinate construct (as accepted by
+        the `construct` method), and its value is either a
+        ``(minimum, maximum)`` pair, for an inclusive range, or a
+        single value, in the units of that construct. Date-time
+        objects may be given for constructs with reference time
+        units, in which case they are encoded in the units and
+        calendar of the construct. Ranges for the same domain axis are
+        combined.
+
+        *Parameter example:*
+          ``latitude=(30, 60)``
+
+        *Parameter example:*
+          ``time=31.5``
+
+        *Parameter example:*
+          ``time=(cftime.DatetimeNoLeap(2000, 1, 1), cftime.DatetimeNoLeap(2000, 2, 1))``
+
+:Returns:
+
+    `tuple`
+        The indices of each axis of the data, which are slices.
+
+**Examples:**
+
+>>> print(f.construct('latitude').array)
+[-75. -45.   0.  45.  75.]
+>>> f.indices(latitude=(30, 60))
+(slice(3, 4, None), slice(None, None, None), slice(None, None, None))
+>>> f.indices(overlap=True, latitude=(30, 60))
+(slice(3, 5, None), slice(None, None, None), slice(None, None, None))
+
+        '''
+        data_axes = self.get_data_axes(default=())
+
+        ranges = {}
+        for identity, value in coordinates.items():
+            c = self.constructs.filter_by_type('dimension_coordinate')
+            c = c.filter_by_identity(identity)
+            if len(c) != 1:
+                raise ValueError(
+"Can't find indices: {!r} must identify exactly one dimension coordinate construct".format(
+    identity))
+
+            key = c.key()
+            coordinate = c.value()
+            axis = self.get_data_axes(key)[0]
+
+            index = coordinate.indices(value, overlap=overlap)
+            start, stop = index.start, index.stop
+
+            if axis in ranges:
+                start = max(start, ranges[axis][0])
+                stop  = min(stop, ranges[axis][1])
+
+            if stop <= start:
+                raise ValueError(
+"Can't find indices: No {!r} cells selected by {!r}".format(
+    identity, value))
+
+            ranges[axis] = (int(start), int(stop))
+        #--- End: for
+
+        indices = []
+        for axis in data_axes:
+            if axis in ranges:
+                indices.append(slice(*ranges[axis]))
+            else:
+                indices.append(slice(None))
+        #--- End: for
+
+        return tuple(indices)
+    #--- End: def
+
     def insert_dimension(self, axis, position=0):
         '''Expand the shape of the data array.
 
@@ -898,22 +1778,28 @@ Field: surface_altitude (ncvar%surface_altitude)
 Data            : surface_altitude(grid_latitude(10), grid_longitude(9)) m
 		   
         '''
-        c = self.constructs.filter_by_key(key).value()
+        constructs = self.constructs
+        
+        c = constructs.get(key)
+        if c is None:
+            raise ValueError(
+                "Can't convert non-existent construct {!r}".format(key))
         
         # ------------------------------------------------------------
         # Create a new field with the properties and data from the
-        # construct
+        # construct. The data array is shared with the construct, and
+        # so is not read nor copied.
         # ------------------------------------------------------------
         f = type(self)(source=c, copy=True)
 
         # ------------------------------------------------------------
         # Add domain axes
         # ------------------------------------------------------------
-        constructs_data_axes = self.constructs.data_axes()
+        constructs_data_axes = constructs.data_axes()
         data_axes = constructs_data_axes.get(key)
         if data_axes is not None:
             for domain_axis in data_axes:
-                f.set_construct(self.domain_axes[domain_axis],
+                f.set_construct(constructs[domain_axis],
                                 key=domain_axis, copy=True)
         #--- End: if
 
@@ -927,21 +1813,24 @@ Data            : surface_altitude(grid_latitude(10), grid_longitude(9)) m
         # Add a more complete domain
         # ------------------------------------------------------------
         if full_domain:
-            for ccid, construct in self.constructs.filter_by_type(
-                    'dimension_coordinate',
-                    'auxiliary_coordinate',
-                    'cell_measure').items():
-                axes = constructs_data_axes.get(ccid)
-                if axes is None:
-                    continue
-                
-                if set(axes).issubset(data_axes):
-                    f.set_construct(construct, key=ccid, axes=axes, copy=True)
+            # Only inspect the constructs whose data span a subset of
+            # the item's axes, which are found from the index of data
+            # axes
+            construct_types = ('dimension_coordinate',
+                               'auxiliary_coordinate',
+                               'cell_measure')
+            for axes, keys in constructs._spanning_subsets(
+                    data_axes).items():
+                for ccid in sorted(keys):
+                    if constructs.construct_type(ccid) in construct_types:
+                        f.set_construct(constructs[ccid], key=ccid,
+                                        axes=axes, copy=True)
             #--- End: for
             
             # Add coordinate references which span a subset of the item's
             # axes
-            for rcid, ref in self.coordinate_references.items():
+            for rcid, ref in constructs._type_constructs(
+                    'coordinate_reference').items():
 
                 new_coordinates = [
                     ccid for ccid in ref.coordinates()
@@ -961,7 +1850,8 @@ Data            : surface_altitude(grid_latitude(10), grid_longitude(9)) m
 
                 if ok:
                     ref = ref.copy()
-                    ref.coordinates(new_coordinates)
+                    ref.clear_coordinates()
+                    ref.set_coordinates(new_coordinates)
                     f.set_construct(ref, key=rcid, copy=False)
             #--- End: for
         #--- End: if
@@ -1105,6 +1995,46 @@ may be selected for removal.
         return f
     #--- End: def
 
+    def subspace(self, overlap=False, **coordinates):
+        '''Subspace the field construct by ranges of coordinate values.
+
+``f.subspace(**coordinates)`` is equivalent to
+``f[f.indices(**coordinates)]``. See `indices` for details.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `indices`, `__getitem__`
+
+:Parameters:
+
+    overlap: `bool`, optional
+        If True then select the cells whose bounds overlap the
+        range, rather than the cells whose coordinate values lie
+        within it.
+
+    coordinates: optional
+        The ranges of the coordinate values to select. See `indices`
+        for details.
+
+        *Parameter example:*
+          ``latitude=(30, 60), time=(0, 31)``
+
+:Returns:
+
+    `Field`
+        The subspace of the field construct.
+
+**Examples:**
+
+>>> f
+<Field: specific_humidity(latitude(5), longitude(8), time(1)) 1>
+>>> f.subspace(latitude=(30, 60), longitude=(0, 180))
+<Field: specific_humidity(latitude(1), longitude(4), time(1)) 1>
+
+        '''
+        return self[self.indices(overlap=overlap, **coordinates)]
+    #--- End: def
+
     def transpose(self, axes=None):
         '''Permute the axes of the data array.
 
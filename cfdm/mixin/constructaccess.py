@@ -1,4 +1,4 @@
-from builtins import object
+from builtins import (object, super)
 
 import re
 
@@ -13,6 +13,28 @@ object.
     # ----------------------------------------------------------------
     # Private methods
     # ----------------------------------------------------------------
+    def _fingerprint_components(self):
+        '''Return the components that define the fingerprint.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `fingerprint`
+
+:Returns:
+
+    `list`
+        The components.
+
+        '''
+        out = super()._fingerprint_components()
+
+        constructs_data_axes = self.constructs.data_axes()
+        out.append(sorted([(key, construct.fingerprint(),
+                            constructs_data_axes.get(key))
+                           for key, construct in self.constructs.items()]))
+        return out
+    #--- End: def
+
     def _unique_construct_names(self):
         '''Return unique metadata construct names.
 
@@ -1,6 +1,7 @@
 from __future__ import print_function
 from builtins import object
 
+import hashlib
 import inspect
 
 import numpy
@@ -13,6 +14,8 @@ class Container(object):
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
     def __repr__(self):
         '''Called by the `repr` built-in function.
 
@@ -177,5 +180,102 @@ casts them as numpy arrays and carried aout numericlly tolerant equality checks.
 
         return other
     #--- End: def
+
+    def _fingerprint_components(self):
+        '''Return the components that define the fingerprint.
+
+Subclasses extend the returned list with the components that are
+relevant to their equality. A component that is itself a container is
+represented by its fingerprint.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `fingerprint`
+
+:Returns:
+
+    `list`
+        The components.
+
+        '''
+        return [self.__class__.__name__]
+    #--- End: def
+
+    @classmethod
+    def _fingerprint_value(cls, value):
+        '''Return a fingerprint component for a value.
+
+Arrays are represented by their data type, shape and elements, so that
+their representation is not abbreviated for large arrays.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    value:
+        The value.
+
+:Returns:
+
+        The fingerprint component.
+
+        '''
+        if isinstance(value, numpy.ndarray):
+            return ('ndarray', value.dtype.str, value.shape, value.tolist())
+
+        return value
+    #--- End: def
+
+    # ----------------------------------------------------------------
+    # Methods
+    # ----------------------------------------------------------------
+    def fingerprint(self):
+        '''Return a fingerprint of the contents.
+
+The fingerprint is a digest of the metadata and, where applicable, of
+the data array values. It is independent of any netCDF names, and so
+objects that are equal (as tested by their `!equals` method) with
+strict tolerances and identical construct keys have the same
+fingerprint. Conversely, objects with the same fingerprint are equal
+apart from negligible chance of collision. Objects that are equal only
+within a numerical tolerance may have different fingerprints.
+
+The digest of a data array is calculated a block at a time, so that
+the whole array need not be in memory at once, and is stored with the
+underlying array. Changing the data, for example by assignment to its
+elements, replaces the underlying array and so the digest is
+recalculated when next required.
+
+The remainder of the fingerprint, which describes the metadata, is
+not cached. It may be changed via nested components, such as bounds or
+the parameters of a coordinate conversion, which do not notify their
+parent, so a cached value could not be reliably invalidated. It is
+cheap to recalculate, because no data are read.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `str`
+        The fingerprint, as a string of hexadecimal digits.
+
+**Examples:**
+
+>>> f.fingerprint()
+'4f5a0bba3b52a0dc0dd0c1da0e8a4b3e4cde6d7c'
+>>> f.fingerprint() == f.copy().fingerprint()
+True
+>>> g = f.copy()
+>>> g.set_property('long_name', 'new name')
+>>> g.fingerprint() == f.fingerprint()
+False
+
+        '''
+        h = hashlib.sha1()
+        for x in self._fingerprint_components():
+            h.update(repr(x).encode('utf-8'))
+
+        return h.hexdigest()
+    #--- End: def
     
 #--- End: class
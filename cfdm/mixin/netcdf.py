@@ -1,7 +1,5 @@
 from builtins import object
 
-from copy import deepcopy
-
 
 class NetCDF(object):
     '''Mixin class for storing simple netCDF elements.
@@ -9,6 +7,8 @@ class NetCDF(object):
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
     def _initialise_netcdf(self, source=None):
         '''Call this from inside the __init__ method of a class that inherits
 from this mixin class.
@@ -31,9 +31,16 @@ from this mixin class.
              netcdf = {}
         else:        
             try:
-                netcdf = deepcopy(source._get_component('netcdf', {}))
+                netcdf = source._get_component('netcdf', {}).copy()
             except AttributeError:
                 netcdf = {}
+
+            # Only nested dictionaries are changed in place, so the
+            # other values (strings and tuples) may be shared rather
+            # than deep copied
+            for key, value in netcdf.items():
+                if isinstance(value, dict):
+                    netcdf[key] = value.copy()
         #--- End: if
         
         self._set_component('netcdf', netcdf, copy=False)
@@ -48,6 +55,8 @@ class NetCDFDimension(NetCDF):
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
     def nc_del_dimension(self, default=ValueError()):
         '''Remove the netCDF dimension name.
 
@@ -85,6 +94,8 @@ None
 None
 
         '''
+        self._identities_changed()
+
         try:
             return self._get_component('netcdf').pop('dimension')
         except KeyError:
@@ -207,6 +218,8 @@ None
 
         '''
         self._get_component('netcdf')['dimension'] = value
+
+        self._identities_changed()
     #--- End: def
 
 #--- End: class
@@ -218,6 +231,8 @@ class NetCDFVariable(NetCDF):
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
     def nc_del_variable(self, default=ValueError()):
         '''Remove the netCDF variable name.
 
@@ -254,6 +269,8 @@ None
 None
 
         '''        
+        self._identities_changed()
+
         try:
             return self._get_component('netcdf').pop('variable')
         except KeyError:
@@ -374,6 +391,8 @@ None
 
         '''
         self._get_component('netcdf')['variable'] = value
+
+        self._identities_changed()
     #--- End: def
 
 #--- End: class
@@ -385,6 +404,8 @@ class NetCDFSampleDimension(NetCDF):
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
     def nc_del_sample_dimension(self, default=ValueError()):
         '''Remove the netCDF sample dimension name.
 
@@ -724,6 +745,8 @@ class NetCDFGlobalAttributes(NetCDF):
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
     def nc_global_attributes(self):
         '''Return the selection of properties to be written as netCDF global
 attributes.
@@ -900,6 +923,8 @@ class NetCDFUnlimitedDimensions(NetCDF):
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
     def nc_unlimited_dimensions(self):
         '''Return the selection of domain axis constructs to be written as
 netCDF unlimited dimensions.
@@ -1044,6 +1069,8 @@ class NetCDFExternal(NetCDF):
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
     def nc_get_external(self):
         '''Whether the construct corresponds to an external netCDF variable.
 
@@ -1108,7 +1135,9 @@ name.
 
 .. versionadded:: 1.8.0
 
-    '''   
+    '''
+    __slots__ = ()
+
     def nc_del_geometry(self, default=ValueError()):
         '''Remove the netCDF geometry container variable name.
 
@@ -1274,6 +1303,8 @@ class NetCDFHDF5(NetCDF):
 .. versionadded:: 1.7.2
 
     '''
+    __slots__ = ()
+
     def nc_hdf5_chunksizes(self):
         '''TODO
 
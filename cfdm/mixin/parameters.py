@@ -10,6 +10,8 @@ class Parameters(Container):
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
 
     def __bool__(self):
         '''Called by the `bool` built-in function.
@@ -44,6 +46,25 @@ x.__str__() <==> str(x)
         return 'Parameters: {0}'.format(', '.join(sorted(self.parameters())))
     #--- End: def
 
+    def _fingerprint_components(self):
+        '''Return the components that define the fingerprint.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `fingerprint`
+
+:Returns:
+
+    `list`
+        The components.
+
+        '''
+        out = super()._fingerprint_components()
+        out.append(sorted([(term, self._fingerprint_value(value))
+                           for term, value in self.parameters().items()]))
+        return out
+    #--- End: def
+
     def equals(self, other, rtol=None, atol=None, verbose=False,
                ignore_data_type=False, ignore_fill_value=False,
                ignore_type=False):
@@ -14,6 +14,8 @@ class Properties(Container):
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
     def __str__(self):
         '''Called by the `str` built-in function.
 
@@ -67,6 +69,25 @@ x.__str__() <==> str(x)
         return '\n'.join(string)
     #--- End: def
 
+    def _fingerprint_components(self):
+        '''Return the components that define the fingerprint.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `fingerprint`
+
+:Returns:
+
+    `list`
+        The components.
+
+        '''
+        out = super()._fingerprint_components()
+        out.append(sorted([(prop, self._fingerprint_value(value))
+                           for prop, value in self.properties().items()]))
+        return out
+    #--- End: def
+
     def dump(self, display=True, _key=None, _omit_properties=(),
              _prefix='', _title=None, _create_title=True, _level=0):
         '''A full description.
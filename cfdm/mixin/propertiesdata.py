@@ -11,6 +11,8 @@ class PropertiesData(Properties):
 .. versionadded:: 1.7.0
 
     '''
+    __slots__ = ()
+
     def __getitem__(self, indices):
         '''Return a subspace defined by indices
 
@@ -49,7 +51,7 @@ rules, the only differences being:
 (1, 10, 1)
 
         '''
-        new = self.copy() #data=False)
+        new = self.copy(data=False)
         
         data = self.get_data(None)
         if data is not None:
@@ -91,6 +93,29 @@ x.__str__() <==> str(x)
     # ----------------------------------------------------------------
     # Private methods
     # ----------------------------------------------------------------
+    def _fingerprint_components(self):
+        '''Return the components that define the fingerprint.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `fingerprint`
+
+:Returns:
+
+    `list`
+        The components.
+
+        '''
+        out = super()._fingerprint_components()
+
+        data = self.get_data(None)
+        if data is not None:
+            data = data.fingerprint()
+            
+        out.append(data)
+        return out
+    #--- End: def
+
     def _parse_axes(self, axes):
         '''Conform axes.
 
@@ -270,6 +270,39 @@ x.__str__() <==> str(x)
         return '{0}{1} {2}'.format(self.identity(''), dims, units)
     #--- End: def
     
+    # ----------------------------------------------------------------
+    # Private methods
+    # ----------------------------------------------------------------
+    def _fingerprint_components(self):
+        '''Return the components that define the fingerprint.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `fingerprint`
+
+:Returns:
+
+    `list`
+        The components.
+
+        '''
+        out = super()._fingerprint_components()
+
+        for component in (self.get_bounds(None),
+                          self.get_interior_ring(None)):
+            if component is not None:
+                component = component.fingerprint()
+
+            out.append(component)
+        #--- End: for
+
+        out.append(self.get_geometry(None))
+        return out
+    #--- End: def
+
+    # ----------------------------------------------------------------
+    # Methods
+    # ----------------------------------------------------------------
     def del_node_count(self, default=ValueError()):
         '''Remove the node count variable for geometry bounds.
 
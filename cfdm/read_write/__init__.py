@@ -3,4 +3,5 @@ from .cfdmimplementation import (CFDMImplementation,
                                  _implementation,
                                  implementation)
 from .read               import read
-from .write              import write
+from .write              import (write,
+                                 write_files)
@@ -293,6 +293,30 @@ AttributeError: Field doesn't have property 'standard_name'
         return data.compressed_array
     #--- End: def
 
+    def get_compressed_underlying_array(self, data, default=None):
+        '''Return the underlying compressed array of compressed data.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    data: `Data`
+
+    default: optional
+        Return *default* if the data are not compressed.
+
+:Returns:
+
+        The compressed array object, which may be indexed without
+        reading the whole array into memory.
+
+        '''
+        if not data.get_compression_type():
+            return default
+
+        return data.underlying_array()
+    #--- End: def
+
     def get_compressed_axes(self, field, key=None, construct=None):
         '''
 :Returns:
@@ -1017,6 +1041,31 @@ attributes: `dict`
        return construct.get_property(prop, default=default)
     #--- End: def
 
+    def get_fingerprint(self, construct, default=None):
+        '''Return the fingerprint of a construct.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    construct:
+        The construct.
+
+    default: optional
+        Return *default* if the construct has no fingerprint.
+
+:Returns:
+
+    `str`
+        The fingerprint.
+
+        '''
+        try:
+            return construct.fingerprint()
+        except AttributeError:
+            return default
+    #--- End: def
+
     def get_geometry(self, construct, default=None):
        '''
 
@@ -1495,6 +1544,27 @@ also be provided.
             construct.set_data(data, axes=axes, copy=copy)
     #--- End: def
 
+    def set_data_statistics(self, data, **statistics):
+        '''Set known summary statistics of the data values.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    data: `Data`
+
+    statistics: optional
+        The statistics, which may be any of ``minimum``, ``maximum``,
+        ``count`` and ``count_masked``.
+
+:Returns:
+
+    `None`
+
+        '''
+        data._set_statistics(**statistics)
+    #--- End: def
+
     def set_datum(self, coordinate_reference, datum):
         '''
 
@@ -182,3 +182,32 @@ geometry_types = set((
     'line',
     'polygon',
 ))
+
+# --------------------------------------------------------------------
+# HDF5 chunking strategies
+# --------------------------------------------------------------------
+chunking_strategies = set((
+    'auto',
+    'map',
+    'timeseries',
+))
+
+# Default approximate size, in bytes, of an HDF5 chunk computed from
+# a chunking strategy
+chunk_bytes = 1048576
+
+# Mapping of standard names to the spatiotemporal axis type that they
+# identify, for the purposes of chunking strategies
+axis_type_standard_names = {
+    'time'                   : 'T',
+    'latitude'               : 'Y',
+    'grid_latitude'          : 'Y',
+    'projection_y_coordinate': 'Y',
+    'longitude'              : 'X',
+    'grid_longitude'         : 'X',
+    'projection_x_coordinate': 'X',
+}
+
+# The maximum size in bytes of each block of data written to a netCDF
+# variable
+block_bytes = 134217728
@@ -69,6 +69,27 @@ class NetCDFRead(IORead):
     'that does not span the vertical dimension is inconsistent with the formula_terms of the parametric coordinate variable': 8,
     }
 
+    # Scanned external files, shared by all readers in this
+    # session. Each key is the absolute path of an external file (see
+    # `_external_file_key`), and its value is a dictionary containing
+    # the file's modification time, size and inode ('stat'), the
+    # read parameters from scanning it that do not refer to an open
+    # dataset ('read_vars') and the metadata constructs that have
+    # been created from its variables ('constructs'). The least
+    # recently used files are discarded when there are more than
+    # `_external_files_size` of them.
+    _external_files = OrderedDict()
+    _external_files_size = 32
+
+    # The read parameters from scanning an external file that are
+    # cached
+    _external_read_vars = ('filename',
+                           'internal_dimension_sizes',
+                           'internal_variables',
+                           'variable_attributes',
+                           'variable_dimensions',
+                           'variable_filename')
+
 #    def _dereference(self, ncvar):
 #        '''Decrement by one the reference count to a netCDF variable.
 #        
@@ -142,6 +163,26 @@ netCDF variable.
         return count
     #--- End: def 
 
+    @classmethod
+    def clear_external_files(cls):
+        '''Clear the cache of scanned external files.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `_scan_external_file`
+
+:Returns:
+
+    `None`
+
+**Examples:**
+
+>>> NetCDFRead.clear_external_files()
+
+        '''
+        cls._external_files.clear()
+    #--- End: def
+
     def file_close(self):
         '''Close the netCDF files that have been read.
 
@@ -223,7 +264,7 @@ contents and any file suffix is not not considered.
 
     def read(self, filename, extra=None, default_version=None,
              external=None, _extra_read_vars=None, _scan_only=False,
-             verbose=False, warnings=True):
+             verbose=False, warnings=True, trust_actual_range=False):
         '''Read fields from a netCDF file on disk or from an OPeNDAP server
 location.
         
@@ -283,6 +324,12 @@ ancillaries, field ancillaries).
         element of the CF data model. Other type on non-CF-compliance
         are not checked, for example, whether or not controlled
         vocabularies have been adhered to is not checked.
+
+    trust_actual_range: `bool`, optional
+        If True then the minimum and maximum of the data of each
+        netCDF variable with an "actual_range" attribute are taken
+        from that attribute, rather than being found from the data
+        values when they are required.
         
 :Returns:
 
@@ -307,6 +354,10 @@ TODO
             
             # Warnings?
             'warnings': warnings,
+
+            # Take data minima and maxima from actual_range
+            # attributes?
+            'trust_actual_range': trust_actual_range,
             
             'dataset_compliance': {None: {'non-compliance': {}}},
             'component_report' : {},
@@ -330,7 +381,20 @@ TODO
             
             'do_not_create_field':  set(),
             'references': {},
-            
+
+            # --------------------------------------------------------
+            # Parsed attributes
+            # --------------------------------------------------------
+            # Immutable parsed forms of CF attribute strings (such as
+            # cell_methods, coordinates and grid_mapping), keyed by
+            # the type of attribute and the attribute string
+            'parsed_attributes': {},
+
+            # Attribute compliance checks which have already passed,
+            # so that they need not be repeated for other data
+            # variables with identical attributes
+            'compliant_attributes': set(),
+
             # --------------------------------------------------------
             # External variables
             # --------------------------------------------------------
@@ -430,20 +494,7 @@ TODO
         # Put the file's global attributes into the global
         # 'global_attributes' dictionary
         # ----------------------------------------------------------------
-        global_attributes = {}
-        for attr in map(str, nc.ncattrs()):
-            try:
-                value = nc.getncattr(attr)
-                if isinstance(value, basestring):
-                    try:
-                        global_attributes[attr] = str(value)
-                    except UnicodeEncodeError:
-                        global_attributes[attr] = value.encode(errors='ignore')          
-                else:
-                    global_attributes[attr] = value     
-            except UnicodeDecodeError:
-                pass
-        #--- End: for
+        global_attributes = self._ncattrs(nc)
         
         g['global_attributes'] = global_attributes
         if verbose:
@@ -471,49 +522,29 @@ TODO
             g['CF>='+vn] = (g['file_version'] >= g['version'][vn])
 
         # ------------------------------------------------------------
-        # Create a dictionary keyed by netCDF variable names where
-        # each key's value is a dictionary of that variable's netCDF
-        # attributes. E.g. attributes['tas']['units']='K'
+        # Ingest the variables' headers in a single pass, creating
+        # dictionaries keyed by netCDF variable names (e.g.
+        # variable_attributes['tas']['units']='K') together with a
+        # reverse index from netCDF attribute names to the variables
+        # which have them
         # ------------------------------------------------------------
-
-        # The netCDF attributes for each variable.
-        #
-        # E.g. {'lon': {'standard_name': 'longitude'}}
+        variables           = nc.variables
         variable_attributes = {}
-
-        # The netCDF attributes for each variable.
-        #
-        # E.g. {'lon': {'standard_name': 'longitude'}}
-        
         variable_dimensions = {}
-        variable_dataset    = {}
-        variable_filename   = {}
-        variables           = {}
-        for ncvar in nc.variables:
-            variable = nc.variables[ncvar]
-            
-            variable_attributes[ncvar] = {}
-            for attr in map(str, variable.ncattrs()):
-                try:
-                    variable_attributes[ncvar][attr] = variable.getncattr(attr)
-                    if isinstance(variable_attributes[ncvar][attr], basestring):
-                        try:
-                            variable_attributes[ncvar][attr] = str(variable_attributes[ncvar][attr])
-                        except UnicodeEncodeError:
-                            variable_attributes[ncvar][attr] = variable_attributes[ncvar][attr].encode(errors='ignore')
-                except UnicodeDecodeError:
-                    pass
-            #--- End: for
-
-            variable_dimensions[ncvar] = tuple(variable.dimensions)
-
-            variable_dataset[ncvar] = nc
-            
-            variable_filename[ncvar] = g['filename']
-            
-            variables[ncvar] = variable
+        attribute_variables = {}
+        for ncvar, variable in variables.items():
+            attributes = self._ncattrs(variable)
+            variable_attributes[ncvar] = attributes
+            for attr in attributes:
+                attribute_variables.setdefault(attr, []).append(ncvar)
+
+            variable_dimensions[ncvar] = variable.dimensions
         #--- End: for
 
+        variables         = dict(variables)
+        variable_dataset  = dict.fromkeys(variables, nc)
+        variable_filename = dict.fromkeys(variables, g['filename'])
+
         # The netCDF attributes for each variable
         #
         # E.g. {'grid_lon': {'standard_name': 'grid_longitude'}}
@@ -533,6 +564,12 @@ TODO
         # The netCDF4 variable object for each variable
         g['variables'] = variables
 
+        # The variables which have each netCDF attribute, in file
+        # order
+        #
+        # E.g. {'compress': ['landpoint']}
+        g['attribute_variables'] = attribute_variables
+
         # The netCDF4 dataset objects that have been opened (i.e. the
         # for parent file and any external files)
         g['datasets'] = [nc]
@@ -556,17 +593,14 @@ TODO
         #
         # Identify and parse all list variables
         # ------------------------------------------------------------
-        for ncvar, dimensions in variable_dimensions.items():
-            if dimensions != (ncvar,):
+        for ncvar in attribute_variables.get('compress', ()):
+            if variable_dimensions[ncvar] != (ncvar,):
                 continue
 
-            # This variable is a Unidata coordinate variable
-            compress = variable_attributes[ncvar].get('compress')
-            if compress is None:
-                continue
-            
-            # This variable is a list variable for gathering
+            # This variable is a Unidata coordinate variable with a
+            # compress attribute, i.e. a list variable for gathering
             # arrays
+            compress = variable_attributes[ncvar]['compress']
             self._parse_compression_gathered(ncvar, compress)
             
             # Do not attempt to create a field from a list
@@ -584,15 +618,12 @@ TODO
                 g['featureType'] = featureType
     
                 sample_dimension = None
-                for ncvar, attributes in variable_attributes.items():
-                    if 'sample_dimension' not in attributes:
-                        continue
-                    
+                for ncvar in attribute_variables.get('sample_dimension', ()):
                     # ------------------------------------------------
                     # This variable is a count variable for DSG
                     # contiguous ragged arrays
                     # ------------------------------------------------
-                    sample_dimension = attributes['sample_dimension']
+                    sample_dimension = variable_attributes[ncvar]['sample_dimension']
                     cf_compliant = self._check_sample_dimension(ncvar,
                                                                 sample_dimension)
                     if not cf_compliant:
@@ -608,15 +639,12 @@ TODO
                 #--- End: for
     
                 instance_dimension = None
-                for ncvar, attributes in variable_attributes.items():
-                    if 'instance_dimension' not in attributes:
-                        continue
-    
+                for ncvar in attribute_variables.get('instance_dimension', ()):
                     # ------------------------------------------------
                     # This variable is an index variable for DSG
                     # indexed ragged arrays
                     # ------------------------------------------------
-                    instance_dimension = attributes['instance_dimension']
+                    instance_dimension = variable_attributes[ncvar]['instance_dimension']
                     cf_compliant = self._check_instance_dimension(
                         ncvar,
                         instance_dimension)
@@ -647,11 +675,8 @@ TODO
         # Identify and parse all geometry container variables
         # ------------------------------------------------------------
         if g['CF>=1.8']:
-            for ncvar, attributes in variable_attributes.items():
-                if 'geometry' not in attributes:
-                    continue
-            
-                geometry_ncvar = attributes['geometry']
+            for ncvar in attribute_variables.get('geometry', ()):
+                geometry_ncvar = variable_attributes[ncvar]['geometry']
                 self._parse_geometry(ncvar, geometry_ncvar, variable_attributes)
                 
                 # Do not attempt to create a field from a geometry
@@ -810,8 +835,7 @@ TODO
                 print('\nScanning external file:')
                 print('-----------------------')
 
-            external_read_vars = self.read(external_file, _scan_only=True,
-                                           verbose=verbose)
+            external_read_vars = self._scan_external_file(external_file)
 
             if verbose:
                 print('Finished scanning external file\n')
@@ -874,12 +898,174 @@ TODO
                     for key in keys:
                         self.read_vars[key][ncvar] = external_read_vars[key][ncvar]
 
+                    for attr in external_read_vars['variable_attributes'][ncvar]:
+                        self.read_vars['attribute_variables'].setdefault(
+                            attr, []).append(ncvar)
+
                     # Remove this ncvar from the set of external variables
                     external_variables.remove(ncvar)
             #--- End: for
         #--- End: for
     #--- End: def
     
+    def _ncattrs(self, x):
+        '''Return the netCDF attributes of a dataset or variable.
+
+All of the attributes are retrieved together. Attributes which can
+not be decoded are omitted.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    x: `netCDF4.Dataset` or `netCDF4.Variable`
+        The netCDF dataset or variable.
+
+:Returns:
+
+    `dict`
+        The netCDF attributes.
+
+**Examples:**
+
+>>> n._ncattrs(nc.variables['lon'])
+{'standard_name': 'longitude', 'units': 'degrees_east'}
+
+        '''
+        try:
+            attributes = x.__dict__
+        except UnicodeDecodeError:
+            # Retrieve the attributes one at a time, so that only
+            # those which can't be decoded are omitted
+            attributes = {}
+            for attr in x.ncattrs():
+                try:
+                    attributes[attr] = x.getncattr(attr)
+                except UnicodeDecodeError:
+                    pass
+        #--- End: try
+
+        out = {}
+        for attr, value in attributes.items():
+            if not isinstance(value, str) and isinstance(value, basestring):
+                try:
+                    value = str(value)
+                except UnicodeEncodeError:
+                    value = value.encode(errors='ignore')
+            #--- End: if
+
+            out[str(attr)] = value
+        #--- End: for
+
+        return out
+    #--- End: def
+
+    @staticmethod
+    def _external_file_key(filename):
+        '''Return the key of an external file in the cache of scanned
+external files.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `_scan_external_file`
+
+:Parameters:
+
+    filename: `str`
+        The name of the external file.
+
+:Returns:
+
+    `str`
+        The key, which is the absolute path of the file.
+
+**Examples:**
+
+>>> NetCDFRead._external_file_key('~/data/areacella.nc')
+'/home/user/data/areacella.nc'
+
+        '''
+        return os.path.abspath(
+            os.path.expanduser(os.path.expandvars(filename)))
+    #--- End: def
+
+    def _scan_external_file(self, external_file):
+        '''Scan an external file, reusing a previous scan if possible.
+
+A scan is reused if it was of the same file, and the file's
+modification time, size and inode are unchanged. In this case the
+file is reopened, but its variables are not parsed again, so that
+many parent files that name the same external file do not each need
+to rescan it.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `clear_external_files`, `_external_file_key`
+
+:Parameters:
+
+    external_file: `str`
+        The name of the external file.
+
+:Returns:
+
+    `dict`
+        The read parameters from scanning the external file.
+
+        '''
+        verbose = self.read_vars['verbose']
+        external_files = self._external_files
+        
+        filename = self._external_file_key(external_file)
+        try:
+            st = os.stat(filename)
+        except OSError:
+            # Let the scan fail in the normal way
+            stat = None
+        else:
+            stat = (getattr(st, 'st_mtime_ns', st.st_mtime),
+                    st.st_size, st.st_ino)
+
+        entry = external_files.pop(filename, None)
+        if entry is not None and stat is not None and entry['stat'] == stat:
+            if verbose:
+                print('    Using previous scan of', filename)
+
+            # Mark the file as the most recently used
+            external_files[filename] = entry
+
+            # Reopen the file, and add the objects that belong to the
+            # opened dataset
+            nc = self.file_open(entry['read_vars']['filename'])
+            
+            external_read_vars = entry['read_vars'].copy()
+            external_read_vars['nc'] = nc
+            external_read_vars['variables'] = {
+                ncvar: nc.variables[ncvar]
+                for ncvar in external_read_vars['internal_variables']}
+            external_read_vars['variable_dataset'] = dict.fromkeys(
+                external_read_vars['internal_variables'], nc)
+            
+            return external_read_vars
+        #--- End: if
+
+        external_read_vars = self.read(external_file, _scan_only=True,
+                                       verbose=verbose)
+
+        if stat is not None:
+            external_files[filename] = {
+                'stat'      : stat,
+                'read_vars' : {key: external_read_vars[key]
+                               for key in self._external_read_vars},
+                'constructs': {}}
+
+            while len(external_files) > self._external_files_size:
+                external_files.popitem(last=False)
+        #--- End: if
+        
+        return external_read_vars
+    #--- End: def
+    
     def _parse_compression_gathered(self, ncvar, compress):
         '''
         '''
@@ -1555,8 +1741,7 @@ variable should be pre-filled with missing values.
 
         parent_dimensions = self._ncdimensions(field_ncvar)
  
-        for x in parsed_formula_terms:
-            term, values = list(x.items())[0]
+        for term, values in parsed_formula_terms:
             
             g['formula_terms'][coord_ncvar]['coord'][term] = None
 
@@ -1617,8 +1802,7 @@ variable should be pre-filled with missing values.
                                       attribute=attribute,
                                       variable=coord_ncvar)
 
-                for x in parsed_bounds_formula_terms:
-                    term, values = list(x.items())[0]
+                for term, values in parsed_bounds_formula_terms:
                     
                     g['formula_terms'][coord_ncvar]['bounds'][term] = None
 
@@ -2199,8 +2383,7 @@ variable should be pre-filled with missing values.
                 if verbose:
                     print('        Bad grid_mapping:', grid_mapping)
             else:
-                for x in parsed_grid_mapping:
-                    grid_mapping_ncvar, coordinates = list(x.items())[0]
+                for grid_mapping_ncvar, coordinates in parsed_grid_mapping:
 
                     parameters = g['variable_attributes'][grid_mapping_ncvar].copy()
 
@@ -2294,8 +2477,7 @@ variable should be pre-filled with missing values.
                                                      parsed_cell_measures)
 
             if cf_compliant:
-                for x in parsed_cell_measures:
-                    measure, ncvars = list(x.items())[0]
+                for measure, ncvars in parsed_cell_measures:
                     ncvar = ncvars[0]
                         
                     # Set the domain axes for the cell measure
@@ -2793,6 +2975,29 @@ variable's netCDF dimensions.
 
         '''
         g = self.read_vars
+
+        # Find the cached external file, if the cell measure variable
+        # is in one. A cell measure construct created from it can be
+        # shared by all parent files that reference it, provided that
+        # it doesn't span any dimensions that are compressed in the
+        # parent file. Statistics taken from the actual_range
+        # attribute are stored with the data, so constructs created
+        # with and without trusting it are cached separately.
+        external = None
+        filename = g['variable_filename'].get(ncvar)
+        if (ncvar not in g['external_variables'] and
+            filename is not None and filename != g['filename'] and
+            not set(g['compression']).intersection(
+                g['variable_dimensions'][ncvar])):
+            external = self._external_files.get(
+                self._external_file_key(filename))
+            if external is not None:
+                key = (measure, ncvar, g['trust_actual_range'])
+                cell_measure = external['constructs'].get(key)
+                if cell_measure is not None:
+                    # Copy-on-write means that the data are shared
+                    return cell_measure.copy()
+        #--- End: if
         
         # Initialise the cell measure construct
         cell_measure = self.implementation.initialise_CellMeasure(measure=measure)
@@ -2809,6 +3014,11 @@ variable's netCDF dimensions.
             self.implementation.set_properties(cell_measure, g['variable_attributes'][ncvar])
             data = self._create_data(ncvar, cell_measure)            
             self.implementation.set_data(cell_measure, data, copy=False)
+
+            if external is not None:
+                key = (measure, ncvar, g['trust_actual_range'])
+                external['constructs'][key] = cell_measure.copy()
+        #--- End: if
             
         return cell_measure
     #--- End: def
@@ -3257,7 +3467,18 @@ variable's netCDF dimensions.
                         raise ValueError("Bad compression vibes. c.keys()={}".format(list(c.keys())))
         #--- End: if
 
-        return self._create_Data(array, ncvar=ncvar)
+        data = self._create_Data(array, ncvar=ncvar)
+
+        if g['trust_actual_range']:
+            actual_range = g['variable_attributes'][ncvar].get('actual_range')
+            if actual_range is not None and numpy.size(actual_range) == 2:
+                minimum, maximum = numpy.ravel(actual_range)
+                if minimum <= maximum:
+                    self.implementation.set_data_statistics(
+                        data, minimum=minimum, maximum=maximum)
+        #--- End: if
+
+        return data
     #--- End: def
 
     def _create_domain_axis(self, size, ncdim=None):
@@ -3339,7 +3560,77 @@ variable's netCDF dimensions.
 
         if not cell_methods_string:
             return out
-        
+
+        parsed_cell_methods = self._parsed_attribute(
+            'cell_methods', cell_methods_string,
+            self._parse_cell_methods_string)
+
+        if parsed_cell_methods is None:
+            self._add_message(field_ncvar, field_ncvar,
+                              message=incorrect_interval,
+                              attribute=attribute)
+            return []
+
+        for parsed_cm in parsed_cell_methods:
+            cm = dict(parsed_cm)
+            cm['axes'] = list(cm['axes'])
+
+            if 'interval' in cm:
+                intervals = []
+                for parsed_interval, units in cm['interval']:
+                    try:
+                        data = self.implementation.initialise_Data(
+                            array=parsed_interval,
+                            units=units,
+                            copy=False)
+                    except:
+                        self._add_message(
+                            field_ncvar, field_ncvar,
+                            message=incorrect_interval,
+                            attribute=attribute)
+                        return []
+
+                    intervals.append(data)
+                #--- End: for
+
+                cm['interval'] = intervals
+            #--- End: if
+
+            out.append(cm)
+        #--- End: for
+
+        return out
+    #--- End: def
+
+    def _parse_cell_methods_string(self, cell_methods_string):
+        '''Parse a CF cell_methods string into an immutable structure.
+
+The result does not depend on the data variable, and so may be shared
+between all data variables with the same cell_methods attribute.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    cell_methods_string: `str`
+        A CF cell_methods string.
+
+:Returns:
+
+    `tuple` or `None`
+        A tuple with an element for each cell method, each of which
+        is a tuple of ``(name, value)`` pairs. Intervals are given as
+        a tuple of ``(value, units)`` pairs. `None` is returned if a
+        cell method interval is incorrectly formatted.
+
+**Examples:**
+
+>>> n._parse_cell_methods_string('time: mean (interval: 1 hour)')
+((('axes', ('time',)), ('method', 'mean'), ('interval', ((1, 'hour'),))),)
+
+        '''
+        out = []
+
         # ------------------------------------------------------------
         # Split the cell_methods string into a list of strings ready
         # for parsing. For example:
@@ -3354,7 +3645,7 @@ variable's netCDF dimensions.
         cell_methods = re.sub('(?<=[^\s])\)', ' )', cell_methods).split()
 
         while cell_methods:
-            cm = {}
+            cm = []
 
             axes  = []
             while cell_methods:
@@ -3369,29 +3660,29 @@ variable's netCDF dimensions.
 
                 axes.append(axis)
             #--- End: while
-            cm['axes'] = axes
+            cm.append(('axes', tuple(axes)))
 
             if not cell_methods:
-                out.append(cm)
+                out.append(tuple(cm))
                 break
 
             # Method
-            cm['method'] = cell_methods.pop(0)
+            cm.append(('method', cell_methods.pop(0)))
             
             if not cell_methods:
-                out.append(cm)
+                out.append(tuple(cm))
                 break
 
             # Climatological statistics, and statistics which apply to
             # portions of cells
             while cell_methods[0] in ('within', 'where', 'over'):
                 attr = cell_methods.pop(0)
-                cm[attr] = cell_methods.pop(0)
+                cm.append((attr, cell_methods.pop(0)))
                 if not cell_methods:
                     break
             #--- End: while
             if not cell_methods: 
-                out.append(cm)
+                out.append(tuple(cm))
                 break
 
             # interval and comment
@@ -3415,24 +3706,9 @@ variable's netCDF dimensions.
                         try:
                             parsed_interval = literal_eval(interval)
                         except (SyntaxError, ValueError):
-                            self._add_message(
-                                field_ncvar, field_ncvar,
-                                message=incorrect_interval)
-                            return []
-
-                        try:
-                            data = self.implementation.initialise_Data(
-                                array=parsed_interval,
-                                units=units,
-                                copy=False)
-                        except:
-                            self._add_message(
-                                field_ncvar, field_ncvar,
-                                message=incorrect_interval,
-                                attribute=attribute)
-                            return []
+                            return None
 
-                        intervals.append(data)
+                        intervals.append((parsed_interval, units))
                         continue
                     #--- End: if
 
@@ -3445,7 +3721,7 @@ variable's netCDF dimensions.
                                 break
                             comment.append(cell_methods.pop(0))
                         #--- End: while
-                        cm['comment'] = ' '.join(comment)
+                        cm.append(('comment', ' '.join(comment)))
                 #--- End: while 
 
                 if cell_methods[0].endswith(')'):
@@ -3454,19 +3730,15 @@ variable's netCDF dimensions.
 
             n_intervals = len(intervals)          
             if n_intervals > 1 and n_intervals != len(axes):
-                self._add_message(
-                    field_ncvar, field_ncvar,
-                    message=incorrect_interval,
-                    attribute=attribute)
-                return []
+                return None
 
             if intervals:
-                cm['interval'] = intervals
+                cm.append(('interval', tuple(intervals)))
 
-            out.append(cm)
+            out.append(tuple(cm))
         #--- End: while
 
-        return out
+        return tuple(out)
     #--- End: def
 
     def _create_formula_terms_ref(self, f, key, coord, formula_terms):
@@ -3905,10 +4177,13 @@ Checks that
 
         parent_dimensions  = self._ncdimensions(field_ncvar)
         external_variables = g['external_variables']
-        
+
+        key = ('cell_measures', string, tuple(parent_dimensions))
+        if key in g['compliant_attributes']:
+            return True
+
         ok = True
-        for x in parsed_string:
-            measure, values = list(x.items())[0]
+        for measure, values in parsed_string:
             if len(values) != 1:
                 self._add_message(field_ncvar, field_ncvar,
                                   message=incorrectly_formatted,
@@ -3947,6 +4222,9 @@ Checks that
                     continue
         #--- End: for
 
+        if ok:
+            g['compliant_attributes'].add(key)
+
         return ok
     #--- End: def
 
@@ -3990,7 +4268,11 @@ Checks that
             return False
 
         parent_dimensions = self._ncdimensions(field_ncvar)
-        
+
+        key = ('ancillary_variables', string, tuple(parent_dimensions))
+        if key in g['compliant_attributes']:
+            return True
+
         ok = True
         for ncvar in parsed_string:
             # Check that the variable exists in the file
@@ -4012,6 +4294,9 @@ Checks that
                 continue
         #--- End: for
 
+        if ok:
+            g['compliant_attributes'].add(key)
+
         return ok
     #--- End: def
 
@@ -4050,12 +4335,16 @@ Checks that
         # Check that the variable's dimensions span a subset of the
         # parent variable's dimensions (allowing for char variables
         # with a trailing dimension)
-        dimensions        = self._ncdimensions(coord_ncvar)
         parent_dimensions = self._ncdimensions(field_ncvar)
 
-        if not self._dimensions_are_subset(coord_ncvar,
-                                           self._ncdimensions(coord_ncvar),
-                                           self._ncdimensions(field_ncvar)):
+        key = ('coordinates', coord_ncvar, tuple(parent_dimensions))
+        if key in g['compliant_attributes']:
+            return True
+
+        dimensions = self._ncdimensions(coord_ncvar)
+
+        if not self._dimensions_are_subset(coord_ncvar, dimensions,
+                                           parent_dimensions):
             d = self._add_message(field_ncvar, coord_ncvar,
                                   message=incorrect_dimensions,
                                   attribute=attribute,
@@ -4063,6 +4352,8 @@ Checks that
                                   conformance='5.requirement.6')
             return False
 
+        g['compliant_attributes'].add(key)
+
         return True
     #--- End: def
 
@@ -4115,9 +4406,12 @@ Checks that
                               conformance='5.6.requirement.1')
             return False
 
+        key = ('grid_mapping', grid_mapping)
+        if key in g['compliant_attributes']:
+            return True
+
         ok = True
-        for x in parsed_grid_mapping:
-            grid_mapping_ncvar, values = list(x.items())[0]
+        for grid_mapping_ncvar, values in parsed_grid_mapping:
             if grid_mapping_ncvar not in g['internal_variables']:
                 ok = False
                 self._add_message(field_ncvar, grid_mapping_ncvar,
@@ -4136,7 +4430,9 @@ Checks that
         
         if not ok:
             return False
-        
+
+        g['compliant_attributes'].add(key)
+
         return True
     #--- End: def
 
@@ -4388,16 +4684,82 @@ CF-1.7 Appendix A
         return sample_dimension in self.read_vars['internal_dimension_sizes']
     #--- End: def
         
+    def _parsed_attribute(self, attribute, string, parser):
+        '''Return the parsed form of a CF attribute string.
+
+Each distinct attribute string is parsed only once per read, since
+many data variables in a file often have identical attributes.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    attribute: `str`
+        The type of attribute, which distinguishes the cached results
+        of different parsers.
+
+        *Parameter example:*
+          ``attribute='cell_methods'``
+
+    string: `str`
+        The attribute string.
+
+    parser: function
+        The function that parses the attribute string. It must return
+        an immutable structure.
+
+:Returns:
+
+        The parsed attribute string.
+
+        '''
+        parsed_attributes = self.read_vars['parsed_attributes']
+
+        key = (attribute, string)
+        try:
+            return parsed_attributes[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # An attribute value that can't be cached (such as a
+            # numpy array)
+            return parser(string)
+
+        out = parser(string)
+        parsed_attributes[key] = out
+
+        return out
+    #--- End: def
+
     def _split_string_by_white_space(self, parent_ncvar, string):
         '''Split a string by white space.
+
+:Returns:
+
+    `tuple`
+
         '''
         if string is None:
-            return []
-        
+            return ()
+
+        return self._parsed_attribute('split', string,
+                                      self._split_words)
+    #--- End: def
+
+    def _split_words(self, string):
+        '''Split a string by white space.
+
+.. versionadded:: 1.7.3
+
+:Returns:
+
+    `tuple`
+
+        '''
         try:
-            return string.split()
+            return tuple(string.split())
         except AttributeError:
-            return []         
+            return ()
     #--- End: def
 
     def _parse_grid_mapping(self, parent_ncvar, string):
@@ -4414,16 +4776,41 @@ CF-1.7 Appendix A
             # single netCDF variable
             out = self._split_string_by_white_space(parent_ncvar, string)
             if len(out) == 1:
-                return [{out[0]: []}]
+                return ((out[0], ()),)
 
-            return []
+            return ()
     #--- End: def
     
     def _parse_x(self, parent_ncvar, string):
-        '''
+        '''Parse an attribute of the form "name: value1 value2 ..."
+
+:Returns:
+
+    `tuple`
+        The parsed attribute as a tuple of ``(name, values)`` pairs,
+        where *values* is a tuple. An empty tuple is returned if the
+        string is incorrectly formatted.
+
+**Examples:**
+
+>>> n._parse_x('tas', 'area: areacella volume: volcello')
+(('area', ('areacella',)), ('volume', ('volcello',)))
+>>> n._parse_x('tas', 'rotated_latitude_longitude')
+(('rotated_latitude_longitude', ()),)
 
 .. versionadded:: 1.7.0
 
+        '''
+        return self._parsed_attribute('x', string, self._parse_x_string)
+    #--- End: def
+
+    def _parse_x_string(self, string):
+        '''Parse an attribute of the form "name: value1 value2 ..."
+
+See `_parse_x` for details.
+
+.. versionadded:: 1.7.3
+
         '''
         # ============================================================
         # Thanks to Alan Iwi for creating these regular expressions
@@ -4446,22 +4833,22 @@ CF-1.7 Appendix A
         m = re.match(pat_all, string)
 
         if m is None:
-            return []
+            return ()
             
         sole_mapping = m.group('sole_mapping')
         if sole_mapping:
-            out.append({sole_mapping: []})
+            out.append((sole_mapping, ()))
         else:
             mapping_list = m.group('mapping_list')
             for mapping in re.finditer(pat_mapping, mapping_list):
                 term = mapping.group('mapping_name')
-                values = [value.group('value')
-                          for value in re.finditer(pat_value, mapping.group('values'))]
+                values = tuple([value.group('value')
+                                for value in re.finditer(pat_value, mapping.group('values'))])
 
-                out.append({term: values})
+                out.append((term, values))
         #--- End: if
         
-        return out
+        return tuple(out)
     #--- End: def
 
 #--- End: class
@@ -3,6 +3,7 @@ from builtins import (str, zip)
 from past.builtins import basestring
 
 import copy
+import itertools
 import os
 import re
 
@@ -150,14 +151,24 @@ class NetCDFWrite(IOWrite):
         self.write_vars['nc'][ncvar].setncatts(netcdf_attrs)
     #--- End: def
     
-    def _character_array(self, array):
+    def _character_array(self, array, strlen=None):
         '''Convert a numpy string array to a numpy character array wih an
 extra trailing dimension.
+
+The conversion is carried out by viewing the fixed-width string array
+as a contiguous array of single characters, and masked elements are
+converted to empty strings.
     
 :Parameters:
 
     array: `numpy.ndarray`
 
+    strlen: `int`, optional
+        The size of the trailing dimension. By default it is the
+        length of the longest string. Longer strings are truncated.
+
+        .. versionadded:: 1.7.3
+
 :Returns:
 
     out: `numpy.ndarray`
@@ -168,73 +179,62 @@ extra trailing dimension.
 ['fu' 'bar'] (2,) 3
 >>> b = _character_array(a)
 >>> print b, b.shape, b.dtype.itemsize
-[['f' 'u' ' ']
+[['f' 'u' '']
  ['b' 'a' 'r']] (2, 3) 1
 
 >>> print a, a.shape, a.dtype.itemsize
 [-- 'bar'] (2,) 3
 >>> b = _character_array(a)
 >>> print b, b.shape, b.dtype.itemsize
-[[-- -- --]
+[['' '' '']
  ['b' 'a' 'r']] (2, 3) 1
 
         '''
-#        strlen = array.dtype.itemsize
-        original_shape = array.shape
-        original_size  = array.size
-
-        masked = numpy.ma.isMA(array)
-        if masked:
-            fill_value = array.fill_value
-            mask = array.mask
+        if numpy.ma.isMA(array):
             array = numpy.ma.filled(array, fill_value='')
 
         if array.dtype.kind == 'U':
             array = array.astype('S')
 
-        array = numpy.array(tuple(array.tostring().decode('ascii')), dtype='S1')
+        if strlen is None:
+            strlen = self._string_length(array)
 
-#        else:
-#            # dtype is 'U'
-#            x = []
-#            for s in array.flatten():
-#                x.extend(tuple(s.ljust(N, '\x00')))
-#
-#            array = numpy.array(k, dtype='S1')               
-
-        array.resize(original_shape + (array.size//original_size,))
-#        if masked:        
-#            array = numpy.ma.array(array, mask=mask, fill_value=fill_value)
-        
-#        if array.dtype.kind == 'U':
-#            # Convert unicode to string
-#            array = array.astype('S')
-#            
-#        new = netCDF4.stringtochar(array, encoding='none')
-#        print('new=', repr(new))
-##        print('AAAAAAAAAAAAAAAAAA new.shape=', new.shape, repr(new))
-        
-        if masked:
-            array = numpy.ma.masked_where(array=='', array)
-            array.set_fill_value(fill_value)
-
-        if array.dtype.kind != 'S':
-            raise ValueError("AAAAAAAAARRRRRRRRRRRRRRRGGGGGGGGGGHHHHHHHH")
-        
-#            new = numpy.ma.array(new, mask=mask, fill_value=fill_value)
-
-#        new = numpy.ma.masked_all(shape + (strlen,), dtype='S1')
-#        
-#        for index in numpy.ndindex(shape):
-#            value = array[index]
-#            if value is numpy.ma.masked:
-#                new[index] = numpy.ma.masked
-#            else:
-#                new[index] = tuple(value.ljust(strlen, ' ')) 
-#        #--- End: for
-
-#        print('new=', repr(new))
-        return array
+        array = numpy.ascontiguousarray(array, dtype='S{}'.format(strlen))
+
+        return array.view('S1').reshape(array.shape + (strlen,))
+    #--- End: def
+
+    def _string_length(self, array):
+        '''Return the length of the longest string in an array.
+
+Masked elements are ignored.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    array: `numpy.ndarray`
+        A string valued array.
+
+:Returns:
+
+    `int`
+        The length of the longest string, or 1 if there are no
+        non-empty strings.
+
+**Examples:**
+
+>>> w._string_length(numpy.array(['fu', 'bar']))
+3
+
+        '''
+        if numpy.ma.is_masked(array):
+            array = array.compressed()
+
+        if not array.size:
+            return 1
+
+        return max(int(numpy.char.str_len(array).max()), 1)
     #--- End: def
     
     def _datatype(self, variable):
@@ -436,6 +436,10 @@ If the construct has no data, then return `None`
             size = self.implementation.get_domain_axis_size(f, axis)
         
             g['axis_to_ncdim'][axis] = ncdim
+
+            axis_type = self._axis_type(f, axis)
+            if axis_type is not None:
+                g['ncdim_to_axis_type'][ncdim] = axis_type
         #--- End: if
         
         g['ncdim_to_size'][ncdim] = size
@@ -872,7 +876,15 @@ dictionary.
         g = self.write_vars
 
         seen = g['seen']
-    
+
+        # Variables with equal fingerprints are equal, and so may be
+        # matched without a full comparison. Calculating a fingerprint
+        # reads the whole data array, so fingerprints are only
+        # calculated for candidates of the same type, with the same
+        # data shape and data type, and with the same properties.
+        fingerprint = False
+        signature = self._fingerprint_signature(variable)
+        
         for value in seen.values():
             if ncdims is not None and ncdims != value['ncdims']:
                 # The netCDF dimensions (names and order) of the input
@@ -881,17 +893,77 @@ dictionary.
                 continue
     
             # Still here?
-            if self.implementation.equal_constructs(variable, value['variable'],
-                                                    ignore_type=ignore_type):
-                seen[id(variable)] = {'variable': variable,
-                                      'ncvar'   : value['ncvar'],
-                                      'ncdims'  : value['ncdims']}
+            matched = False
+            if 'signature' not in value:
+                value['signature'] = self._fingerprint_signature(
+                    value['variable'])
+
+            if signature == value['signature']:
+                if fingerprint is False:
+                    fingerprint = self.implementation.get_fingerprint(variable)
+
+                if 'fingerprint' not in value:
+                    value['fingerprint'] = self.implementation.get_fingerprint(
+                        value['variable'])
+
+                matched = (fingerprint is not None and
+                           fingerprint == value['fingerprint'])
+            #--- End: if
+
+            if not matched:
+                matched = self.implementation.equal_constructs(
+                    variable, value['variable'], ignore_type=ignore_type)
+                
+            if matched:
+                seen[id(variable)] = {'variable' : variable,
+                                      'ncvar'    : value['ncvar'],
+                                      'ncdims'   : value['ncdims'],
+                                      'signature': signature}
                 return True
         #--- End: for
         
         return False
     #--- End: def
 
+    def _fingerprint_signature(self, variable):
+        '''Return a signature that is shared by variables with equal
+fingerprints.
+
+The signature comprises the type, the property names, and the data
+shape and data type, and is found without reading any data.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `_already_in_file`
+
+:Parameters:
+
+    variable:
+        The variable.
+
+:Returns:
+
+    `tuple`
+        The signature.
+
+        '''
+        try:
+            properties = tuple(sorted(
+                self.implementation.get_properties(variable)))
+        except AttributeError:
+            properties = None
+
+        try:
+            data = self.implementation.get_data(variable, None)
+        except AttributeError:
+            data = None
+
+        if data is None:
+            return (type(variable), properties)
+
+        return (type(variable), properties, data.shape, data.dtype)
+    #--- End: def
+
     def _write_geometry_container(self, field, geometry_container):
         '''Write a netCDF geometry container variable.
 
@@ -1972,15 +2044,8 @@ created. The ``seen`` dictionary is updated for *cfvar*.
             # trailing dimension.
             # --------------------------------------------------------
 
-            strlen = data.dtype.itemsize
-            array = data.array
-            if numpy.ma.is_masked(array):
-                array = array.compressed()
-            strlen = len(max(array, key=len))
-
-#            strlen = len(max(data.array, key=len))
-#            if strlen > 1:
             data = self._convert_to_char(data)
+            strlen = data.shape[-1]
             ncdim = self._string_length_dimension(strlen)            
 
             ncdimensions = original_ncdimensions + (ncdim,)
@@ -2004,10 +2069,16 @@ created. The ``seen`` dictionary is updated for *cfvar*.
         else:
             lsd = None
     
-        # Set HDF chunk sizes
+        # Set HDF chunk sizes. Chunk sizes that have been set on the
+        # data take precedence over those computed from the chunking
+        # strategy.
         chunksizes = None
         if data is not None:
             chunksizes = self.implementation.nc_get_hdf5_chunksizes(data)
+            if chunksizes is None and g['chunking']:
+                chunksizes = self._chunksizes(ncdimensions, datatype,
+                                              string=(datatype == 'S1'))
+
             if chunksizes and verbose:
                 print('      HDF5 chunksizes:', chunksizes)
         #--- End: if
@@ -2076,7 +2147,13 @@ created. The ``seen`` dictionary is updated for *cfvar*.
     #--- End: def
     
     def _write_data(self, data, ncvar, ncdimensions, unset_values=()):
-        '''
+        '''Write data to a netCDF variable.
+
+The data are written in blocks whose sizes do not exceed the
+``block_bytes`` write parameter. If the data are being written over a
+sample dimension then the blocks are read directly from the underlying
+compressed array, so that the compressed data are never realised in
+memory all at once.
 
 :Parameters:
 
@@ -2091,35 +2168,106 @@ created. The ``seen`` dictionary is updated for *cfvar*.
         '''
         g = self.write_vars
 
-        if set(ncdimensions).intersection(g['sample_ncdim'].values()):
-            # Get the data as a compressed numpy array
-            array = self.implementation.get_compressed_array(data)
+        compressed_array = self.implementation.get_compressed_underlying_array(
+            data)
+        
+        if (compressed_array is not None and
+            set(ncdimensions).intersection(g['sample_ncdim'].values())):
+            # Get the blocks from the underlying compressed array
+            blocks = self._data_blocks(compressed_array.shape,
+                                       compressed_array.dtype)
+            get_block = compressed_array.__getitem__
+        elif compressed_array is not None:
+            # Get the data as a single uncompressed numpy array
+            blocks = (Ellipsis,)
+            get_block = lambda indices: self.implementation.get_array(data)
         else:
-            # Get the data as an uncompressed numpy array
-            array = self.implementation.get_array(data)
+            # Get the blocks from the uncompressed data
+            blocks = self._data_blocks(data.shape, data.dtype)
+            get_block = lambda indices: self.implementation.get_array(
+                data[indices])
+
+        for indices in blocks:
+            array = get_block(indices)
+
+            # Convert data type
+            new_dtype = g['datatype'].get(array.dtype)
+            if new_dtype is not None:
+                array = array.astype(new_dtype)  
+    
+            # Check that the array doesn't contain any elements
+            # which are equal to any of the missing data values
+            if unset_values:
+                if numpy.ma.is_masked(array):
+                    temp_array = array.compressed()
+                else:
+                    temp_array = array
+                    
+                if numpy.intersect1d(unset_values, temp_array).size:
+                    raise ValueError(
+"ERROR: Can't write data that has _FillValue or missing_value at unmasked point: {!r}".format(ncvar))
+            #--- End: if
+    
+            # Copy the array into the netCDF variable
+            g['nc'][ncvar][indices] = array
+    
+            self._aaa(ncvar, array)
+    #--- End: def
 
-        # Convert data type
-        new_dtype = g['datatype'].get(array.dtype)
-        if new_dtype is not None:
-            array = array.astype(new_dtype)  
+    def _data_blocks(self, shape, dtype):
+        '''Return the indices of the blocks in which to write an array.
 
-        # Check that the array doesn't contain any elements
-        # which are equal to any of the missing data values
-        if unset_values:
-            if numpy.ma.is_masked(array):
-                temp_array = array.compressed()
-            else:
-                temp_array = array
-                
-            if numpy.intersect1d(unset_values, temp_array):
-                raise ValueError(
-"ERROR: Can't write data that has _FillValue or missing_value at unmasked point: {!r}".format(cfvar))
-        #--- End: if
+Each block spans the whole of all but its leading dimensions, and is
+no larger than the ``block_bytes`` write parameter unless a single
+element of the leading dimensions is larger.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    shape: `tuple` of `int`
+        The shape of the array.
+
+    dtype: `numpy.dtype`
+        The data type of the array.
+
+:Returns:
+
+    generator
+        The indices of each block, as `tuple` of `slice` objects.
 
-        # Copy the array into the netCDF variable
-        g['nc'][ncvar][...] = array
+**Examples:**
 
-        self._aaa(ncvar, array)
+>>> w.write_vars['block_bytes'] = 8*90
+>>> list(w._data_blocks((2, 10, 9), numpy.dtype(float)))
+[(slice(0, 1, None), slice(0, 10, None), slice(0, 9, None)),
+ (slice(1, 2, None), slice(0, 10, None), slice(0, 9, None))]
+
+        '''
+        shape = tuple(shape)
+        if not shape or not numpy.prod(shape):
+            yield Ellipsis
+            return
+
+        max_size = max(self.write_vars['block_bytes'] // dtype.itemsize, 1)
+
+        # Find the outermost dimension along which to split the
+        # array, such that a single element of it fits in a block
+        for axis in range(len(shape)):
+            size = int(numpy.prod(shape[axis+1:]))
+            if size <= max_size:
+                break
+        #--- End: for
+
+        step = max(max_size // size, 1)
+        inner = [slice(0, n) for n in shape[axis+1:]]
+
+        for outer in itertools.product(*[range(n) for n in shape[:axis]]):
+            outer = [slice(i, i+1) for i in outer]
+            for i in range(0, shape[axis], step):
+                yield tuple(outer
+                            + [slice(i, min(i+step, shape[axis]))]
+                            + inner)
     #--- End: def
 
     def _aaa(self, ncvar, array):
@@ -2132,7 +2280,8 @@ created. The ``seen`` dictionary is updated for *cfvar*.
         '''Convert string data into character data
 
 The return Data instance object will have data type 'S1' and will have an
-extra trailing dimension.
+extra trailing dimension whose size is the length of the longest
+string.
     
 .. versionadded:: 1.7.0
 
@@ -2145,9 +2294,6 @@ extra trailing dimension.
     out: Data instance
 
         '''
-        strlen = data.dtype.itemsize
-#        print ('1 strlen =', strlen)
-#        if strlen > 1:
         data = self.implementation.initialise_Data(
                 array=self._character_array(self.implementation.get_array(data)),
                 units=self.implementation.get_data_units(data, None),
@@ -2820,6 +2966,462 @@ extra trailing dimension.
         return axis in self.implementation.nc_get_unlimited_axes(field)
     #--- End: def
     
+    def _axis_type(self, field, axis):
+        '''Return the spatiotemporal type of a domain axis.
+
+The type is inferred from the "axis", "standard_name" and "units"
+properties of a one-dimensional coordinate construct that spans the
+domain axis, with dimension coordinate constructs taking precedence
+over auxiliary coordinate constructs.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+  
+    field: Field construct
+
+    axis: `str`
+        The domain axis construct identifier.
+   
+:Returns:
+
+    `str` or `None`
+        One of ``'T'``, ``'Z'``, ``'Y'`` or ``'X'``, or `None` if the
+        type could not be inferred.
+
+        '''
+        coordinates = list(
+            self.implementation.get_dimension_coordinates(field).items())
+        coordinates += sorted(
+            self.implementation.get_auxiliary_coordinates(field).items())
+
+        for key, coord in coordinates:
+            if self.implementation.get_construct_data_axes(field, key) != (axis,):
+                continue
+
+            axis_type = self.implementation.get_property(coord, 'axis', None)
+            if axis_type in ('T', 'Z', 'Y', 'X'):
+                return axis_type
+
+            standard_name = self.implementation.get_property(
+                coord, 'standard_name', None)
+            axis_type = constants.axis_type_standard_names.get(standard_name)
+            if axis_type is not None:
+                return axis_type
+
+            units = self.implementation.get_property(coord, 'units', None)
+            if isinstance(units, basestring) and ' since ' in units:
+                return 'T'
+        #--- End: for
+
+        return None
+    #--- End: def
+
+    def _chunksizes(self, ncdimensions, datatype, string=False):
+        '''Return HDF5 chunk sizes computed from the chunking strategy.
+
+The chunk shape is found by starting with chunks that span the whole
+of each dimension and then repeatedly halving the largest chunk size
+of a dimension that may be reduced, until the chunk contains no more
+than the target number of bytes, or no more dimensions may be
+reduced. Which dimensions may be reduced depends on the strategy:
+
+==================  ==================================================
+Strategy            Description
+==================  ==================================================
+``'auto'``          All dimensions may be reduced.
+
+``'timeseries'``    The T dimension is only reduced once all other
+                    dimensions have chunk size 1.
+
+``'map'``           The X and Y dimensions are never reduced. All
+                    other dimensions may be reduced.
+==================  ==================================================
+
+A trailing string-length dimension is never reduced.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    ncdimensions: `tuple` of `str`
+        The netCDF dimension names of the variable.
+
+    datatype: `str`
+        The `netCDF4.createVariable` data type of the variable.
+
+    string: `bool`, optional
+        If True then the last netCDF dimension is a string-length
+        dimension.
+
+:Returns:
+
+    `tuple` or `None`
+        The HDF5 chunk sizes, or `None` if chunk sizes are not
+        appropriate for the variable.
+
+        '''
+        g = self.write_vars
+
+        if not ncdimensions or not g['fmt'].startswith('NETCDF4'):
+            return None
+
+        chunksizes = [g['ncdim_to_size'][ncdim] for ncdim in ncdimensions]
+        if 0 in chunksizes:
+            return None
+
+        itemsize = numpy.dtype(datatype).itemsize
+        max_size = max(g['chunk_bytes'] // itemsize, 1)
+
+        axis_types = [g['ncdim_to_axis_type'].get(ncdim)
+                      for ncdim in ncdimensions]
+        if string:
+            axis_types[-1] = 'string'
+
+        strategy = g['chunking']
+        if strategy == 'timeseries':
+            reducible = ([i for i, t in enumerate(axis_types)
+                          if t not in ('T', 'string')],
+                         [i for i, t in enumerate(axis_types) if t == 'T'])
+        elif strategy == 'map':
+            reducible = ([i for i, t in enumerate(axis_types)
+                          if t not in ('X', 'Y', 'string')],)
+        else:
+            reducible = ([i for i, t in enumerate(axis_types)
+                          if t != 'string'],)
+
+        for positions in reducible:
+            while (numpy.prod(chunksizes, dtype=int) > max_size and
+                   positions):
+                i = max(positions, key=lambda j: chunksizes[j])
+                if chunksizes[i] == 1:
+                    break
+
+                chunksizes[i] = -(-chunksizes[i] // 2)
+        #--- End: for
+
+        return tuple(chunksizes)
+    #--- End: def
+
+    def _append_ncdimensions(self, f, axes, axis_to_ncdim, variable):
+        '''Return the netCDF dimensions of an existing netCDF variable that
+correspond to domain axes.
+
+Domain axes that do not have a netCDF dimension name are assumed to
+correspond to the netCDF dimension in the same position.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    f: Field construct
+
+    axes: sequence of `str`
+        The domain axis construct identifiers.
+
+    axis_to_ncdim: `dict`
+        Mapping of domain axis construct identifiers to netCDF
+        dimension names.
+
+    variable: `netCDF4.Variable`
+
+:Returns:
+
+    `tuple`
+        The netCDF dimension names.
+
+        '''
+        ncdimensions = variable.dimensions
+        if len(axes) > len(ncdimensions):
+            raise ValueError(
+"Can't append {!r}: Data has more dimensions than netCDF variable {!r}".format(
+    f, variable.name))
+
+        return tuple([axis_to_ncdim.get(axis) or ncdim
+                      for axis, ncdim in zip(axes, ncdimensions)])
+    #--- End: def
+
+    def _append_check_metadata(self, f, construct, variable):
+        '''Check that a construct is consistent with an existing netCDF
+variable that it is to be appended to.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    f: Field construct
+
+    construct:
+        The field or metadata construct.
+
+    variable: `netCDF4.Variable`
+
+:Returns:
+
+    `None`
+
+        '''
+        attributes = variable.ncattrs()
+        for prop in ('standard_name', 'units', 'calendar'):
+            value0 = self.implementation.get_property(construct, prop, None)
+            if prop in attributes:
+                value1 = variable.getncattr(prop)
+            else:
+                value1 = None
+                
+            if value0 != value1:
+                raise ValueError(
+"Can't append {!r}: {!r} has {} {!r} but netCDF variable {!r} has {!r}".format(
+    f, construct, prop, value0, variable.name, value1))
+        #--- End: for
+    #--- End: def
+
+    def _append_data(self, array, ncvar, position, start):
+        '''Write an array to an existing netCDF variable, starting at a
+position along its unlimited dimension.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    array: `numpy.ndarray`
+
+    ncvar: `str`
+        The netCDF variable name.
+
+    position: `int`
+        The position of the unlimited dimension in the array.
+
+    start: `int`
+        The index of the unlimited dimension at which to start
+        writing.
+
+:Returns:
+
+    `None`
+
+        '''
+        g = self.write_vars
+
+        variable = g['netcdf'].variables[ncvar]
+        
+        if array.dtype.kind in 'SU':
+            # Convert a string data type numpy array into a character
+            # data type numpy array that fills the existing string
+            # length dimension
+            strlen = variable.shape[-1]
+            if array.dtype.itemsize > strlen:
+                if array.dtype.kind == 'U':
+                    lengths = numpy.char.str_len(array.astype('U'))
+                else:
+                    lengths = numpy.char.str_len(array)
+
+                if numpy.ma.max(lengths) > strlen:
+                    raise ValueError(
+"Can't append strings longer than {} characters to netCDF variable {!r}".format(
+    strlen, ncvar))
+            #--- End: if
+            
+            array = self._character_array(array, strlen=strlen)
+        #--- End: if
+            
+        indices = [slice(None)] * variable.ndim
+        indices[position] = slice(start, start + array.shape[position])
+
+        variable[tuple(indices)] = array
+    #--- End: def
+
+    def _append_field(self, f):
+        '''Find the new records of a field construct that are to be
+appended to an existing netCDF file.
+
+The field construct is matched to a netCDF data variable with the
+same netCDF variable name, and must have the same "standard_name",
+"units" and "calendar" properties. Its data, and the data of its
+metadata constructs that span the unlimited dimension of the netCDF
+data variable, are to be written to the file after the existing
+records.
+
+The data to be written are added to ``g['append_data']``, so that
+they may be written once the file has been reopened in append mode.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    f: Field construct
+
+:Returns:
+
+    `None`
+
+        '''
+        g = self.write_vars
+
+        nc = g['netcdf']
+        verbose = g['verbose']
+        
+        if verbose:
+            print('  Appending', repr(f)+':')
+
+        ncvar = self.implementation.nc_get_variable(f, None)
+        if ncvar is None or ncvar not in nc.variables:
+            raise ValueError(
+"Can't append {!r}: No netCDF data variable {!r} in {}".format(
+    f, ncvar, g['filename']))
+
+        if ncvar in g['appended']:
+            raise ValueError(
+"Can't append {!r}: NetCDF data variable {!r} has already been appended to".format(
+    f, ncvar))
+            
+        variable = nc.variables[ncvar]
+
+        self._append_check_metadata(f, f, variable)
+
+        unlimited = [ncdim for ncdim in variable.dimensions
+                     if nc.dimensions[ncdim].isunlimited()]
+        if len(unlimited) != 1:
+            raise ValueError(
+"Can't append {!r}: NetCDF data variable {!r} does not have exactly one unlimited dimension".format(
+    f, ncvar))
+
+        unlimited_ncdim = unlimited[0]
+        
+        # ------------------------------------------------------------
+        # Map domain axes to netCDF dimensions, preferring netCDF
+        # dimension names over coordinate variable names
+        # ------------------------------------------------------------
+        axis_to_ncdim = {}
+        for key, coord in self.implementation.get_dimension_coordinates(f).items():
+            axis = self.implementation.get_construct_data_axes(f, key)[0]
+            axis_to_ncdim[axis] = self.implementation.nc_get_variable(coord,
+                                                                      None)
+
+        for axis, domain_axis in self.implementation.get_domain_axes(f).items():
+            ncdim = self.implementation.nc_get_dimension(domain_axis, None)
+            if ncdim is not None:
+                axis_to_ncdim[axis] = ncdim
+        #--- End: for
+        
+        data_axes = list(self.implementation.get_field_data_axes(f))
+
+        unlimited_axis = [axis for axis, ncdim in axis_to_ncdim.items()
+                          if ncdim == unlimited_ncdim]
+        if (len(unlimited_axis) == 1 and unlimited_axis[0] not in data_axes
+            and len(data_axes) < len(variable.dimensions)):
+            # Expand the field's data array to include the unlimited
+            # dimension
+            f = self.implementation.field_insert_dimension(
+                f, position=variable.dimensions.index(unlimited_ncdim),
+                axis=unlimited_axis[0])
+            data_axes = list(self.implementation.get_field_data_axes(f))
+            
+        ncdimensions = self._append_ncdimensions(f, data_axes,
+                                                 axis_to_ncdim, variable)
+        if ncdimensions != variable.dimensions[:len(ncdimensions)]:
+            raise ValueError(
+"Can't append {!r}: Data dimensions {} do not match the dimensions of netCDF variable {!r}: {}".format(
+    f, ncdimensions, ncvar, variable.dimensions))
+        
+        position = ncdimensions.index(unlimited_ncdim)
+        axis = data_axes[position]
+        axis_to_ncdim[axis] = unlimited_ncdim
+
+        shape = self.implementation.get_data(f).shape
+        for i, (n, ncdim) in enumerate(zip(shape, ncdimensions)):
+            if i != position and n != len(nc.dimensions[ncdim]):
+                raise ValueError(
+"Can't append {!r}: Size {} of netCDF dimension {!r} does not match data size {}".format(
+    f, len(nc.dimensions[ncdim]), ncdim, n))
+        #--- End: for
+
+        # ------------------------------------------------------------
+        # Find where to start writing the new records. All of the
+        # variables spanning an unlimited dimension must be appended
+        # with the same number of records.
+        # ------------------------------------------------------------
+        start = g['unlimited_start'].setdefault(unlimited_ncdim,
+                                                len(nc.dimensions[unlimited_ncdim]))
+        
+        records = shape[position]
+        if g['unlimited_records'].setdefault(unlimited_ncdim, records) != records:
+            raise ValueError(
+"Can't append {!r}: {} records differs from the {} records appended to other variables with unlimited dimension {!r}".format(
+    f, records, g['unlimited_records'][unlimited_ncdim], unlimited_ncdim))
+
+        # ------------------------------------------------------------
+        # Append the field's data and the data of metadata constructs
+        # which span the unlimited dimension (including coordinate
+        # bounds). Variables that are shared between fields are only
+        # written once.
+        # ------------------------------------------------------------
+        appends = [(f, ncvar, data_axes)]
+        for key, construct in sorted(
+                self.implementation.get_constructs(f, axes={axis: True}).items()):
+            if self.implementation.get_data(construct, None) is None:
+                continue
+
+            construct_ncvar = self.implementation.nc_get_variable(construct,
+                                                                  None)
+            if construct_ncvar is None or construct_ncvar not in nc.variables:
+                raise ValueError(
+"Can't append {!r}: No netCDF variable {!r} in {} for {!r}".format(
+    f, construct_ncvar, g['filename'], construct))
+
+            construct_axes = self.implementation.get_construct_data_axes(f, key)
+            appends.append((construct, construct_ncvar, construct_axes))
+
+            construct_variable = nc.variables[construct_ncvar]
+            attributes = construct_variable.ncattrs()
+            for attr in ('bounds', 'climatology'):
+                if attr not in attributes:
+                    continue
+                
+                bounds = self.implementation.get_bounds(construct, None)
+                if bounds is None:
+                    raise ValueError(
+"Can't append {!r}: {!r} has no bounds for netCDF variable {!r}".format(
+    f, construct, construct_variable.getncattr(attr)))
+
+                appends.append((bounds, construct_variable.getncattr(attr),
+                                construct_axes))
+                break
+            #--- End: for
+        #--- End: for
+
+        for construct, construct_ncvar, construct_axes in appends:
+            if construct_ncvar in g['appended']:
+                continue
+
+            construct_variable = nc.variables[construct_ncvar]
+            
+            if construct is not f:
+                self._append_check_metadata(f, construct, construct_variable)
+            
+            construct_ncdimensions = self._append_ncdimensions(
+                f, construct_axes, axis_to_ncdim, construct_variable)
+            if (construct_ncdimensions !=
+                construct_variable.dimensions[:len(construct_ncdimensions)]):
+                raise ValueError(
+"Can't append {!r}: Dimensions of {!r} do not match the dimensions of netCDF variable {!r}: {}".format(
+    f, construct, construct_ncvar, construct_variable.dimensions))
+            
+            if verbose:
+                print('    Appending {!r} to netCDF variable: {}({})'.format(
+                    construct, construct_ncvar,
+                    ', '.join(construct_variable.dimensions)))
+
+            g['append_data'].append(
+                (self.implementation.get_data(construct),
+                 construct_ncvar,
+                 construct_ncdimensions.index(unlimited_ncdim),
+                 start))
+            
+            g['appended'].add(construct_ncvar)
+        #--- End: for
+    #--- End: def
+
     def _write_global_attributes(self, fields):
         '''Find the netCDF global properties from all of the input fields and
 write them to the netCDF4.Dataset.
@@ -3005,7 +3607,8 @@ write them to the netCDF4.Dataset.
               file_descriptors=None, external=None, Conventions=None,
               datatype=None, least_significant_digit=None,
               endian='native', compress=0, fletcher32=False,
-              shuffle=True, scalar=True, extra_write_vars=None,
+              shuffle=True, scalar=True, chunking=None,
+              chunk_bytes=None, mode='w', extra_write_vars=None,
               verbose=False):
         '''Write fields to a netCDF file.
         
@@ -3113,6 +3716,23 @@ and auxiliary coordinate roles for different data variables.
          *Parameter example:*
            ``Conventions=['CF-1.7', 'CMIP-6.2']``
 
+    chunking: `str`, optional
+        The strategy for setting the HDF5 chunk sizes of netCDF
+        variables whose data have not had chunk sizes set with their
+        `!nc_set_hdf5_chunksizes` method. One of ``'auto'``,
+        ``'timeseries'`` or ``'map'``. By default the netCDF library
+        default chunk sizes are used. Ignored for netCDF3 formats.
+
+    chunk_bytes: `int`, optional
+        The approximate maximum size, in bytes, of a chunk computed
+        from the *chunking* strategy. By default a size of 1 MiB is
+        used.
+
+    mode: `str`, optional
+        If ``'w'`` (the default) then create a new file. If ``'a'``
+        then append the field constructs to an existing file by
+        extending its unlimited dimensions with their new records.
+
 :Returns:
 
     `None`
@@ -3193,6 +3813,22 @@ and auxiliary coordinate roles for different data variables.
             
             'dimensions_with_role': {},
 
+            # HDF5 chunking strategy, and the spatiotemporal types
+            # of netCDF dimensions to which it is applied
+            'chunking': None,
+            'chunk_bytes': constants.chunk_bytes,
+            'block_bytes': constants.block_bytes,
+            'ncdim_to_axis_type': {},
+
+            # Append mode: the sizes of unlimited dimensions prior to
+            # appending, the number of records being appended to
+            # them, the netCDF variables that are to be appended to,
+            # and the data to append to them
+            'unlimited_start'  : {},
+            'unlimited_records': {},
+            'appended'         : set(),
+            'append_data'      : [],
+
             'latest_version': LooseVersion(self.implementation.get_cf_version()),
             'version': {},
         }
@@ -3207,6 +3843,9 @@ and auxiliary coordinate roles for different data variables.
         if extra_write_vars:
             g.update(copy.deepcopy(extra_write_vars))
 
+        if mode not in ('w', 'a'):
+            raise ValueError("Unknown write mode: {!r}".format(mode))
+
         compress = int(compress)
         zlib = bool(compress) 
     
@@ -3271,6 +3910,25 @@ and auxiliary coordinate roles for different data variables.
             })
         g['endian'] = endian
         g['least_significant_digit'] = least_significant_digit
+
+        # -------------------------------------------------------
+        # HDF5 chunking strategy
+        # -------------------------------------------------------
+        if chunking is not None:
+            if chunking not in constants.chunking_strategies:
+                raise ValueError(
+                    "Unknown chunking strategy: {!r}".format(chunking))
+
+            g['chunking'] = chunking
+
+        if chunk_bytes is not None:
+            chunk_bytes = int(chunk_bytes)
+            if chunk_bytes <= 0:
+                raise ValueError(
+                    "chunk_bytes must be a positive integer: {!r}".format(
+                        chunk_bytes))
+
+            g['chunk_bytes'] = chunk_bytes
         
         g['verbose'] = verbose
         
@@ -3293,6 +3951,53 @@ and auxiliary coordinate roles for different data variables.
         # Still here? Open the output netCDF file.
         # ---------------------------------------------------------------
         filename = os.path.expanduser(os.path.expandvars(filename))
+
+        if mode == 'a':
+            # --------------------------------------------------------
+            # Append the new records of each field construct to the
+            # existing file
+            # --------------------------------------------------------
+            if not os.path.isfile(filename):
+                raise IOError(
+                    "Can't append to a non-existent file: {}".format(
+                        os.path.abspath(filename)))
+
+            if external is not None:
+                raise ValueError(
+                    "Can't write an external file in append mode")
+            
+            g['filename'] = filename
+            g['netcdf'] = self.file_open(filename, 'r', fmt)
+            g['fmt'] = g['netcdf'].data_model
+
+            try:
+                for f in fields:
+                    self._append_field(f)
+            finally:
+                self.file_close(filename)
+
+            # Get the new records whilst the file is closed, since
+            # they might be read from the file itself
+            append_data = []
+            for data, ncvar, position, start in g['append_data']:
+                array = self.implementation.get_array(data)
+                if array.shape != data.shape:
+                    raise ValueError(
+"Can't append data of shape {} to netCDF variable {!r}: Data were read from a file that has since changed shape to {}".format(
+    data.shape, ncvar, array.shape))
+                    
+                append_data.append((array, ncvar, position, start))
+            #--- End: for
+            
+            g['netcdf'] = self.file_open(filename, mode, fmt)
+            try:
+                for array, ncvar, position, start in append_data:
+                    self._append_data(array, ncvar, position, start)
+            finally:
+                self.file_close(filename)
+
+            return
+        #--- End: if
         
         if os.path.isfile(filename):
             if not overwrite:
@@ -3365,6 +4070,8 @@ and auxiliary coordinate roles for different data variables.
                        compress=compress,
                        fletcher32=fletcher32,
                        shuffle=shuffle,
+                       chunking=chunking,
+                       chunk_bytes=chunk_bytes,
                        verbose=verbose)            
     #--- End: def
    
@@ -11,7 +11,8 @@ from .netcdf import NetCDFRead
 _implementation = implementation()
 
 def read(filename, external=None, extra=None, verbose=False,
-         warnings=False, _implementation=_implementation):
+         warnings=False, trust_actual_range=False,
+         _implementation=_implementation):
     '''Read field constructs from a dataset.
 
 The dataset may be a netCDF file on disk or on an OPeNDAP server.
@@ -141,6 +142,24 @@ the dataset is read by setting the *warnings* parameter.
         If True then print warnings when an output field construct is
         incomplete due to structural non-compliance of the dataset. By
         default such warnings are not displayed.
+
+    trust_actual_range: `bool`, optional
+        If True then the minimum and maximum of the data of each
+        netCDF variable with an "actual_range" attribute are taken
+        from that attribute, so that they can be retrieved with the
+        `~cfdm.Data.min`, `~cfdm.Data.max` and
+        `~cfdm.Data.statistics` methods of the data without reading
+        any data values from the dataset. The attribute is not checked
+        against the data values. By default the minimum and maximum
+        are always found from the data values.
+
+        The "valid_range", "valid_min" and "valid_max" attributes are
+        never used in this way, because they define the limits of
+        the valid values, rather than the extremes of the values that
+        are actually present.
+
+        *Parameter example:*
+          ``trust_actual_range=True``
         
     _implementation: (subclass of) `CFDMImplementation`, optional
         Define the CF data model implementation that provides the
@@ -192,11 +211,13 @@ Read a file that contains external variables:
     # ----------------------------------------------------------------
     return _read_a_file(filename, external=external, extra=extra,
                         verbose=verbose, warnings=warnings,
+                        trust_actual_range=trust_actual_range,
                         _implementation=_implementation)
 #--- End: def
 
 def _read_a_file(filename, external=(), extra=(), verbose=False,
-                 warnings=False, _implementation=None):
+                 warnings=False, trust_actual_range=False,
+                 _implementation=None):
     '''Read the contents of a single file into a field list.
 
 :Parameters:
@@ -220,7 +241,8 @@ def _read_a_file(filename, external=(), extra=(), verbose=False,
     # ----------------------------------------------------------------
     if netcdf.is_netcdf_file(filename):
         fields = netcdf.read(filename, external=external, extra=extra,
-                             verbose=verbose, warnings=warnings)
+                             verbose=verbose, warnings=warnings,
+                             trust_actual_range=trust_actual_range)
     else:
         raise IOError("Can't determine format of file {}".format(filename))
 
@@ -1,3 +1,5 @@
+import multiprocessing
+
 from . import implementation
 
 from .netcdf import NetCDFWrite
@@ -10,7 +12,7 @@ def write(fields, filename, fmt='NETCDF4', overwrite=True,
           file_descriptors=None, external=None, Conventions=None,
           datatype=None, least_significant_digit=None,
           endian='native', compress=0, fletcher32=False, shuffle=True,
-          verbose=False,
+          chunking=None, chunk_bytes=None, mode='w', verbose=False,
           _implementation=_implementation):
     '''Write field constructs to a netCDF file.
 
@@ -58,12 +60,21 @@ may be accessed with the `~cfdm.Field.nc_unlimited_dimensions`
 `~cfdm.Field.nc_clear_unlimited_dimensions` methods of a field
 construct.
 
+**Appending to an existing file**
+
+Field constructs may be appended to an existing netCDF file that
+contains them, extending its unlimited dimension with new records
+(see the *mode* parameter for details).
+
 **NetCDF4 HDF chunk sizes**
 
 HDF5 chunksizes may be set on contruct's data. See the
 `~cfdm.Data.nc_hdf5_chunksizes`, `~cfdm.Data.nc_clear_hdf5_chunksizes`
 and `~cfdm.Data.nc_set_hdf5_chunksizes` metods of a `Data` instance.
 
+Chunksizes for data that have not had them set may be computed from a
+chunking strategy (see the *chunking* parameter for details).
+
 .. versionadded:: 1.7.0
 
 .. seealso:: `cfdm.read`
@@ -316,6 +327,78 @@ and `~cfdm.Data.nc_set_hdf5_chunksizes` metods of a `Data` instance.
         (which is its default value). See the `netCDF4 package
         <http://unidata.github.io/netcdf4-python>`_ for more details.
 
+    chunking: `str`, optional
+        Compute HDF5 chunksizes for data that have not had chunksizes
+        set with their `~cfdm.Data.nc_set_hdf5_chunksizes` method. By
+        default, such data are written with the netCDF library's
+        default chunksizes. Ignored for netCDF3 output file formats.
+
+        The chunksizes are computed from the sizes of the netCDF
+        dimensions, and from the type of each dimension's domain axis
+        construct (time, vertical, latitude-like or longitude-like)
+        as inferred from the "axis", "standard_name" and "units"
+        properties of its coordinate constructs.
+
+          ================  ==========================================
+          *chunking*        Description
+          ================  ==========================================
+          ``'auto'``        Chunks of approximately *chunk_bytes*
+                            bytes, found by repeatedly halving the
+                            largest chunksize.
+
+          ``'timeseries'``  Chunks that are as long as possible along
+                            the time dimension, suitable for reading
+                            time series at a point.
+
+          ``'map'``         Chunks that span the whole of the X and Y
+                            dimensions, suitable for reading maps.
+          ================  ==========================================
+
+        *Parameter example:*
+          ``chunking='timeseries'``
+
+    chunk_bytes: `int`, optional
+        The approximate maximum size, in bytes, of chunks computed
+        from the *chunking* strategy. A chunk may only exceed this
+        size if it can not be reduced under the strategy's
+        constraints (e.g. a single map under ``'map'``). By default
+        the size is 1048576 bytes (i.e. 1 MiB).
+
+        *Parameter example:*
+          ``chunk_bytes=4194304``
+
+    mode: `str`, optional
+        Specify the mode of writing to the file. One of:
+
+          =======  ===================================================
+          *mode*   Description
+          =======  ===================================================
+          ``'w'``  Create a new file, overwriting any existing file
+                   if allowed by the *overwrite* parameter. This is
+                   the default.
+
+          ``'a'``  Append the field constructs to an existing file.
+          =======  ===================================================
+
+        In append mode, each field construct is matched to the
+        netCDF data variable with the same netCDF variable name (see
+        `~cfdm.Field.nc_get_variable`), which must have the same
+        "standard_name", "units" and "calendar" attributes as the
+        field construct's properties, and must span exactly one
+        unlimited dimension (see
+        `~cfdm.Field.nc_set_unlimited_dimensions`). The field
+        construct's data are written after the existing records of the
+        unlimited dimension, as are the data (and any bounds) of its
+        metadata constructs that span the unlimited dimension, which
+        must also already exist in the file. All other dimensions
+        must have the same sizes as in the file. Nothing else in the
+        file is modified, and so the *fmt*, compression and global
+        attribute parameters are ignored. The *external* parameter
+        may not be set.
+
+        *Parameter example:*
+          ``mode='a'``
+
     verbose: `bool`, optional
         If True then print a summary of how constructs map to output
         netCDF dimensions, variables and attributes.
@@ -338,6 +421,10 @@ and `~cfdm.Data.nc_set_hdf5_chunksizes` metods of a `Data` instance.
 
 >>> cfdm.write(f, 'file.nc', Conventions='CMIP-6.2')
 
+>>> cfdm.write(f, 'file.nc', chunking='timeseries')
+
+>>> cfdm.write(f[-1], 'file.nc', mode='a')
+
     '''
     # ----------------------------------------------------------------
     # Initialise the netCDF write object
@@ -354,5 +441,166 @@ and `~cfdm.Data.nc_set_hdf5_chunksizes` metods of a `Data` instance.
                      least_significant_digit=least_significant_digit,
                      endian=endian, compress=compress,
                      shuffle=shuffle, fletcher32=fletcher32,
-                     verbose=verbose)
+                     chunking=chunking, chunk_bytes=chunk_bytes,
+                     mode=mode, verbose=verbose)
+#--- End: def
+
+
+def write_files(files, processes=None, fmt='NETCDF4', overwrite=True,
+                global_attributes=None, variable_attributes=None,
+                file_descriptors=None, external=None,
+                Conventions=None, datatype=None,
+                least_significant_digit=None, endian='native',
+                compress=0, fletcher32=False, shuffle=True,
+                chunking=None, chunk_bytes=None, mode='w',
+                verbose=False, _implementation=_implementation):
+    '''Write field constructs to many netCDF files in parallel.
+
+Each file is written as if by a call to `cfdm.write`, with the files
+being written simultaneously by a pool of worker processes. This
+allows CPU-intensive tasks, such as compression, to be shared across
+multiple cores.
+
+The field constructs are copied to the worker processes by
+pickling. Data that have not yet been read from disk are pickled by
+reference to their file, so their values are only read by the worker
+that writes them.
+
+An error that occurs whilst writing one file does not prevent the
+other files from being written. Instead, the exception is returned as
+the file's result.
+
+Note that on platforms that start worker processes by spawning a new
+Python interpreter (such as Windows), this function must be called
+from within an ``if __name__ == '__main__':`` block.
+
+.. versionadded:: 1.7.3
+
+.. seealso:: `cfdm.write`
+
+:Parameters:
+
+    files: `dict`
+        A mapping of output file names to the field constructs to be
+        written to them. Each value may be a single field construct,
+        or a sequence of field constructs, as accepted by the *fields*
+        parameter of `cfdm.write`.
+
+        *Parameter example:*
+          ``files={'tas.nc': tas, 'pr.nc': [pr, pr_max]}``
+
+    processes: `int`, optional
+        The number of worker processes to use. By default the number
+        of CPUs is used, but no more than the number of files. If
+        *processes* is 1 then the files are written one after the
+        other by the current process.
+
+    fmt, overwrite, global_attributes, variable_attributes, file_descriptors, external, Conventions, datatype, least_significant_digit, endian, compress, fletcher32, shuffle, chunking, chunk_bytes, mode, verbose, _implementation: optional
+        Applied to every file. See `cfdm.write` for details.
+
+:Returns:
+
+    `dict`
+        The result of writing each file, keyed by file name. A result
+        is `None` if the file was written successfully, otherwise it
+        is the exception that was raised. Files for which no field
+        constructs were given are not written, and are omitted.
+
+**Examples:**
+
+>>> results = cfdm.write_files({'tas.nc': tas, 'pr.nc': pr})
+>>> results
+{'tas.nc': None, 'pr.nc': None}
+
+>>> results = cfdm.write_files({'tas.nc': tas, 'pr.nc': pr},
+...                            compress=4, processes=2)
+
+>>> results = cfdm.write_files({'tas.nc': tas, '/bad/dir/pr.nc': pr})
+>>> results['/bad/dir/pr.nc']
+PermissionError(13, 'Permission denied')
+
+    '''
+    kwargs = dict(fmt=fmt, overwrite=overwrite,
+                  global_attributes=global_attributes,
+                  variable_attributes=variable_attributes,
+                  file_descriptors=file_descriptors,
+                  external=external, Conventions=Conventions,
+                  datatype=datatype,
+                  least_significant_digit=least_significant_digit,
+                  endian=endian, compress=compress, fletcher32=fletcher32,
+                  shuffle=shuffle, chunking=chunking,
+                  chunk_bytes=chunk_bytes, mode=mode, verbose=verbose,
+                  _implementation=_implementation)
+
+    # Files with no field constructs are not written
+    tasks = [(fields, filename) for filename, fields in files.items()
+             if fields]
+
+    results = {}
+
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+
+    processes = min(processes, len(tasks))
+
+    if processes <= 1:
+        # Write the files in this process
+        for fields, filename in tasks:
+            results[filename] = _write_file(fields, filename, kwargs)
+
+        return results
+    #--- End: if
+    
+    pool = multiprocessing.Pool(processes=processes)
+    try:
+        async_results = [
+            (filename, pool.apply_async(_write_file,
+                                        (fields, filename, kwargs)))
+            for fields, filename in tasks]
+        
+        for filename, async_result in async_results:
+            # Errors that occur outside of _write_file, such as
+            # failing to pickle the field constructs, are also
+            # returned as the file's result
+            try:
+                results[filename] = async_result.get()
+            except Exception as error:
+                results[filename] = error
+        #--- End: for
+    finally:
+        pool.close()
+        pool.join()
+
+    return results
+#--- End: def
+
+
+def _write_file(fields, filename, kwargs):
+    '''Write field constructs to a netCDF file for `write_files`.
+
+.. versionadded:: 1.7.3
+
+:Parameters:
+
+    fields: (sequence of) `Field`
+        The field constructs to write.
+
+    filename: `str`
+        The output netCDF file name.
+
+    kwargs: `dict`
+        Keyword arguments to `cfdm.write`.
+
+:Returns:
+
+        `None` if the file was written successfully, otherwise the
+        exception that was raised.
+
+    '''
+    try:
+        write(fields, filename, **kwargs)
+    except Exception as error:
+        return error
+
+    return None
 #--- End: def
@@ -599,6 +599,65 @@ class DSGTest(unittest.TestCase):
             self.assertTrue(a.equals(b, verbose=True))
     #--- End: def
 
+    def test_geometry_index(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = cfdm.read(self.geometry_interior_ring_file, verbose=False)[0]
+
+        index = f.geometry_index()
+        self.assertTrue(index['axis'] == 'domainaxis0')
+        self.assertTrue(index['coordinates'] == ['auxiliarycoordinate0',
+                                                 'auxiliarycoordinate1',
+                                                 'auxiliarycoordinate3'])
+        self.assertTrue((index['part_cell'] == [0, 0, 0, 1]).all())
+        self.assertTrue(index['part_bounds'].shape == (4, 3, 2))
+        self.assertTrue((index['cell_bounds'][:, 1] ==
+                         [[0, 20], [30, 50]]).all())
+
+        # The cached index is shared with copies
+        self.assertTrue(f.geometry_index() is index)
+        self.assertTrue(f.copy().geometry_index() is index)
+
+        # The cached index is not used once the node coordinates
+        # have changed
+        g = f.copy()
+        bounds = g.construct('axis=X').get_bounds()
+        data = bounds.get_data()
+        array = data.array
+        array[1, 0, 0] = 99
+        bounds.set_data(cfdm.Data(array).compress_by_ragged_indexed_contiguous(
+            data.get_count(), data.get_index()))
+        self.assertTrue(g.geometry_index()['cell_bounds'][1, 1, 1] == 99)
+
+        # Persist the index
+        tmpfile = self.tempfilename + '.npz'
+        numpy.savez(tmpfile, **index)
+        g = cfdm.read(self.geometry_interior_ring_file, verbose=False)[0]
+        g.set_geometry_index(numpy.load(tmpfile))
+        os.remove(tmpfile)
+
+        self.assertTrue((g.geometry_index()['cell_bounds'] ==
+                         index['cell_bounds']).all())
+
+        with self.assertRaises(ValueError):
+            f[:1].set_geometry_index(index)
+
+        # Subspace by bounding box
+        g = f.geometry_subspace(**{'axis=X': (30, 60)})
+        self.assertTrue(g.data.shape == (1, 4))
+        self.assertTrue(g.equals(f[1], verbose=True))
+
+        g = f.geometry_subspace(**{'axis=X': (0, 100), 'axis=Y': (0, 5)})
+        self.assertTrue(g.equals(f[[0, 1]], verbose=True))
+
+        with self.assertRaises(ValueError):
+            f.geometry_subspace(**{'axis=X': (100, 200)})
+
+        with self.assertRaises(ValueError):
+            f.geometry_subspace(time=(0, 1))
+    #--- End: def
+
 #--- End: class
 
 
@@ -59,6 +59,197 @@ class ConstructsTest(unittest.TestCase):
         self.assertTrue(d.equals(c, verbose=True))
     #--- End: def
 
+    def test_Constructs_equals(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        c = self.f.constructs
+        d = c.copy()
+        self.assertTrue(c.equals(d, verbose=True))
+
+        # Different units
+        x = d.filter_by_identity('latitude').value()
+        x.set_property('units', 'radians')
+        self.assertFalse(c.equals(d))
+
+        # Different data type
+        d = c.copy()
+        x = d.filter_by_identity('latitude').value()
+        x.set_data(cfdm.Data(x.data.array.astype('int64')), copy=False)
+        self.assertFalse(c.equals(d))
+
+        # Different data values
+        d = c.copy()
+        x = d.filter_by_identity('latitude').value()
+        x.data[0, 0] = -99
+        self.assertFalse(c.equals(d))
+    #--- End: def
+
+    def test_Constructs_filter_by_identity_cache(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = self.f.copy()
+        c = f.constructs
+
+        key = c.filter_by_identity('latitude').key()
+        self.assertTrue(c.filter_by_identity('key%'+key).key() == key)
+
+        # Changed properties
+        lat = c[key]
+        lat.set_property('standard_name', 'qwerty')
+        self.assertTrue(len(c.filter_by_identity('latitude')) == 0)
+        self.assertTrue(c.filter_by_identity('qwerty').key() == key)
+
+        lat.del_property('standard_name')
+        self.assertTrue(len(c.filter_by_identity('qwerty')) == 0)
+
+        # Changed netCDF variable name
+        lat.nc_set_variable('qwerty')
+        self.assertTrue(f.construct_key('ncvar%qwerty') == key)
+
+        # Changed bounds properties
+        key = f.construct_key('atmosphere_hybrid_height_coordinate')
+        f.construct('atmosphere_hybrid_height_coordinate').bounds.set_property('foo', 'bar')
+        self.assertTrue(f.construct_key('foo=bar') == key)
+
+        # Removed and added constructs
+        x = f.del_construct(key)
+        self.assertTrue(len(c.filter_by_identity('foo=bar')) == 0)
+        key = f.set_construct(x, axes=f.get_data_axes()[0:1])
+        self.assertTrue(f.construct_key('foo=bar') == key)
+
+        # Changed coordinate conversion parameters
+        ref = f.construct('grid_mapping_name:rotated_latitude_longitude')
+        ref.coordinate_conversion.set_parameter('grid_mapping_name', 'qwerty')
+        self.assertTrue(f.construct('grid_mapping_name:qwerty') is ref)
+
+        # Changes to other objects keep the cached identities of
+        # unchanged constructs
+        identities, _ = c._identities_index()
+        x = identities[key]
+        g = self.f.copy()
+        g.set_property('long_name', 'qwerty')
+        g.construct('latitude').set_property('long_name', 'qwerty')
+        identities, _ = c._identities_index()
+        self.assertTrue(identities[key] is x)
+
+        # Changes made through a view are seen by the viewed
+        # constructs, and vice versa
+        d = f.domain.constructs
+        self.assertTrue(d.filter_by_identity('foo=bar').key() == key)
+        f.del_construct(key)
+        self.assertTrue(len(d.filter_by_identity('foo=bar')) == 0)
+    #--- End: def
+
+    def test_Constructs_query(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        c = self.f.constructs
+
+        q = c.query()
+        self.assertTrue(len(q) == len(c))
+        self.assertTrue(q.evaluate().equals(c, verbose=True))
+
+        q = q.filter_by_type('auxiliary_coordinate', 'dimension_coordinate')
+        q = q.filter_by_naxes(1)
+        q = q.filter_by_property('or', standard_name='grid_latitude',
+                                 long_name='greek_letters')
+        self.assertTrue(len(q.filters()) == 3)
+        
+        d = c.filter_by_type('auxiliary_coordinate', 'dimension_coordinate')
+        e = d.filter_by_naxes(1)
+        g = e.filter_by_property('or', standard_name='grid_latitude',
+                                 long_name='greek_letters')
+
+        x = q.evaluate()
+        self.assertTrue(len(x) == 2)
+        self.assertTrue(x.equals(g, verbose=True))
+        self.assertTrue(x.filters_applied() == g.filters_applied())
+
+        for depth in (None, 0, 1, 2, 3, 4):
+            self.assertTrue(
+                x.unfilter(depth).equals(g.unfilter(depth), verbose=True))
+            self.assertTrue(
+                x.inverse_filter(depth).equals(g.inverse_filter(depth),
+                                               verbose=True))
+        #--- End: for
+
+        self.assertTrue(x.unfilter(1).equals(e, verbose=True))
+        self.assertTrue(x.unfilter(2).equals(d, verbose=True))
+        self.assertTrue(x.unfilter().equals(c, verbose=True))
+
+        self.assertTrue(q('grid_latitude').value().equals(
+            self.f.construct('grid_latitude')))
+        self.assertTrue(len(q.filter_by_identity('qwerty')) == 0)
+        
+        with self.assertRaises(ValueError):
+            q.filter_by_axis('bad mode').evaluate()
+
+        # Evaluation follows changes to the constructs
+        f = self.f.copy()
+        q = f.constructs.query().filter_by_type('dimension_coordinate')
+        n = len(q)
+        key = f.construct_key('grid_latitude')
+        x = f.del_construct(key)
+        self.assertTrue(len(q) == n - 1)
+        f.set_construct(x, key=key, axes=self.f.get_data_axes(key))
+        self.assertTrue(len(q) == n)
+
+        q = q.filter_by_property(standard_name='grid_latitude')
+        self.assertTrue(len(q) == 1)
+        f.constructs[key].set_property('standard_name', 'qwerty')
+        self.assertTrue(len(q) == 0)
+    #--- End: def
+
+    def test_Constructs_data_axes_index(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = self.f.copy()
+        c = f.constructs
+
+        def spanning(c, axis):
+            return set([key for key, axes in c.data_axes().items()
+                        if axis in axes])
+
+        for axis in c.filter_by_type('domain_axis'):
+            self.assertTrue(c._spanning(axis) == spanning(c, axis))
+
+        # Removing a construct updates the index
+        key = f.construct_key('grid_latitude')
+        axis = f.get_data_axes(key)[0]
+        self.assertTrue(key in c._spanning(axis))
+        f.del_construct(key)
+        self.assertTrue(key not in c._spanning(axis))
+        self.assertTrue(c._spanning(axis) == spanning(c, axis))
+
+        # Setting a construct updates the index
+        key = f.set_construct(self.f.construct('grid_latitude'),
+                              axes=[axis])
+        self.assertTrue(key in c._spanning(axis))
+        self.assertTrue(c._spanning(axis) == spanning(c, axis))
+
+        # Filtered constructs have their own index
+        d = c.filter_by_type('dimension_coordinate')
+        self.assertTrue(d._spanning(axis) == set([key]))
+        e = c.filter_by_axis('and', **{axis: True})
+        self.assertTrue(set(e) == spanning(c, axis))
+        e._pop(key)
+        self.assertTrue(key in c._spanning(axis))
+
+        # Domain axes spanned by a construct may not be removed
+        with self.assertRaises(ValueError):
+            f.del_construct(axis)
+
+        # The axes-to-constructs map agrees with the data axes
+        for axes, d in c._axes_to_constructs().items():
+            for constructs in d.values():
+                for cid in constructs:
+                    self.assertTrue(c.data_axes()[cid] == axes)
+    #--- End: def
+
     def test_Constructs_FILTER(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -13,6 +13,7 @@ import unittest
 
 
 import numpy
+import netCDF4
 
 import cfdm
 
@@ -176,6 +177,33 @@ class DataTest(unittest.TestCase):
         self.assertFalse((a2 == a).all())
     #--- End: def
 
+    def test_Data_copy(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        a = numpy.ma.arange(12).reshape(3, 4)
+        d = cfdm.Data(a, units='m')
+        e = d.copy()
+
+        # The underlying array is shared until one copy is changed
+        self.assertTrue(e._get_Array() is d._get_Array())
+
+        e[0, 0] = -1
+        self.assertFalse(e._get_Array() is d._get_Array())
+        self.assertTrue((d.array == a).all())
+        self.assertTrue(e.array[0, 0] == -1)
+
+        e = d.copy()
+        e.set_units('km')
+        self.assertTrue(d.get_units() == 'm')
+
+        e = copy.deepcopy(d)
+        self.assertTrue(e.equals(d, verbose=True))
+        
+        e = d.copy(array=False)
+        self.assertTrue(e._get_Array(None) is None)
+    #--- End: def
+
     def test_Data_datetime_array(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -183,6 +211,31 @@ class DataTest(unittest.TestCase):
         d = cfdm.Data(11292.5, units='days since 1970-1-1')
         dt = d.datetime_array[()]
         self.assertTrue(dt == datetime.datetime(2000, 12, 1, 12, 0))
+
+        # The date-times are cached on the underlying array
+        d = cfdm.Data(numpy.ma.arange(48.), units='hours since 2000-02-28',
+                      calendar='360_day')
+        d[5] = numpy.ma.masked
+        dt = d.datetime_array
+        self.assertTrue(dt[5] is numpy.ma.masked)
+        self.assertTrue(dt[47] == netCDF4.num2date(47, 'hours since 2000-02-28',
+                                                   '360_day'))
+        self.assertTrue(len(d._get_Array()._datetime_arrays) == 1)
+
+        dt[0] = None
+        e = d.copy()
+        self.assertTrue((e.datetime_array == d.datetime_array).all())
+        self.assertTrue(e.datetime_array[0] is not None)
+        self.assertTrue(e._get_Array()._datetime_arrays is
+                        d._get_Array()._datetime_arrays)
+
+        # Changing the units or data does not reuse the cached values
+        e.set_units('days since 2000-02-28')
+        self.assertTrue(e.datetime_array[2].day == 30)
+        self.assertTrue(d.datetime_array[48 - 24].day == 29)
+
+        d[24] = 0
+        self.assertTrue(d.datetime_array[24].day == 28)
     #--- End: def
 
     def test_Data_transpose(self):        
@@ -203,7 +256,60 @@ class DataTest(unittest.TestCase):
             #--- End: for
         #--- End: for
     #--- End: def
-        
+
+    def test_Data_view(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        # Data stored in a netCDF file are not read when their
+        # dimensions are rearranged
+        f = cfdm.read(self.filename)[0]
+        d = f.data
+        self.assertIsInstance(d._get_Array(), cfdm.NetCDFArray)
+        a = d.array
+
+        e = d.transpose([2, 0, 1])
+        self.assertIsInstance(e._get_Array(), cfdm.ViewArray)
+        self.assertTrue(e.shape == (9, 1, 10))
+        self.assertTrue((e.array == numpy.transpose(a, [2, 0, 1])).all())
+        self.assertTrue((e[[1, 3], :, 2:5].array ==
+                         numpy.transpose(a, [2, 0, 1])[[1, 3], :, 2:5]).all())
+
+        # Views of views are composed
+        e = e.squeeze().insert_dimension(-1).transpose([2, 1, 0])
+        self.assertIsInstance(e._get_Array().get_array(), cfdm.NetCDFArray)
+        self.assertTrue(e.shape == (1, 10, 9))
+        self.assertTrue((e.array == a).all())
+        self.assertTrue(e.equals(d))
+
+        e = d.squeeze()
+        self.assertTrue(e.shape == (10, 9))
+        self.assertTrue((e[[0, 4, 9], [8, 1]].array ==
+                         a[0][[0, 4, 9]][:, [8, 1]]).all())
+
+        # Compressed data are not uncompressed
+        g = cfdm.read(os.path.join(os.path.dirname(self.filename),
+                                   'DSG_timeSeries_contiguous.nc'))[0]
+        d = g.data
+        a = d.array
+        e = d.insert_dimension(1).transpose()
+        self.assertTrue(e.get_compression_type() == '')
+        self.assertTrue(d.get_compression_type() != '')
+        self.assertTrue(e.shape == (a.shape[1], 1, a.shape[0]))
+        self.assertTrue((e.array == numpy.transpose(a)[:, numpy.newaxis]).all())
+
+        # Masked values and the fill value are retained
+        a = numpy.ma.arange(6).reshape(2, 1, 3)
+        a[1, 0, 2] = numpy.ma.masked
+        d = cfdm.Data(a, fill_value=-99)
+        e = d.squeeze().transpose()
+        self.assertTrue(e.get_fill_value() == -99)
+        self.assertTrue(e.array.mask[2, 1])
+        self.assertTrue((e.array == numpy.transpose(a[:, 0])).all())
+        e[0, 0] = -1
+        self.assertTrue(d.array[0, 0, 0] == 0)
+    #--- End: def
+
     def test_Data_unique(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -235,6 +341,37 @@ class DataTest(unittest.TestCase):
         self.assertTrue(e.equals(d, verbose=True))    
     #--- End: def
         
+    def test_Data_fingerprint(self):        
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        a = numpy.ma.arange(10*15*19).reshape(10, 1, 15, 19)
+        a[0, 0, 2, 3] = numpy.ma.masked
+        
+        d = cfdm.Data(a, units='days since 2000-2-2', calendar='noleap')
+        e = copy.deepcopy(d)
+
+        fingerprint = d.fingerprint()
+        self.assertTrue(d.fingerprint() == fingerprint)
+        self.assertTrue(e.fingerprint() == fingerprint)
+
+
+        e[0, 0, 2, 3] = 1
+        self.assertFalse(e.fingerprint() == fingerprint)
+
+        e = copy.deepcopy(d)
+        e[0, 0, 0, 0] = numpy.ma.masked
+        self.assertFalse(e.fingerprint() == fingerprint)
+
+        e = copy.deepcopy(d)
+        e.set_units('days since 2000-2-3')
+        self.assertFalse(e.fingerprint() == fingerprint)
+
+        e = cfdm.Data(a.astype('float32'), units='days since 2000-2-2',
+                      calendar='noleap')
+        self.assertFalse(e.fingerprint() == fingerprint)
+    #--- End: def
+
     def test_Data_max_min_sum_squeeze(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -277,6 +414,47 @@ class DataTest(unittest.TestCase):
         self.assertTrue((x.array == b).all(), (x.shape, b.shape))
     #--- End: def
 
+    def test_Data_statistics(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        a = numpy.ma.arange(10*15*19).reshape(10, 1, 15, 19)
+        a[0, 0, 0, 0] = numpy.ma.masked
+        a[-1, -1, -1, -1] = numpy.ma.masked
+        d = cfdm.Data(a)
+
+        # Read in more than one block
+        array = d._get_Array()
+        statistics = d._array_statistics(array, block_bytes=1000)
+        self.assertTrue(statistics == {'minimum': 1,
+                                       'maximum': a.max(),
+                                       'count': a.count(),
+                                       'count_masked': 2})
+        self.assertTrue(d.statistics() == statistics)
+
+        # The statistics are shared by copies and views of the data
+        e = d.copy()
+        self.assertTrue(e._get_Array()._statistics is array._statistics)
+        e = d.transpose()
+        self.assertTrue(e._get_Array()._statistics is array._statistics)
+        self.assertTrue(e.max().array.item() == a.max())
+
+        # Known statistics are not recalculated
+        d._set_statistics(minimum=-99)
+        self.assertTrue(d.min().array.item() == -99)
+        self.assertTrue(d.max().array.item() == a.max())
+        self.assertTrue(e.min().array.item() == 1)
+
+        # Changing the data discards the statistics
+        d[0, 0, 0, 0] = -1
+        self.assertTrue(d.min().array.item() == -1)
+        self.assertTrue(d.statistics()['count_masked'] == 1)
+
+        d[...] = cfdm.masked
+        self.assertTrue(numpy.ma.getmaskarray(d.max().array).all())
+        self.assertTrue(d.statistics()['count'] == 0)
+    #--- End: def
+
 #--- End: class
 
 
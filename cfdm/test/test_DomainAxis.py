@@ -3,6 +3,7 @@ from __future__ import print_function
 import datetime
 import inspect
 import os
+import pickle
 import unittest
 
 import numpy
@@ -46,6 +47,42 @@ class DomainTest(unittest.TestCase):
         self.assertTrue(e.equals(d, verbose=True))
     #--- End: def
 
+    def test_DomainAxis_slots(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = self.f
+
+        ref = list(f.coordinate_references.values())[0]
+        
+        # Small metadata objects have no per-instance dictionary
+        for x in (list(f.domain_axes.values())[0],
+                  list(f.cell_methods.values())[0],
+                  ref.datum,
+                  ref.coordinate_conversion,
+                  f.construct('atmosphere_hybrid_height_coordinate').bounds):
+            self.assertFalse(hasattr(x, '__dict__'), repr(x))
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                self.assertTrue(
+                    x.equals(pickle.loads(pickle.dumps(x, protocol)),
+                             verbose=True))
+            self.assertTrue(x.equals(x.copy(), verbose=True))
+        #--- End: for
+
+        # Subclasses may still have instance attributes
+        class DomainAxis(cfdm.DomainAxis):
+            pass
+
+        d = DomainAxis(size=9)
+        d.foo = 'bar'
+        self.assertTrue(d.copy().get_size() == 9)
+
+        # Objects with instance attributes are pickled with them
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertTrue(f.equals(pickle.loads(pickle.dumps(f, protocol)),
+                                     verbose=True))
+    #--- End: def
+
 #--- End: class
 
 if __name__ == '__main__':
@@ -6,6 +6,7 @@ import os
 import re
 import unittest
 
+import cftime
 import numpy
 
 import cfdm
@@ -117,6 +118,28 @@ class FieldTest(unittest.TestCase):
         b = c.bounds
         self.assertTrue(c.data.shape == (4,))
         self.assertTrue(b.data.shape == (4, 2))
+
+        # Check that the subspace is independent of the original,
+        # including for constructs that do not span a subspaced axis
+        g = f[0:2, 0:2]
+        g.data[...] = -99
+        self.assertTrue((f.data.array == d).all())
+        for identity in ('atmosphere_hybrid_height_coordinate', 'ncvar%a'):
+            c = f.construct(identity)
+            c_array = c.data.array.copy()
+            b_array = c.bounds.data.array.copy() if c.has_bounds() else None
+            x = g.construct(identity)
+            x.set_property('long_name', 'new name')
+            x.data[...] = -99
+            if x.has_bounds():
+                x.bounds.data[...] = -99
+
+            self.assertFalse(c.has_property('long_name'))
+            self.assertTrue((c.data.array == c_array).all())
+            self.assertTrue((x.data.array == -99).all())
+            if b_array is not None:
+                self.assertTrue((c.bounds.data.array == b_array).all())
+        #--- End: for
         #--- End: def
 
 #    def test_Field___setitem__(self):
@@ -297,6 +320,41 @@ class FieldTest(unittest.TestCase):
         self.assertTrue(f.get_data_axes() == ref)
     #--- End: def
 
+    def test_Field_convert(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = self.f.copy()
+
+        key = f.construct_key('measure:area')
+        c = f.constructs[key]
+        x = f.convert(key)
+        self.assertIsInstance(x, cfdm.Field)
+        self.assertTrue(x.data.equals(c.data))
+        self.assertTrue(x.get_data_axes() == f.get_data_axes(key))
+        self.assertTrue(len(x.coordinate_references) == 1)
+        self.assertTrue(len(x.auxiliary_coordinates) == 3)
+        self.assertTrue(len(x.cell_measures) == 1)
+
+        # The data are shared with the construct, and are not read
+        self.assertTrue(x.data._get_Array() is c.data._get_Array())
+
+        # Changing the new field does not change the original field
+        x.data[0, 0] = -1
+        x.construct('latitude').set_property('units', 'radians')
+        x.coordinate_references.value().clear_coordinates()
+        self.assertTrue(c.data.array[0, 0] != -1)
+        self.assertTrue(f.construct('latitude').get_property('units') ==
+                        self.f.construct('latitude').get_property('units'))
+        self.assertTrue(f.equals(self.f, verbose=True))
+
+        x = f.convert(key, full_domain=False)
+        self.assertTrue(len(x.constructs) == 2)
+
+        with self.assertRaises(ValueError):
+            f.convert('qwerty')
+    #--- End: def
+
     def test_Field_equals(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -320,6 +378,42 @@ class FieldTest(unittest.TestCase):
         self.assertFalse(f.equals(h))
     #--- End: def
 
+    def test_Field_fingerprint(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = self.f.copy()
+        fingerprint = f.fingerprint()
+        self.assertTrue(f.fingerprint() == fingerprint)
+        self.assertTrue(f.copy().fingerprint() == fingerprint)
+        self.assertTrue(f[...].fingerprint() == fingerprint)
+
+        # netCDF names are ignored
+        g = f.copy()
+        g.nc_set_variable('new_name')
+        g.construct('latitude').nc_set_variable('new_lat')
+        self.assertTrue(g.fingerprint() == fingerprint)
+
+        g = f.copy()
+        g.set_property('long_name', 'new name')
+        self.assertFalse(g.fingerprint() == fingerprint)
+
+        g = f.copy()
+        g.data[0, 0, 0] = -99
+        self.assertFalse(g.fingerprint() == fingerprint)
+
+        g = f.copy()
+        g.construct('latitude').data[0, 0] = -99
+        self.assertFalse(g.fingerprint() == fingerprint)
+
+        g = f.copy()
+        g.del_construct('cellmethod0')
+        self.assertFalse(g.fingerprint() == fingerprint)
+
+        g = f.squeeze()
+        self.assertFalse(g.fingerprint() == fingerprint)
+    #--- End: def
+
     def test_Field_del_construct(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -366,6 +460,114 @@ class FieldTest(unittest.TestCase):
         self.assertTrue(h.get_data_axes()[:-1] == f.get_data_axes())
     #--- End: def
 
+    def test_Field_indices_subspace(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = self.f
+
+        y = f.construct('grid_latitude')
+        self.assertTrue(y.direction())
+        self.assertFalse(y[::-1].direction())
+
+        self.assertTrue(f.indices(grid_latitude=(0.5, 3)) ==
+                        (slice(None), slice(1, 4), slice(None)))
+        self.assertTrue(f.indices(grid_latitude=3) ==
+                        (slice(None), slice(3, 4), slice(None)))
+        self.assertTrue(f.indices(grid_longitude=(21, 30),
+                                  grid_latitude=(0, 4)) ==
+                        (slice(None), slice(0, 5), slice(1, 8)))
+
+        # Cell overlap
+        self.assertTrue(f.indices(overlap=True, grid_longitude=(27.5, 29)) ==
+                        (slice(None), slice(None), slice(7, 8)))
+
+        g = f.subspace(grid_latitude=(0.5, 3), grid_longitude=(21, 30))
+        self.assertTrue(g.equals(f[:, 1:4, 1:8], verbose=True))
+
+        # Decreasing coordinates
+        g = f[:, ::-1]
+        indices = g.indices(grid_latitude=(0.5, 3))
+        self.assertTrue(indices == (slice(None), slice(6, 9), slice(None)))
+        self.assertTrue(
+            (g.construct('grid_latitude').data.array[indices[1]] ==
+             [3, 2, 1]).all())
+
+        # The cached coordinate values are discarded when the data
+        # are changed
+        g = f.copy()
+        g.construct('grid_latitude').data[...] = numpy.arange(10, 20)
+        self.assertTrue(g.indices(grid_latitude=(10, 11)) ==
+                        (slice(None), slice(0, 2), slice(None)))
+
+        with self.assertRaises(ValueError):
+            f.indices(grid_latitude=(20, 30))
+
+        with self.assertRaises(ValueError):
+            f.indices(grid_longitude=(27.5, 29))
+
+        with self.assertRaises(ValueError):
+            f.indices(bad_identity=(20, 30))
+    #--- End: def
+
+    def test_Field_indices_datetime(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        # Ten years of hourly data in the noleap calendar
+        n = 24 * 365 * 10
+        f = cfdm.Field()
+        axis = f.set_construct(cfdm.DomainAxis(n))
+        t = cfdm.DimensionCoordinate(
+            properties={'standard_name': 'time',
+                        'units': 'hours since 2000-01-01',
+                        'calendar': 'noleap'},
+            data=cfdm.Data(numpy.arange(n) + 0.5))
+        b = numpy.empty((n, 2))
+        b[:, 0] = numpy.arange(n)
+        b[:, 1] = numpy.arange(1, n + 1)
+        t.set_bounds(cfdm.Bounds(data=cfdm.Data(b)))
+        f.set_construct(t, axes=[axis])
+        f.set_data(cfdm.Data(numpy.arange(n)), axes=[axis])
+
+        t = f.construct('time')
+        self.assertTrue(t.indices(2.5) == slice(2, 3))
+        self.assertTrue(
+            t.indices(cftime.DatetimeNoLeap(2000, 1, 2, 6, 30)) ==
+            slice(30, 31))
+        self.assertTrue(
+            t.indices((datetime.datetime(2001, 1, 1),
+                       datetime.datetime(2001, 1, 2))) ==
+            slice(8760, 8784))
+        self.assertTrue(t[::-1].indices(
+            (cftime.DatetimeNoLeap(2001, 1, 1),
+             cftime.DatetimeNoLeap(2001, 1, 2))) ==
+                        slice(n - 8784, n - 8760))
+        self.assertTrue(t.indices(
+            (cftime.DatetimeNoLeap(2001, 1, 1),
+             cftime.DatetimeNoLeap(2001, 1, 2)), overlap=True) ==
+                        slice(8759, 8785))
+        self.assertTrue(t.indices(cftime.DatetimeNoLeap(2020, 1, 1)) ==
+                        slice(n, n))
+
+        # The coordinates are never converted to date-times
+        self.assertFalse(hasattr(t.get_data()._get_Array(),
+                                 '_datetime_arrays'))
+
+        g = f.subspace(time=(cftime.DatetimeNoLeap(2005, 2, 28, 23),
+                             cftime.DatetimeNoLeap(2005, 3, 1, 1)))
+        self.assertTrue(g.data.shape == (2,))
+        self.assertTrue(
+            (g.construct('time').get_data().datetime_array ==
+             [cftime.DatetimeNoLeap(2005, 2, 28, 23, 30),
+              cftime.DatetimeNoLeap(2005, 3, 1, 0, 30)]).all())
+
+        # Date-times can't be used with coordinates that are not
+        # reference times
+        with self.assertRaises(ValueError):
+            self.f.indices(grid_latitude=datetime.datetime(2000, 1, 1))
+    #--- End: def
+
 #--- End: class
 
 if __name__ == '__main__':
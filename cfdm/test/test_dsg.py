@@ -611,6 +611,116 @@ class DSGTest(unittest.TestCase):
             [2, 3])).all())
     #--- End: def
 
+    def test_DSG_features(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        for filename, shapes in ((self.contiguous,
+                                  [(3,), (7,), (5,), (9,)]),
+                                 (self.indexed,
+                                  [(3,), (7,), (5,), (9,)]),
+                                 (self.indexed_contiguous,
+                                  [(12, 3), (26, 4), (20, 3)])):
+            f = cfdm.read(filename)[0]
+            self.assertTrue(f.data.get_feature_shapes() == shapes)
+
+            array = f.data.array
+
+            features = list(f.features())
+            self.assertTrue(len(features) == len(shapes))
+
+            for i, (g, shape) in enumerate(zip(features, shapes)):
+                self.assertTrue(g.data.shape == (1,) + shape)
+
+                indices = [slice(i, i + 1)]
+                indices.extend([slice(0, n) for n in shape])
+                indices = tuple(indices)
+
+                self.assertTrue(g.equals(f[indices], verbose=True))
+                self.assertTrue(
+                    (g.data.array.mask == array[indices].mask).all())
+                self.assertTrue((g.data.array == array[indices]).all())
+        #--- End: for
+
+        # Selected instances of the compressed data
+        f = cfdm.read(self.indexed)[0]
+        self.assertTrue(
+            (f.data[2:0:-1].array == f.data.array[2:0:-1]).all())
+        self.assertTrue(
+            (f.data[[0, 3]].array == f.data.array[[0, 3]]).all())
+
+        with self.assertRaises(ValueError):
+            list(f[:, :2].features())
+    #--- End: def
+
+    def test_DSG_compress(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        for filename, methods in ((self.contiguous,
+                                   ('ragged contiguous', 'ragged indexed')),
+                                  (self.indexed,
+                                   ('ragged contiguous', 'ragged indexed')),
+                                  (self.indexed_contiguous,
+                                   ('ragged indexed contiguous',))):
+            f = cfdm.read(filename)[0]
+
+            # Uncompress the field and its metadata constructs
+            u = f.copy()
+            u.set_data(cfdm.Data(f.data.array,
+                                 units=f.data.get_units(None)),
+                       axes=f.get_data_axes())
+            for c in u.constructs.filter_by_data().values():
+                c.set_data(cfdm.Data(c.data.array,
+                                     units=c.data.get_units(None),
+                                     calendar=c.data.get_calendar(None)))
+
+            self.assertFalse(u.data.get_compression_type())
+
+            for method in methods:
+                g = u.compress(method)
+                self.assertTrue(g.data.get_compression_type() == method)
+                self.assertTrue(g.equals(f, verbose=True,
+                                         ignore_compression=True))
+
+                cfdm.write(g, self.tempfilename)
+                h = cfdm.read(self.tempfilename)[0]
+                self.assertTrue(h.data.get_compression_type() == method)
+                self.assertTrue(h.equals(g, verbose=True))
+
+            # Missing data values at the end of a feature are kept
+            # where the metadata constructs have values
+            array = u.data.array
+            first = (0,) * (array.ndim - 1)
+            index = first + (numpy.ma.count(array[first]) - 1,)
+            array[index] = numpy.ma.masked
+            v = u.copy()
+            v.set_data(cfdm.Data(array, units=u.data.get_units(None)),
+                       axes=u.get_data_axes())
+            for method in methods:
+                g = v.compress(method)
+                self.assertTrue(g.data.get_compression_type() == method)
+                self.assertTrue(g.data.compressed_array.shape ==
+                                f.data.compressed_array.shape)
+                self.assertTrue(g.data.array[index] is numpy.ma.masked)
+                self.assertTrue(g.equals(v, verbose=True,
+                                         ignore_compression=True))
+        #--- End: for
+
+        f = cfdm.read(self.contiguous)[0]
+        g = f.compress('ragged contiguous')
+        self.assertTrue((g.data.get_count().data.array == [3, 7, 5, 9]).all())
+
+        with self.assertRaises(ValueError):
+            f.compress('bad method')
+
+        # Non-missing values may not be discarded
+        d = cfdm.Data(self.a)
+        with self.assertRaises(ValueError):
+            d.compress_by_ragged_contiguous(
+                cfdm.Count(data=cfdm.Data([3, 7, 4, 9])))
+    #--- End: def
+
 #--- End: class
 
 
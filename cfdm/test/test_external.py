@@ -188,8 +188,78 @@ class ExternalVariableTest(unittest.TestCase):
 
         for i in range(len(f)):
             self.assertTrue(c[i].equals(f[i], verbose=True))
-    #--- End: def        
-   
+    #--- End: def
+
+    def test_EXTERNAL_READ_cache(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        cfdm.read_write.netcdf.NetCDFRead.clear_external_files()
+
+        c = cfdm.read(self.combined_file)[0]
+
+        # Reading the same external file twice shares the cell
+        # measure data between the fields
+        f = cfdm.read(self.parent_file, external=self.external_file)[0]
+        g = cfdm.read(self.parent_file, external=self.external_file)[0]
+        self.assertTrue(f.equals(c, verbose=True))
+        self.assertTrue(g.equals(c, verbose=True))
+
+        x = f.construct('measure:area')
+        y = g.construct('measure:area')
+        self.assertFalse(x is y)
+        self.assertTrue(x.data._get_Array() is y.data._get_Array())
+
+        # Changing one field does not change the other
+        x.set_property('long_name', 'changed')
+        x.data[0, 0] = -1
+        self.assertFalse(y.has_property('long_name'))
+        self.assertTrue(y.data.array[0, 0] != -1)
+        g = cfdm.read(self.parent_file, external=self.external_file)[0]
+        self.assertTrue(g.equals(c, verbose=True))
+
+        # A modified external file is scanned again
+        e = cfdm.read(self.external_file)[0]
+        cfdm.write(e, self.tempfilename_external)
+        f = cfdm.read(self.parent_file, external=self.tempfilename_external)[0]
+        self.assertTrue(f.equals(c, verbose=True))
+
+        e.data[...] = 99
+        cfdm.write(e, self.tempfilename_external)
+        f = cfdm.read(self.parent_file, external=self.tempfilename_external)[0]
+        self.assertTrue((f.construct('measure:area').data.array == 99).all())
+
+        # Statistics trusted from the actual_range attribute are not
+        # seen by reads that don't trust it
+        e.set_property('actual_range', numpy.array([-5., 500.]))
+        cfdm.write(e, self.tempfilename_external)
+        f = cfdm.read(self.parent_file, external=self.tempfilename_external,
+                      trust_actual_range=True)[0]
+        self.assertTrue(f.construct('measure:area').data.max().array == 500)
+        f = cfdm.read(self.parent_file, external=self.tempfilename_external)[0]
+        self.assertTrue(f.construct('measure:area').data.max().array == 99)
+
+        # The cache contains no open datasets, and its size is
+        # bounded
+        NetCDFRead = cfdm.read_write.netcdf.NetCDFRead
+        for entry in NetCDFRead._external_files.values():
+            self.assertTrue(sorted(entry['read_vars']) ==
+                            sorted(NetCDFRead._external_read_vars))
+
+        size = NetCDFRead._external_files_size
+        NetCDFRead._external_files_size = 1
+        NetCDFRead.clear_external_files()
+        try:
+            cfdm.read(self.parent_file, external=self.external_file)
+            cfdm.read(self.parent_file, external=self.tempfilename_external)
+            self.assertTrue(list(NetCDFRead._external_files) ==
+                            [os.path.abspath(self.tempfilename_external)])
+        finally:
+            NetCDFRead._external_files_size = size
+
+        NetCDFRead.clear_external_files()
+    #--- End: def
+
     def test_EXTERNAL_WRITE(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
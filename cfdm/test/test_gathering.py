@@ -336,6 +336,50 @@ class DSGTest(unittest.TestCase):
             [1, 4, 5])).all())
     #--- End: def
 
+    def test_GATHERING_compress(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        for f in cfdm.read(self.gathered):
+            axes = f.data.get_compressed_axes()
+            list_array = f.data.get_list().data.array
+
+            u = f.copy()
+            u.set_data(cfdm.Data(f.data.array, units=f.data.get_units()),
+                       axes=f.get_data_axes())
+            self.assertFalse(u.data.get_compression_type())
+
+            # Points given by list indices, and by missing data
+            for points in (list_array, None):
+                g = u.compress('gathered', axes=axes, points=points)
+                self.assertTrue(g.data.get_compression_type() == 'gathered')
+                self.assertTrue(
+                    (g.data.get_list().data.array == list_array).all())
+                self.assertTrue(g.equals(f, verbose=True))
+
+                cfdm.write(g, self.tempfilename)
+                h = cfdm.read(self.tempfilename)[0]
+                self.assertTrue(h.equals(f, verbose=True))
+        #--- End: for
+
+        # Points given by a mask
+        f = cfdm.Field()
+        X = f.set_construct(cfdm.DomainAxis(3))
+        Y = f.set_construct(cfdm.DomainAxis(2))
+        f.set_data(cfdm.Data(numpy.arange(6.).reshape(3, 2)), axes=[X, Y])
+        f.data[1] = numpy.ma.masked
+
+        points = numpy.array([[False, False], [True, True], [False, False]])
+        g = f.compress('gathered', axes=[0, 1], points=points)
+        self.assertTrue((g.data.get_list().data.array == [0, 1, 4, 5]).all())
+        self.assertTrue((g.data.compressed_array == [0, 1, 4, 5]).all())
+        self.assertTrue(g.equals(f, verbose=True, ignore_compression=True))
+
+        # Non-missing values may not be discarded
+        with self.assertRaises(ValueError):
+            f.compress('gathered', axes=[0, 1], points=[0, 1, 4])
+    #--- End: def
+
     
 #--- End: class
 
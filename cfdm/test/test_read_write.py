@@ -9,6 +9,7 @@ import atexit
 import inspect
 
 import numpy
+import netCDF4
 
 import cfdm
 
@@ -34,7 +35,7 @@ class read_writeTest(unittest.TestCase):
     test_only = []
 #    test_only = ['NOTHING!!!!!']
 #    test_only = ['test_write_HDF_chunks']
-    test_only = ['test_read_write_unlimited']
+#    test_only = ['test_read_write_unlimited']
 #    test_only = ['test_read_field']
 #    test_only = ['test_write_datatype']
     
@@ -125,6 +126,39 @@ class read_writeTest(unittest.TestCase):
                         'datatype read in is '+str(g.data.dtype))
     #--- End: def
 
+    def test_write_chunking(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = cfdm.read(self.filename)[0]
+
+        for chunking in ('auto', 'timeseries', 'map'):
+            cfdm.write(f, tmpfile, chunking=chunking, chunk_bytes=200)
+            g = cfdm.read(tmpfile)[0]
+            self.assertTrue(f.equals(g, verbose=True),
+                            'Bad read/write with chunking: {}'.format(chunking))
+        #--- End: for
+
+        # 'map' chunks span the whole of the X and Y dimensions
+        nc = netCDF4.Dataset(tmpfile, 'r')
+        self.assertTrue(nc.variables['eastward_wind'].chunking() == [1, 10, 9])
+        nc.close()
+
+        # 'auto' chunks do not exceed the target size, and chunksizes
+        # set on the data take precedence
+        f.data.nc_set_hdf5_chunksizes([1, 2, 3])
+        cfdm.write(f, tmpfile, chunking='auto', chunk_bytes=200)
+        nc = netCDF4.Dataset(tmpfile, 'r')
+        self.assertTrue(nc.variables['eastward_wind'].chunking() == [1, 2, 3])
+        latitude = nc.variables['latitude']
+        self.assertTrue(
+            numpy.prod(latitude.chunking())*latitude.dtype.itemsize <= 200)
+        nc.close()
+
+        with self.assertRaises(ValueError):
+            cfdm.write(f, tmpfile, chunking='bad strategy')
+    #--- End: def
+
 #    def test_write_HDF_chunks(self):
 #        if self.test_only and inspect.stack()[0][3] not in self.test_only:
 #            return
@@ -147,6 +181,164 @@ class read_writeTest(unittest.TestCase):
         self.assertTrue(f.nc_unlimited_dimensions() == set(['domainaxis0']))
     #--- End: def
 
+    def test_write_append(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = cfdm.read(self.filename)[0]
+        f.nc_set_unlimited_dimensions(['domainaxis0'])
+        cfdm.write(f, tmpfile)
+
+        g = f.copy()
+        g.dimension_coordinates('atmosphere_hybrid_height_coordinate').value().data[...] = 2.5
+        cfdm.write(g, tmpfile, mode='a')
+
+        h = cfdm.read(tmpfile)[0]
+        self.assertTrue(h.data.shape == (2, 10, 9))
+        self.assertTrue(h[0].equals(f, verbose=True))
+        self.assertTrue(h[1].data.equals(f.data, verbose=True))
+
+        z = h.dimension_coordinates('atmosphere_hybrid_height_coordinate').value()
+        self.assertTrue((z.data.array == [1.5, 2.5]).all())
+        self.assertTrue(z.bounds.data.shape == (2, 2))
+
+        # Inconsistent metadata
+        g.set_property('units', 'K')
+        with self.assertRaises(ValueError):
+            cfdm.write(g, tmpfile, mode='a')
+
+        # The same netCDF data variable can only be appended to once
+        with self.assertRaises(ValueError):
+            cfdm.write([f, f], tmpfile, mode='a')
+
+        h = cfdm.read(tmpfile)[0]
+        self.assertTrue(h.data.shape == (2, 10, 9))
+    #--- End: def
+
+    def test_read_parsed_attributes(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        # Two data variables with identical cell_methods,
+        # cell_measures and coordinates attributes
+        f = cfdm.read(self.filename)[0]
+        g = f.copy()
+        g.nc_set_variable('northward_wind')
+        cfdm.write([f, g], tmpfile)
+
+        h = cfdm.read(tmpfile)
+        self.assertTrue(len(h) == 2)
+        for x in h:
+            self.assertTrue(f.equals(x, verbose=True))
+
+        # The parsed cell methods are not shared between the fields
+        x = h[0].cell_methods.ordered()
+        y = h[1].cell_methods.ordered()
+        self.assertTrue(len(x) == 2)
+        for a, b in zip(x.values(), y.values()):
+            self.assertFalse(a is b)
+            self.assertTrue(a.equals(b, verbose=True))
+
+        a = list(x.values())[0]
+        b = list(y.values())[0]
+        a.get_qualifier('interval')[0].set_units('hours')
+        self.assertTrue(b.get_qualifier('interval')[0].get_units() == 'day')
+    #--- End: def
+
+    def test_read_header_indexes(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        netcdf = cfdm.read_write.netcdf.NetCDFRead(cfdm.implementation())
+        g = netcdf.read(self.filename, _scan_only=True)
+        netcdf.file_close()
+
+        for ncvar, attributes in g['variable_attributes'].items():
+            for attr in attributes:
+                self.assertTrue(ncvar in g['attribute_variables'][attr])
+
+        self.assertTrue(g['attribute_variables']['bounds'] ==
+                        ['grid_longitude',
+                         'atmosphere_hybrid_height_coordinate'])
+        self.assertTrue(g['variable_attributes']['eastward_wind']['units']
+                        == 'm s-1')
+    #--- End: def
+
+    def test_read_trust_actual_range(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = cfdm.read(self.filename)[0]
+        a = f.data.array
+        f.set_property('actual_range', numpy.array([-5., 500.]))
+        cfdm.write(f, tmpfile)
+
+        # By default the attribute is not used
+        g = cfdm.read(tmpfile)[0]
+        self.assertTrue(g.data.max().array.item() == a.max())
+        self.assertTrue(g.data.min().array.item() == a.min())
+
+        # The attribute is used without reading the data
+        g = cfdm.read(tmpfile, trust_actual_range=True)[0]
+        self.assertIsInstance(g.data._get_Array(), cfdm.NetCDFArray)
+        self.assertTrue(g.data.max().array.item() == 500)
+        self.assertTrue(g.data.min().array.item() == -5)
+        statistics = g.data.statistics()
+        self.assertTrue(statistics['count'] == a.size)
+        self.assertTrue(statistics['maximum'] == 500)
+        self.assertTrue(statistics['minimum'] == -5)
+        self.assertTrue(g.data.max().array.item() == 500)
+
+        # Subspaces find their own statistics
+        self.assertTrue(g[:, :2].data.max().array.item() ==
+                        a[:, :2].max())
+    #--- End: def
+
+    def test_write_files(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = cfdm.read(self.filename)[0]
+
+        tmpfile2 = tempfile.mktemp('.cf-python_test')
+        tmpfiles.append(tmpfile2)
+        bad_file = os.path.join(tmpfile2, 'no_such_directory', 'file.nc')
+        empty_file = os.path.join(tmpfile2, 'no_such_directory', 'empty.nc')
+        
+        for processes in (1, 2):
+            results = cfdm.write_files({tmpfile   : f,
+                                        tmpfile2  : [f[:, :5]],
+                                        bad_file  : f,
+                                        empty_file: []},
+                                       compress=4, processes=processes)
+            self.assertTrue(sorted(results) ==
+                            sorted([tmpfile, tmpfile2, bad_file]))
+            self.assertTrue(results[tmpfile] is None)
+            self.assertTrue(results[tmpfile2] is None)
+            self.assertTrue(isinstance(results[bad_file], Exception))
+            
+            g = cfdm.read(tmpfile)
+            self.assertTrue(len(g) == 1)
+            self.assertTrue(f.equals(g[0], verbose=True))
+            
+            g = cfdm.read(tmpfile2)
+            self.assertTrue(len(g) == 1)
+            self.assertTrue(f[:, :5].equals(g[0], verbose=True))
+        #--- End: for
+
+        # A field construct that can't be pickled doesn't prevent
+        # other files from being written
+        bad_field = f.copy()
+        bad_field.set_property('foo', lambda x: x)
+        for processes in (1, 2):
+            results = cfdm.write_files({tmpfile : f,
+                                        tmpfile2: bad_field},
+                                       processes=processes)
+            self.assertTrue(results[tmpfile] is None)
+            self.assertTrue(isinstance(results[tmpfile2], Exception))
+        #--- End: for
+    #--- End: def
+
 #--- End: class
 
 if __name__ == "__main__":
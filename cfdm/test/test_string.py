@@ -26,7 +26,8 @@ class StringTest(unittest.TestCase):
             return
 
         for array in (numpy.ma.array(list('abcdefghij'), dtype='S'),
-                      numpy.ma.array(['a', 'b1', 'c12', 'd123', 'e1234', 'f', 'g', 'h', 'i', 'j'], dtype='S')):
+                      numpy.ma.array(['a', 'b1', 'c12', 'd123', 'e1234', 'f', 'g', 'h', 'i', 'j'], dtype='S'),
+                      numpy.ma.array(['a', 'b1', 'c12', 'd123', 'e1234', 'f', 'g', 'h', 'i', 'j'], dtype='S8')):
 
             # Initialize the field
             tas = cfdm.Field(
@@ -75,6 +76,9 @@ class StringTest(unittest.TestCase):
             aux1 = tas1.constructs.filter_by_identity('long_name=Grid latitude name').value()
             self.assertTrue(aux0.data.shape == array.shape, aux0.data.shape)
             self.assertTrue(aux1.data.shape == array.shape, aux1.data.shape)
+            self.assertTrue((numpy.ma.getmaskarray(aux1.data.array) == array.mask).all())
+            self.assertTrue((aux1.data.array[1:] == array[1:]).all(),
+                            aux1.data.array)
         #--- End: for
     #--- End: def
     